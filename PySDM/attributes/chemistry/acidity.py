@@ -2,7 +2,10 @@
 pH calculated by finding equilibrium hydrogen ion concentration
 """
 
+import numpy as np
+
 from PySDM.attributes.impl import DerivedAttribute, register_attribute
+from PySDM.backends.impl_common.storage_utils import resize
 from PySDM.backends.impl_numba.methods.chemistry_methods import _conc
 from PySDM.dynamics.impl.chemistry_utils import AQUEOUS_COMPOUNDS
 
@@ -17,10 +20,26 @@ class Acidity(DerivedAttribute):
         super().__init__(builder, name="pH", dependencies=self.conc.values())
         self.environment = builder.particulator.environment
         self.cell_id = builder.get_attribute("cell id")
+        self.last_pH_change = None
+        builder.particulator.capacity_observers.append(self)
 
     def allocate(self, idx):
         super().allocate(idx)
         self.data.fill(self.formulae.constants.pH_w)
+        self.last_pH_change = self.particulator.Storage.from_ndarray(
+            np.zeros(self.particulator.n_sd)
+        )
+
+    def reallocate(self):
+        """resizes the per-droplet cache of pH changes used to warm-start the root-finds
+        (a stale entry, e.g., after particle reordering, only results in a wider bracket)
+        """
+        resize(
+            self.last_pH_change,
+            self.particulator.n_sd,
+            self.particulator.Storage,
+            fill_value=0,
+        )
 
     def recalculate(self):
         dynamic = self.particulator.dynamics["AqueousChemistry"]
@@ -37,6 +56,7 @@ class Acidity(DerivedAttribute):
             ),
             do_chemistry_flag=dynamic.do_chemistry_flag,
             pH=self.data,
+            last_pH_change=self.last_pH_change,
             H_min=dynamic.pH_H_min,
             H_max=dynamic.pH_H_max,
             ionic_strength_threshold=dynamic.ionic_strength_threshold,
@@ -6,6 +6,7 @@ cooling rate estimated as the difference in current and previous grid-cell
 
 import numpy as np
 from PySDM.attributes.impl import DerivedAttribute, register_attribute
+from PySDM.backends.impl_common.storage_utils import resize
 
 
 @register_attribute()
@@ -19,6 +20,11 @@ class CoolingRate(DerivedAttribute):
             np.full(builder.particulator.n_sd, np.nan)
         )
         builder.particulator.observers.append(self)
+        builder.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
+        """follows the particle storages in retaining the leading elements"""
+        resize(self.prev_T, self.particulator.n_sd, self.particulator.Storage)
 
     def notify(self):
         """triggers update to ensure recalculation is done before
@@ -11,19 +11,54 @@ class DerivedAttribute(Attribute):
         assert len(dependencies) > 0
         super().__init__(builder, name)
         self.dependencies = dependencies
+        self.dependencies_timestamps = (0,) * len(dependencies)
+        self.valid_length = self.particulator.n_sd
 
     def update(self):
+        fused_derivation = self.particulator.fused_derivation
+        if fused_derivation is not None and fused_derivation.update(self):
+            return
         for dependency in self.dependencies:
             dependency.update()
-        dependencies_timestamp = sum(
-            dependency.timestamp for dependency in self.dependencies
-        )
-        if self.timestamp < dependencies_timestamp:
-            self.timestamp = dependencies_timestamp
+        if self.refresh_timestamps():
             self.recalculate()
 
+    def refresh_timestamps(self):
+        """compares the timestamps of dependencies with the ones recorded at the last
+        recalculation (a per-dependency version vector); if any differs, records them,
+        bumps own timestamp and returns True (i.e., recalculation needed);
+        as recalculations cover only the particles in `idx[:length]`, an increase of
+        the working length (e.g., after a temporary cut during adaptive collision
+        substepping) also triggers recalculation"""
+        timestamps = tuple(dependency.timestamp for dependency in self.dependencies)
+        length = self.valid_length if self.data is None else len(self.data)
+        if timestamps == self.dependencies_timestamps and length <= self.valid_length:
+            self.valid_length = length
+            return False
+        self.dependencies_timestamps = timestamps
+        self.valid_length = length
+        self.timestamp += 1
+        return True
+
     def recalculate(self):
         raise NotImplementedError()
 
+    def elementwise(self):
+        """returns None or, for attributes derived element-wise (each value depending only
+        on the values of dependencies for the same particle), a scalar function of the
+        dependency values followed by `elementwise_args()`, used for fusing derivations
+        in `PySDM.attributes.impl.fused_derivation.FusedDerivation`"""
+        return None
+
+    def elementwise_args(self):
+        return ()
+
+    def validate(self):
+        """called after values were computed by a fused derivation"""
+
+    def invalidate(self):
+        """forces recalculation upon next update (e.g., after a failed validation)"""
+        self.dependencies_timestamps = (-1,) * len(self.dependencies)
+
     def mark_updated(self):
         raise AssertionError()
@@ -0,0 +1,104 @@
+"""
+engine computing chains of element-wise derived attributes in single sweeps over
+ particle data (enabled with `PySDM.builder.Builder.build(fused_derived_attributes=True)`)
+"""
+
+from .derived_attribute import DerivedAttribute
+
+
+class FusedDerivation:
+    """for a requested attribute, the graph of its dependencies is traversed (once)
+    collecting, in topological order, all derived attributes offering an element-wise
+    formulation (see `PySDM.attributes.impl.derived_attribute.DerivedAttribute.elementwise`);
+    the remaining dependencies are treated as inputs; upon each update, the stale ones
+    (judged using per-dependency timestamps) are evaluated with a single backend kernel
+    (compiled once per distinct set of stale attributes) so that, e.g., radius,
+    terminal velocity and Reynolds number are obtained in one pass"""
+
+    def __init__(self, particulator):
+        self.particulator = particulator
+        self.__plans = {}
+        self.__kernels = {}
+
+    @staticmethod
+    def fusible(attribute):
+        return (
+            isinstance(attribute, DerivedAttribute)
+            and attribute.n_vector_components == 0
+            and attribute.elementwise() is not None
+        )
+
+    def update(self, attribute):
+        """brings the attribute (and its fusible ancestors) up to date and returns True,
+        or returns False if the attribute is not fusible"""
+        if attribute not in self.__plans:
+            self.__plans[attribute] = self.__plan(attribute)
+        plan = self.__plans[attribute]
+        if plan is None:
+            return False
+
+        for dependency in plan["inputs"]:
+            dependency.update()
+        stale = tuple(node for node in plan["order"] if node.refresh_timestamps())
+        if len(stale) > 0:
+            try:
+                kernel, inputs = self.__kernel(stale)
+                self.particulator.backend.fused_elementwise(
+                    kernel,
+                    [node.data for node in stale],
+                    [dependency.get() for dependency in inputs],
+                    [node.elementwise_args() for node in stale],
+                )
+                for node in stale:
+                    node.validate()
+            except Exception:
+                # timestamps were refreshed before the sweep; without invalidation,
+                # (e.g., NaN) values from a failed sweep would be returned by get()
+                for node in stale:
+                    node.invalidate()
+                raise
+        return True
+
+    def __plan(self, attribute):
+        if not self.fusible(attribute):
+            return None
+        plan = {"order": [], "inputs": []}
+
+        def visit(node):
+            if node in plan["order"]:
+                return
+            for dependency in node.dependencies:
+                if self.fusible(dependency):
+                    visit(dependency)
+                elif dependency not in plan["inputs"]:
+                    plan["inputs"].append(dependency)
+            plan["order"].append(node)
+
+        visit(attribute)
+        return plan
+
+    def __kernel(self, stale):
+        if stale not in self.__kernels:
+            inputs = []
+            expressions = []
+            for node in stale:
+                operands = []
+                for dependency in node.dependencies:
+                    if dependency in stale:
+                        operands.append(stale.index(dependency))
+                    else:
+                        if dependency not in inputs:
+                            inputs.append(dependency)
+                        operands.append(-1 - inputs.index(dependency))
+                expressions.append(
+                    (
+                        node.elementwise(),
+                        tuple(operands),
+                        len(node.elementwise_args()),
+                    )
+                )
+            self.__kernels[stale] = (
+                self.particulator.backend.make_fused_elementwise(tuple(expressions)),
+                tuple(inputs),
+            )
+        return self.__kernels[stale]
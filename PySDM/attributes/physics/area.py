@@ -2,6 +2,8 @@
 particle wet radius (calculated from the volume)
 """
 
+import numpy as np
+
 from PySDM.attributes.impl import DerivedAttribute, register_attribute
 
 
@@ -16,3 +18,17 @@ class Area(DerivedAttribute):
         self.data.product(self.volume.get(), 1 / self.formulae.constants.PI_4_3)
         self.data **= 2 / 3
         self.data *= self.formulae.constants.PI_4_3 * 3
+
+    @staticmethod
+    def _elementwise(volume, factor, pi_4_3_times_3):
+        volume = volume * factor
+        return np.sign(volume) * np.abs(volume) ** (2 / 3) * pi_4_3_times_3
+
+    def elementwise(self):
+        return self._elementwise
+
+    def elementwise_args(self):
+        return (
+            1 / self.formulae.constants.PI_4_3,
+            self.formulae.constants.PI_4_3 * 3,
+        )
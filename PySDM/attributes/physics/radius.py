@@ -2,6 +2,8 @@
 particle wet radius (calculated from the volume)
 """
 
+import numpy as np
+
 from PySDM.attributes.impl import DerivedAttribute, register_attribute
 
 
@@ -16,6 +18,17 @@ class Radius(DerivedAttribute):
         self.data.product(self.volume.get(), 1 / self.formulae.constants.PI_4_3)
         self.data **= 1 / 3
 
+    @staticmethod
+    def _elementwise(volume, factor):
+        volume = volume * factor
+        return np.sign(volume) * np.abs(volume) ** (1 / 3)
+
+    def elementwise(self):
+        return self._elementwise
+
+    def elementwise_args(self):
+        return (1 / self.formulae.constants.PI_4_3,)
+
 
 @register_attribute()
 class SquareRootOfRadius(DerivedAttribute):
@@ -31,3 +44,10 @@ class SquareRootOfRadius(DerivedAttribute):
     def recalculate(self):
         self.data.fill(self.radius.data)
         self.data **= 0.5
+
+    @staticmethod
+    def _elementwise(radius):
+        return np.sign(radius) * np.abs(radius) ** 0.5
+
+    def elementwise(self):
+        return self._elementwise
@@ -2,6 +2,8 @@
 particle Reynolds number
 """
 
+from functools import cached_property
+
 from ..impl import DerivedAttribute, register_attribute
 
 
@@ -30,3 +32,26 @@ class ReynoldsNumber(DerivedAttribute):
             radius=self.radius.data,
             velocity_wrt_air=self.velocity_wrt_air.data,
         )
+
+    @cached_property
+    def _elementwise(self):
+        reynolds_number = self.formulae.particle_shape_and_density.reynolds_number
+
+        def elementwise(radius, velocity_wrt_air, cell_id, dynamic_viscosity, density):
+            return reynolds_number(
+                radius=radius,
+                velocity_wrt_air=velocity_wrt_air,
+                dynamic_viscosity=dynamic_viscosity[cell_id],
+                density=density[cell_id],
+            )
+
+        return elementwise
+
+    def elementwise(self):
+        return self._elementwise
+
+    def elementwise_args(self):
+        return (
+            self.particulator.environment["air dynamic viscosity"],
+            self.particulator.environment["air density"],
+        )
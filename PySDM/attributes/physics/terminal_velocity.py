@@ -22,3 +22,12 @@ class TerminalVelocity(DerivedAttribute):
 
     def recalculate(self):
         self.approximation(self.data, self.radius.get())
+
+    def elementwise(self):
+        return getattr(self.approximation, "elementwise", None)
+
+    def elementwise_args(self):
+        return self.approximation.elementwise_args()
+
+    def validate(self):
+        self.approximation.validate(self.radius.data)
@@ -15,3 +15,6 @@ class Volume(DerivedAttribute):
 
     def recalculate(self):
         self.particulator.backend.volume_of_water_mass(self.data, self.water_mass.get())
+
+    def elementwise(self):
+        return self.formulae.particle_shape_and_density.mass_to_volume
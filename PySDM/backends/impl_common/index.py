@@ -38,11 +38,22 @@ def make_Index(backend):
         def sort_by_key(self, keys):
             backend.sort_by_key(self, keys)
 
-        def shuffle(self, temporary, parts=None):
+        def shuffle(self, temporary, parts=None, n_draws=None):
+            """with `n_draws` given, only a partial Fisher-Yates shuffle is performed
+            making `idx[:n_draws]` a random sample (in random order) of all elements,
+            and requiring only `n_draws` random numbers"""
             if parts is None:
-                backend.shuffle_global(
-                    idx=self.data, length=self.length, u01=temporary.data
-                )
+                if n_draws is None:
+                    backend.shuffle_global(
+                        idx=self.data, length=self.length, u01=temporary.data
+                    )
+                else:
+                    backend.shuffle_partial(
+                        idx=self.data,
+                        length=self.length,
+                        u01=temporary.data,
+                        n_draws=n_draws,
+                    )
             else:
                 backend.shuffle_local(
                     idx=self.data, u01=temporary.data, cell_start=parts.data
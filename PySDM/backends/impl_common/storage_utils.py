@@ -6,6 +6,8 @@ from abc import abstractmethod
 from collections import namedtuple
 from typing import Type
 
+import numpy as np
+
 
 class StorageSignature(namedtuple("StorageSignature", ("data", "shape", "dtype"))):
     """groups items defining a storage"""
@@ -77,3 +79,19 @@ def get_data_from_ndarray(array, storage_class: Type[StorageBase], copy_fun):
 
 def empty(shape, dtype, storage_class: Type[StorageBase]):
     return storage_class(storage_class._get_empty_data(shape, dtype))
+
+
+def resize(storage, length: int, storage_class: Type[StorageBase], fill_value=None):
+    """reallocates `storage` in place (i.e., retaining the object identity so that
+    all references to it remain valid) to `length` elements along the last axis,
+    keeping the leading elements and filling the appended ones with `fill_value`,
+    by default NaN (floats) or zeros (integers and booleans)"""
+    array = storage_class.to_ndarray(storage)
+    if fill_value is None:
+        fill_value = np.nan if np.issubdtype(array.dtype, np.floating) else 0
+    resized = np.full(array.shape[:-1] + (length,), fill_value, dtype=array.dtype)
+    n_kept = min(length, array.shape[-1])
+    resized[..., :n_kept] = array[..., :n_kept]
+    signature = storage_class._get_data_from_ndarray(resized)
+    storage.data = signature.data
+    storage.shape = signature.shape
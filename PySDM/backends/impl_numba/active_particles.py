@@ -0,0 +1,29 @@
+"""
+helpers for restricting per-particle CPU kernels to the super-droplets referenced
+ in `idx[:length]` (i.e., skipping the ones removed through precipitation or collisions)
+"""
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_numba import conf
+
+
+def active_index(storage):
+    """returns the index data and its (working) length for
+    `PySDM.backends.impl_common.indexed_storage` instances, or `(None, len(storage))`
+    for storages not bound to an index (in which case all elements are processed)"""
+    idx = getattr(storage, "idx", None)
+    if idx is None:
+        return None, len(storage)
+    return idx.data, len(idx)
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "parallel": False, "inline": "always"})
+def particle_id(idx, k):
+    """maps the k-th active particle onto a storage element (for `idx=None`,
+    the branch using `idx` is pruned at compile time); the index is returned as
+    a signed integer in both cases so that it unifies with `prange` loop indices"""
+    if idx is None:
+        return np.int64(k)
+    return np.int64(idx[k])
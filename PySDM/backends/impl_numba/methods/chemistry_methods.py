@@ -3,13 +3,19 @@ CPU implementation of backend methods for aqueous chemistry
 """
 
 from collections import namedtuple
+from functools import cached_property
 
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 from PySDM.backends.impl_numba import conf
-from PySDM.backends.impl_numba.toms748 import toms748_solve
+from PySDM.backends.impl_numba.atomic_operations import atomic_add
+from PySDM.backends.impl_numba.toms748 import (
+    BATCH_SIZE,
+    toms748_batch_workspace,
+    toms748_solve_batch,
+)
 from PySDM.dynamics.impl.chemistry_utils import (
     DIFFUSION_CONST,
     DISSOCIATION_FACTORS,
@@ -28,6 +34,8 @@ _MAX_ITER_DEFAULT = 32
 _REALY_CLOSE_THRESHOLD = 1e-6
 _QUITE_CLOSE_THRESHOLD = 1
 _QUITE_CLOSE_MULTIPLIER = 2
+_WARM_START_MULTIPLIER = 2
+_WARM_START_MIN_PH_CHANGE = 1e-3
 
 _K = namedtuple("_K", ("NH3", "SO2", "HSO3", "HSO4", "HCO3", "CO2", "HNO3"))
 _conc = namedtuple("_conc", ("N_mIII", "N_V", "C_IV", "S_IV", "S_VI"))
@@ -45,8 +53,8 @@ class ChemistryMethods(BackendMethods):
         self,
         *,
         n_cell,
-        n_threads,
         cell_order,
+        dynamic_schedule,
         cell_start_arg,
         idx,
         do_chemistry_flag,
@@ -62,98 +70,141 @@ class ChemistryMethods(BackendMethods):
         droplet_volume,
         multiplicity,
     ):
-        assert n_cell == 1
-        assert n_threads == 1
-        for i in range(n_cell):
-            cell_id = cell_order[i]
-
-            cell_start = cell_start_arg[cell_id]
-            cell_end = cell_start_arg[cell_id + 1]
-            n_sd_in_cell = cell_end - cell_start
-            if n_sd_in_cell == 0:
-                continue
-
-            super_droplet_ids = numba.typed.List()
-            for sd_id in idx[cell_start:cell_end]:
-                if do_chemistry_flag.data[sd_id]:
-                    super_droplet_ids.append(sd_id)
-
-            if len(super_droplet_ids) == 0:
-                return
-
-            for key, compound in GASEOUS_COMPOUNDS.items():
-                ChemistryMethods.dissolution_body(
-                    super_droplet_ids=super_droplet_ids,
-                    mole_amounts=mole_amounts[key].data,
-                    env_mixing_ratio=env_mixing_ratio[compound][cell_id : cell_id + 1],
-                    henrysConstant=self.HENRY_CONST.HENRY_CONST[compound].at(
-                        env_T[cell_id]
-                    ),
-                    env_p=env_p[cell_id],
-                    env_T=env_T[cell_id],
-                    env_rho_d=env_rho_d[cell_id],
-                    timestep=timestep,
-                    dv=dv,
-                    droplet_volume=droplet_volume.data,
-                    multiplicity=multiplicity.data,
-                    system_type=system_type,
-                    specific_gravity=self.specific_gravities[compound],
-                    alpha=MASS_ACCOMMODATION_COEFFICIENTS[compound],
-                    diffusion_const=DIFFUSION_CONST[compound],
-                    dissociation_factor=dissociation_factors[compound].data,
-                    radius=self.formulae.trivia.radius,
-                    const=self.formulae.constants,
-                )
-
-    @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-    def dissolution_body(  # pylint: disable=too-many-locals
-        *,
-        super_droplet_ids,
-        mole_amounts,
-        env_mixing_ratio,
-        henrysConstant,
-        env_p,
-        env_T,
-        env_rho_d,
-        timestep,
-        dv,
-        droplet_volume,
-        multiplicity,
-        system_type,
-        specific_gravity,
-        alpha,
-        diffusion_const,
-        dissociation_factor,
-        radius,
-        const,
-    ):
-        mole_amount_taken = 0
-        for i in super_droplet_ids:
-            Mc = specific_gravity * const.Md
-            Rc = const.R_str / Mc
-            cinf = env_p / env_T / (const.Rd / env_mixing_ratio[0] + Rc) / Mc
-            r_w = radius(volume=droplet_volume[i])
-            v_avg = np.sqrt(8 * const.R_str * env_T / (np.pi * Mc))
-            dt_over_scale = timestep / (
-                4 * r_w / (3 * v_avg * alpha) + r_w**2 / (3 * diffusion_const)
-            )
-            A_old = mole_amounts[i] / droplet_volume[i]
-            H_eff = henrysConstant * dissociation_factor[i]
-            A_new = (A_old + dt_over_scale * cinf) / (
-                1 + dt_over_scale / H_eff / const.R_str / env_T
-            )
-            new_mole_amount_per_real_droplet = A_new * droplet_volume[i]
-            assert new_mole_amount_per_real_droplet >= 0
+        """cells are processed in parallel, either statically assigned to threads
+        in the round-robin fashion following `cell_order`, or (`dynamic_schedule`)
+        picked by threads in chunks from a shared work queue, as in condensation"""
+        n_threads = min(numba.get_num_threads(), n_cell)
+        henry_consts = tuple(
+            self.HENRY_CONST.HENRY_CONST[compound]
+            for compound in GASEOUS_COMPOUNDS.values()
+        )
+        self._dissolution_body(
+            n_threads=n_threads,
+            n_cell=n_cell,
+            cell_order=cell_order,
+            cells_per_chunk=(
+                max(1, n_cell // (16 * n_threads)) if dynamic_schedule else 0
+            ),
+            cell_start_arg=cell_start_arg.data,
+            idx=idx.data,
+            do_chemistry_flag=do_chemistry_flag.data,
+            mole_amounts=tuple(mole_amounts[key].data for key in GASEOUS_COMPOUNDS),
+            env_mixing_ratio=tuple(
+                env_mixing_ratio[compound] for compound in GASEOUS_COMPOUNDS.values()
+            ),
+            henry_K=np.asarray([henry.K for henry in henry_consts]),
+            henry_dH=np.asarray([henry.dH for henry in henry_consts]),
+            henry_T0=np.asarray([henry.T0 for henry in henry_consts]),
+            env_p=env_p.data,
+            env_T=env_T.data,
+            env_rho_d=env_rho_d.data,
+            timestep=timestep,
+            dv=dv,
+            droplet_volume=droplet_volume.data,
+            multiplicity=multiplicity.data,
+            closed_system=system_type == "closed",
+            specific_gravity=np.asarray(
+                [
+                    self.specific_gravities[compound]
+                    for compound in GASEOUS_COMPOUNDS.values()
+                ]
+            ),
+            alpha=np.asarray(
+                [
+                    MASS_ACCOMMODATION_COEFFICIENTS[compound]
+                    for compound in GASEOUS_COMPOUNDS.values()
+                ]
+            ),
+            diffusion_const=np.asarray(
+                [DIFFUSION_CONST[compound] for compound in GASEOUS_COMPOUNDS.values()]
+            ),
+            dissociation_factor=tuple(
+                dissociation_factors[compound].data
+                for compound in GASEOUS_COMPOUNDS.values()
+            ),
+        )
 
-            mole_amount_taken += multiplicity[i] * (
-                new_mole_amount_per_real_droplet - mole_amounts[i]
-            )
-            mole_amounts[i] = new_mole_amount_per_real_droplet
-        delta_mr = mole_amount_taken * specific_gravity * const.Md / (dv * env_rho_d)
-        assert delta_mr <= env_mixing_ratio
-        if system_type == "closed":
-            env_mixing_ratio -= delta_mr
+    @cached_property
+    def _dissolution_body(self):
+        vant_hoff = self.formulae.trivia.vant_hoff
+        radius = self.formulae.trivia.radius
+        const = self.formulae.constants
+
+        @numba.njit(**{**self.default_jit_flags, "cache": False})
+        def body(  # pylint: disable=too-many-arguments,too-many-locals
+            *,
+            n_threads,
+            n_cell,
+            cell_order,
+            cells_per_chunk,
+            cell_start_arg,
+            idx,
+            do_chemistry_flag,
+            mole_amounts,
+            env_mixing_ratio,
+            henry_K,
+            henry_dH,
+            henry_T0,
+            env_p,
+            env_T,
+            env_rho_d,
+            timestep,
+            dv,
+            droplet_volume,
+            multiplicity,
+            closed_system,
+            specific_gravity,
+            alpha,
+            diffusion_const,
+            dissociation_factor,
+        ):
+            next_chunk = np.zeros(1, dtype=np.int64)
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                i = np.int64(thread_id if cells_per_chunk == 0 else 0)
+                chunk_end = np.int64(0)
+                while True:
+                    if cells_per_chunk != 0 and i == chunk_end:
+                        i = np.int64(atomic_add(next_chunk, 0, 1) * cells_per_chunk)
+                        chunk_end = np.int64(min(i + cells_per_chunk, n_cell))
+                    if i >= n_cell:
+                        break
+                    cell_id = cell_order[i]
+                    i += n_threads if cells_per_chunk == 0 else 1
+                    cell_idx = idx[
+                        cell_start_arg[cell_id] : cell_start_arg[cell_id + 1]
+                    ]
+                    for c in range(  # pylint: disable=consider-using-enumerate
+                        len(mole_amounts)
+                    ):
+                        delta_mr = dissolve_in_cell(
+                            cell_idx=cell_idx,
+                            do_chemistry_flag=do_chemistry_flag,
+                            mole_amounts=mole_amounts[c],
+                            env_mixing_ratio=env_mixing_ratio[c][cell_id],
+                            henrysConstant=vant_hoff(
+                                henry_K[c],
+                                henry_dH[c],
+                                env_T[cell_id],
+                                T_0=henry_T0[c],
+                            ),
+                            env_p=env_p[cell_id],
+                            env_T=env_T[cell_id],
+                            env_rho_d=env_rho_d[cell_id],
+                            timestep=timestep,
+                            dv=dv,
+                            droplet_volume=droplet_volume,
+                            multiplicity=multiplicity,
+                            specific_gravity=specific_gravity[c],
+                            alpha=alpha[c],
+                            diffusion_const=diffusion_const[c],
+                            dissociation_factor=dissociation_factor[c],
+                            radius=radius,
+                            const=const,
+                        )
+                        if closed_system:
+                            env_mixing_ratio[c][cell_id] -= delta_mr
+
+        return body
 
     def oxidation(  # pylint: disable=too-many-locals
         self,
@@ -312,12 +363,13 @@ class ChemistryMethods(BackendMethods):
         conc,
         do_chemistry_flag,
         pH,
+        last_pH_change,
         H_min,
         H_max,
         ionic_strength_threshold,
         rtol,
     ):
-        ChemistryMethods.equilibrate_H_body(
+        self._equilibrate_H_body(
             within_tolerance=self.formulae.trivia.within_tolerance,
             pH2H=self.formulae.trivia.pH2H,
             H2pH=self.formulae.trivia.H2pH,
@@ -341,6 +393,7 @@ class ChemistryMethods(BackendMethods):
             # output
             do_chemistry_flag=do_chemistry_flag.data,
             pH=pH.data,
+            last_pH_change=last_pH_change.data,
             # params
             H_min=H_min,
             H_max=H_max,
@@ -348,9 +401,16 @@ class ChemistryMethods(BackendMethods):
             rtol=rtol,
         )
 
+    @cached_property
+    def _equilibrate_H_body(self):
+        return numba.njit(**{**self.default_jit_flags, "cache": False})(
+            ChemistryMethods.equilibrate_H_body.py_func
+        )
+
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
-    def equilibrate_H_body(  # pylint: disable=too-many-arguments,too-many-locals
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
+    def equilibrate_H_body(
         within_tolerance,
         pH2H,
         H2pH,
@@ -359,32 +419,27 @@ class ChemistryMethods(BackendMethods):
         K,
         do_chemistry_flag,
         pH,
+        last_pH_change,
         # params
         H_min,
         H_max,
         ionic_strength_threshold,
         rtol,
     ):
-        for i, pH_i in enumerate(pH):
-            cid = cell_id[i]
-            args = (
-                _conc(
-                    N_mIII=conc.N_mIII[i],
-                    N_V=conc.N_V[i],
-                    C_IV=conc.C_IV[i],
-                    S_IV=conc.S_IV[i],
-                    S_VI=conc.S_VI[i],
-                ),
-                _K(
-                    NH3=K.NH3[cid],
-                    SO2=K.SO2[cid],
-                    HSO3=K.HSO3[cid],
-                    HSO4=K.HSO4[cid],
-                    HCO3=K.HCO3[cid],
-                    CO2=K.CO2[cid],
-                    HNO3=K.HNO3[cid],
-                ),
-            )
+        """the root-find for each droplet is bracketed around its current pH, first
+        using the (scaled) pH change from the previous call cached in `last_pH_change`
+        (zero meaning no cached value - NaN tests are unreliable under fastmath), then
+        by a fixed factor, finally falling back to the [H_min, H_max] range; the
+        brackets are then solved for in batches (see `toms748_solve_batch`); the
+        serial (as-compiled) variant is used in tests, while the backend uses
+        a parallel one"""
+        n = len(pH)
+        brackets = np.empty((4, n))
+        max_iter = np.empty(n, dtype=np.int64)
+        to_solve = np.zeros(n, dtype=np.bool_)
+        for i in numba.prange(n):  # pylint: disable=not-an-iterable
+            pH_i = pH[i]
+            args = _droplet_args(i, cell_id, conc, K)
             a = pH2H(pH_i)
             fa = acidity_minfun(a, *args)
             if abs(fa) < _REALY_CLOSE_THRESHOLD:
@@ -392,43 +447,161 @@ class ChemistryMethods(BackendMethods):
             b = np.nan
             fb = np.nan
             use_default_range = False
-            if abs(fa) < _QUITE_CLOSE_THRESHOLD:
-                b = a * _QUITE_CLOSE_MULTIPLIER
-                fb = acidity_minfun(b, *args)
-                if fa * fb > 0:
-                    b = a
-                    fb = fa
-                    a = b / _QUITE_CLOSE_MULTIPLIER / _QUITE_CLOSE_MULTIPLIER
-                    fa = acidity_minfun(a, *args)
+            warm_start = False
+            if last_pH_change[i] > 0:
+                pH_change = _WARM_START_MULTIPLIER * last_pH_change[i]
+                c = pH2H(pH_i + pH_change if fa > 0 else pH_i - pH_change)
+                fc = acidity_minfun(c, *args)
+                if fa * fc < 0:
+                    warm_start = True
+                    if c < a:
+                        b = a
+                        fb = fa
+                        a = c
+                        fa = fc
+                    else:
+                        b = c
+                        fb = fc
+            if not warm_start:
+                if abs(fa) < _QUITE_CLOSE_THRESHOLD:
+                    b = a * _QUITE_CLOSE_MULTIPLIER
+                    fb = acidity_minfun(b, *args)
                     if fa * fb > 0:
-                        use_default_range = True
-            else:
-                use_default_range = True
+                        b = a
+                        fb = fa
+                        a = b / _QUITE_CLOSE_MULTIPLIER / _QUITE_CLOSE_MULTIPLIER
+                        fa = acidity_minfun(a, *args)
+                        if fa * fb > 0:
+                            use_default_range = True
+                else:
+                    use_default_range = True
             if use_default_range:
                 a = H_min
                 b = H_max
                 fa = acidity_minfun(a, *args)
                 fb = acidity_minfun(b, *args)
-                max_iter = _MAX_ITER_DEFAULT
+                max_iter[i] = _MAX_ITER_DEFAULT
+            elif warm_start:
+                max_iter[i] = _MAX_ITER_DEFAULT
             else:
-                max_iter = _MAX_ITER_QUITE_CLOSE
-            H, _iters_taken = toms748_solve(
-                acidity_minfun,
-                args,
-                a,
-                b,
-                fa,
-                fb,
-                rtol=rtol,
-                max_iter=max_iter,
-                within_tolerance=within_tolerance,
+                max_iter[i] = _MAX_ITER_QUITE_CLOSE
+            brackets[0, i] = a
+            brackets[1, i] = b
+            brackets[2, i] = fa
+            brackets[3, i] = fb
+            to_solve[i] = True
+
+        problems = np.flatnonzero(to_solve)
+        H = np.empty(n)
+        iters_taken = np.empty(n, dtype=np.int64)
+        workspace = toms748_batch_workspace(n)
+        n_batches = (len(problems) + BATCH_SIZE - 1) // BATCH_SIZE
+        for batch in numba.prange(n_batches):  # pylint: disable=not-an-iterable
+            toms748_solve_batch(
+                _acidity_minfun_batch,
+                (cell_id, conc, K),
+                problems[batch * BATCH_SIZE : (batch + 1) * BATCH_SIZE],
+                brackets[0],
+                brackets[1],
+                brackets[2],
+                brackets[3],
+                rtol,
+                max_iter,
+                within_tolerance,
+                H,
+                iters_taken,
+                workspace,
+            )
+
+        for k in numba.prange(len(problems)):  # pylint: disable=not-an-iterable
+            i = problems[k]
+            assert iters_taken[i] != max_iter[i]
+            pH_i = pH[i]
+            pH[i] = H2pH(H[i])
+            last_pH_change[i] = max(abs(pH[i] - pH_i), _WARM_START_MIN_PH_CHANGE)
+            ionic_strength = calc_ionic_strength(
+                H[i], *_droplet_args(i, cell_id, conc, K)
             )
-            assert _iters_taken != max_iter
-            pH[i] = H2pH(H)
-            ionic_strength = calc_ionic_strength(H, *args)
             do_chemistry_flag[i] = ionic_strength <= ionic_strength_threshold
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def dissolve_in_cell(  # pylint: disable=too-many-arguments,too-many-locals
+    *,
+    cell_idx,
+    do_chemistry_flag,
+    mole_amounts,
+    env_mixing_ratio,
+    henrysConstant,
+    env_p,
+    env_T,
+    env_rho_d,
+    timestep,
+    dv,
+    droplet_volume,
+    multiplicity,
+    specific_gravity,
+    alpha,
+    diffusion_const,
+    dissociation_factor,
+    radius,
+    const,
+):
+    """updates mole amounts of a compound in droplets of a single cell returning
+    the resultant change in the ambient mixing ratio of the compound"""
+    mole_amount_taken = 0
+    for i in cell_idx:
+        if not do_chemistry_flag[i]:
+            continue
+        Mc = specific_gravity * const.Md
+        Rc = const.R_str / Mc
+        cinf = env_p / env_T / (const.Rd / env_mixing_ratio + Rc) / Mc
+        r_w = radius(volume=droplet_volume[i])
+        v_avg = np.sqrt(8 * const.R_str * env_T / (np.pi * Mc))
+        dt_over_scale = timestep / (
+            4 * r_w / (3 * v_avg * alpha) + r_w**2 / (3 * diffusion_const)
+        )
+        A_old = mole_amounts[i] / droplet_volume[i]
+        H_eff = henrysConstant * dissociation_factor[i]
+        A_new = (A_old + dt_over_scale * cinf) / (
+            1 + dt_over_scale / H_eff / const.R_str / env_T
+        )
+        new_mole_amount_per_real_droplet = A_new * droplet_volume[i]
+        assert new_mole_amount_per_real_droplet >= 0
+
+        mole_amount_taken += multiplicity[i] * (
+            new_mole_amount_per_real_droplet - mole_amounts[i]
+        )
+        mole_amounts[i] = new_mole_amount_per_real_droplet
+    delta_mr = mole_amount_taken * specific_gravity * const.Md / (dv * env_rho_d)
+    assert delta_mr <= env_mixing_ratio
+    return delta_mr
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def _droplet_args(i, cell_id, conc, K):
+    """concentrations in the `i`-th droplet and equilibrium constants in its cell"""
+    cid = cell_id[i]
+    return (
+        _conc(
+            N_mIII=conc.N_mIII[i],
+            N_V=conc.N_V[i],
+            C_IV=conc.C_IV[i],
+            S_IV=conc.S_IV[i],
+            S_VI=conc.S_VI[i],
+        ),
+        _K(
+            NH3=K.NH3[cid],
+            SO2=K.SO2[cid],
+            HSO3=K.HSO3[cid],
+            HSO4=K.HSO4[cid],
+            HCO3=K.HCO3[cid],
+            CO2=K.CO2[cid],
+            HNO3=K.HNO3[cid],
+        ),
+    )
+
+
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def calc_ionic_strength(H, conc, K):
     # Directly adapted
@@ -474,3 +647,8 @@ def acidity_minfun(H, conc, K):
     )
     zero = H + ammonia - (nitric + sulfous + water + sulfuric + carbonic)
     return zero
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def _acidity_minfun_batch(H, i, cell_id, conc, K):
+    return acidity_minfun(H, *_droplet_args(i, cell_id, conc, K))
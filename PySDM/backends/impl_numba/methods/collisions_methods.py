@@ -12,6 +12,8 @@ from PySDM.backends.impl_numba.atomic_operations import atomic_add
 from PySDM.backends.impl_numba.storage import Storage
 from PySDM.backends.impl_numba.warnings import warn
 
+# pylint: disable=too-many-lines
+
 
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def pair_indices(i, idx, is_first_in_pair, prob_like):
@@ -42,23 +44,82 @@ def flag_zero_multiplicity(j, k, multiplicity, healthy):
 
 
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-def coalesce(  # pylint: disable=too-many-arguments
-    i, j, k, cid, multiplicity, gamma, attributes, coalescence_rate
+def coalesce_pair(  # pylint: disable=too-many-arguments
+    g, j, k, cid, multiplicity, attributes, coalescence_rate
 ):
-    atomic_add(coalescence_rate, cid, gamma[i] * multiplicity[k])
-    new_n = multiplicity[j] - gamma[i] * multiplicity[k]
+    atomic_add(coalescence_rate, cid, g * multiplicity[k])
+    new_n = multiplicity[j] - g * multiplicity[k]
     if new_n > 0:
         multiplicity[j] = new_n
         for a in range(len(attributes)):
-            attributes[a, k] += gamma[i] * attributes[a, j]
+            attributes[a, k] += g * attributes[a, j]
     else:  # new_n == 0
         multiplicity[j] = multiplicity[k] // 2
         multiplicity[k] = multiplicity[k] - multiplicity[j]
         for a in range(len(attributes)):
-            attributes[a, j] = gamma[i] * attributes[a, j] + attributes[a, k]
+            attributes[a, j] = g * attributes[a, j] + attributes[a, k]
             attributes[a, k] = attributes[a, j]
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def coalesce(  # pylint: disable=too-many-arguments
+    i, j, k, cid, multiplicity, gamma, attributes, coalescence_rate
+):
+    coalesce_pair(gamma[i], j, k, cid, multiplicity, attributes, coalescence_rate)
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def parameterized_collection_efficiency(  # pylint: disable=too-many-locals
+    params, radius_1, radius_2, unit
+):
+    """collection efficiency of a pair of droplets using
+    [Berry 1967](https://doi.org/10.1175/1520-0469(1967)024%3C0688:CDGBC%3E2.0.CO;2)
+    parameterisation (returns zero where undefined)"""
+    A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
+    if radius_1 > radius_2:
+        r = radius_1 / unit
+        r_s = radius_2 / unit
+    else:
+        r = radius_2 / unit
+        r_s = radius_1 / unit
+    p = r_s / r
+    if p not in (0, 1):
+        G = (G1 / r) ** Mg + G2 + G3 * r
+        Gp = (1 - p) ** G
+        if Gp != 0:
+            D = D1 / r**D2
+            E = E1 / r**E2
+            F = (F1 / r) ** Mf + F2
+            return max(0, A + B * p + D / p**F + E / Gp)
+    return 0.0
+
+
+FUSED_COLLISION_KERNELS = ("Golovin", "ConstantK", "Geometric", "Parameterized")
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def fused_collision_kernel(  # pylint: disable=too-many-arguments
+    kernel, params, x, v, j, k
+):
+    """value of one of `FUSED_COLLISION_KERNELS` for droplets `j` and `k`,
+    evaluated with the same sequence of operations as the kernel classes do"""
+    if kernel == 0:
+        return (x[j] + x[k]) * params[0]
+    if kernel == 1:
+        return params[0]
+    distance = np.abs(v[j] - v[k])
+    if kernel == 2:
+        return (x[j] + x[k]) ** 2 * params[0] * distance
+    efficiency = parameterized_collection_efficiency(
+        (params[0], params[1], params[2], params[3], params[4], params[5], params[6])
+        + (params[7], params[8], params[9], params[10], params[11], params[12]),
+        x[j],
+        x[k],
+        params[13],
+    )
+    return efficiency**2 * np.pi * max(x[j], x[k]) ** 2 * distance
+
+
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def compute_transfer_multiplicities(
     gamma, j, k, multiplicity, particle_mass, fragment_mass_i, max_multiplicity
@@ -327,6 +388,89 @@ class CollisionsMethods(BackendMethods):
     def adaptive_sdm_end(self, dt_left, cell_start):
         return self._adaptive_sdm_end_body(dt_left.data, len(dt_left), cell_start.data)
 
+    @cached_property
+    def _adaptive_sdm_schedule_body(self):
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def precedes(cell_a, cell_b, dt_left):
+            return dt_left[cell_a] > dt_left[cell_b] or (
+                dt_left[cell_a] == dt_left[cell_b] and cell_a > cell_b
+            )
+
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def sift_down(cells, root, end, dt_left):
+            while True:
+                child = 2 * root + 1
+                if child >= end:
+                    break
+                if child + 1 < end and precedes(
+                    cells[child], cells[child + 1], dt_left
+                ):
+                    child += 1
+                if not precedes(cells[root], cells[child], dt_left):
+                    break
+                cells[root], cells[child] = cells[child], cells[root]
+                root = child
+
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def heapsort(cells, n, dt_left):
+            for root in range(n // 2 - 1, -1, -1):
+                sift_down(cells, root, n, dt_left)
+            for end in range(n - 1, 0, -1):
+                cells[0], cells[end] = cells[end], cells[0]
+                sift_down(cells, 0, end, dt_left)
+
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def body(cell_idx, dt_left, active_cells, removed_cells, n_active):
+            """orders cells as `cell_idx.sort_by_key(dt_left)` would (i.e., by decreasing
+            `dt_left`, ties in decreasing cell index order) touching only the cells that
+            were active in the previous substep: `active_cells[:n_active]` is compacted
+            and heapsorted in place (the order being total, sort stability is
+            irrelevant), and the cells that have just finished (sorted likewise) are
+            merged into the tail of `cell_idx` - all without temporary allocations"""
+            n_cell = len(cell_idx)
+            n_still_active = 0
+            n_removed = 0
+            for i in range(n_active):
+                cell = active_cells[i]
+                if dt_left[cell] == 0:
+                    removed_cells[n_removed] = cell
+                    n_removed += 1
+                else:
+                    active_cells[n_still_active] = cell
+                    n_still_active += 1
+
+            heapsort(active_cells, n_still_active, dt_left)
+            cell_idx[:n_still_active] = active_cells[:n_still_active]
+
+            # finished cells (all with zero dt_left) into decreasing cell index order
+            heapsort(removed_cells, n_removed, dt_left)
+
+            write = n_still_active
+            read = n_active
+            j = 0
+            while j < n_removed:
+                if read < n_cell and cell_idx[read] > removed_cells[j]:
+                    cell_idx[write] = cell_idx[read]
+                    read += 1
+                else:
+                    cell_idx[write] = removed_cells[j]
+                    j += 1
+                write += 1
+            return n_still_active
+
+        return body
+
+    def adaptive_sdm_schedule(
+        self, *, cell_idx, dt_left, active_cells, removed_cells, n_active
+    ):
+        return self._adaptive_sdm_schedule_body(
+            cell_idx.data,
+            dt_left.data,
+            active_cells.data,
+            removed_cells.data,
+            n_active,
+        )
+
     @cached_property
     def _scale_prob_for_adaptive_sdm_gamma_body(self):
         @numba.njit(**self.default_jit_flags)
@@ -584,6 +728,161 @@ class CollisionsMethods(BackendMethods):
             out.data,
         )
 
+    @cached_property
+    def _fused_collision_coalescence_body(self):
+        @numba.njit(**self.default_jit_flags)
+        # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        def body(
+            *,
+            kernel,
+            kernel_params,
+            kernel_x,
+            kernel_v,
+            multiplicity,
+            idx,
+            attributes,
+            healthy,
+            cell_id,
+            cell_start,
+            rand,
+            dv,
+            dt,
+            adaptive,
+            n_substeps,
+            dt_left,
+            dt_range,
+            dt_todo,
+            stats_n_substep,
+            stats_dt_min,
+            collision_rate,
+            collision_rate_deficit,
+            coalescence_rate,
+        ):
+            """pairing, probability, (adaptive) timestep, gamma and coalescence
+            in one pass over the pairs of each cell (with the same operation order
+            as in the composed path, hence with the same results);
+            `idx` is expected to be grouped by cell (as after the croupier)"""
+            if adaptive:
+                for cid in numba.prange(  # pylint: disable=not-an-iterable
+                    len(dt_todo)
+                ):
+                    dt_todo[cid] = min(dt_left[cid], dt_range[1])
+
+            for c in numba.prange(  # pylint: disable=not-an-iterable
+                len(cell_start) - 1
+            ):
+                sd_num = cell_start[c + 1] - cell_start[c]
+                if sd_num < 2:
+                    continue
+                cid = cell_id[idx[cell_start[c]]]
+                norm_factor = dt / dv[cid] * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
+                for pass_number in range(2 if adaptive else 1):
+                    last_pass = pass_number == (1 if adaptive else 0)
+                    for first in range(cell_start[c], cell_start[c + 1] - 1, 2):
+                        if multiplicity[idx[first]] < multiplicity[idx[first + 1]]:
+                            idx[first], idx[first + 1] = idx[first + 1], idx[first]
+                        j = idx[first]
+                        k = idx[first + 1]
+                        prob = (
+                            float(multiplicity[j])
+                            * fused_collision_kernel(
+                                kernel, kernel_params, kernel_x, kernel_v, j, k
+                            )
+                            * norm_factor
+                        )
+                        if prob == 0:
+                            continue
+                        prop = multiplicity[j] // multiplicity[k]
+                        if not last_pass:
+                            dt_optimal = max(dt * prop / prob, dt_range[0])
+                            dt_todo[cid] = min(dt_todo[cid], dt_optimal)
+                            stats_dt_min[cid] = min(stats_dt_min[cid], dt_optimal)
+                            continue
+                        if adaptive:
+                            prob *= dt_todo[cid] / dt
+                        else:
+                            prob /= n_substeps
+
+                        gamma = np.ceil(prob - rand[first // 2])
+                        if gamma == 0:
+                            continue
+                        g = min(int(gamma), prop)
+                        collision_rate[cid] += g * multiplicity[k]
+                        collision_rate_deficit[cid] += (int(gamma) - g) * multiplicity[
+                            k
+                        ]
+                        if g == 0:
+                            continue
+                        coalesce_pair(
+                            g, j, k, cid, multiplicity, attributes, coalescence_rate
+                        )
+                        flag_zero_multiplicity(j, k, multiplicity, healthy)
+
+            if adaptive:
+                for cid in numba.prange(  # pylint: disable=not-an-iterable
+                    len(dt_todo)
+                ):
+                    dt_left[cid] -= dt_todo[cid]
+                    if dt_todo[cid] > 0:
+                        stats_n_substep[cid] += 1
+
+        return body
+
+    def fused_collision_coalescence(
+        self,
+        *,
+        kernel,
+        kernel_params,
+        kernel_x,
+        kernel_v,
+        multiplicity,
+        idx,
+        attributes,
+        healthy,
+        cell_id,
+        cell_start,
+        rand,
+        dv,
+        dt,
+        adaptive,
+        n_substeps,
+        dt_left,
+        dt_range,
+        dt_todo,
+        stats_n_substep,
+        stats_dt_min,
+        collision_rate,
+        collision_rate_deficit,
+        coalescence_rate,
+    ):
+        # pylint: disable=too-many-locals
+        n_cell = len(dt_todo)
+        self._fused_collision_coalescence_body(
+            kernel=FUSED_COLLISION_KERNELS.index(kernel),
+            kernel_params=np.asarray(kernel_params, dtype=float),
+            kernel_x=np.empty(0) if kernel_x is None else kernel_x.data,
+            kernel_v=np.empty(0) if kernel_v is None else kernel_v.data,
+            multiplicity=multiplicity.data,
+            idx=idx.data,
+            attributes=attributes.data,
+            healthy=healthy.data,
+            cell_id=cell_id.data,
+            cell_start=cell_start.data,
+            rand=rand.data,
+            dv=np.broadcast_to(dv, (n_cell,)),
+            dt=dt,
+            adaptive=adaptive,
+            n_substeps=n_substeps,
+            dt_left=dt_left.data,
+            dt_range=dt_range,
+            dt_todo=dt_todo.data,
+            stats_n_substep=stats_n_substep.data,
+            stats_dt_min=stats_dt_min.data,
+            collision_rate=collision_rate.data,
+            collision_rate_deficit=collision_rate_deficit.data,
+            coalescence_rate=coalescence_rate.data,
+        )
+
     @staticmethod
     def make_cell_caretaker(idx_shape, idx_dtype, cell_start_len, scheme="default"):
         class CellCaretaker:  # pylint: disable=too-few-public-methods
@@ -636,13 +935,14 @@ class CollisionsMethods(BackendMethods):
         # pylint: disable=too-many-arguments
         def body(prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv):
             n_cell = cell_start.shape[0] - 1
-            for i in range(n_cell):
+            for cell in range(n_cell):
+                i = cell_idx[cell]
                 sd_num = cell_start[i + 1] - cell_start[i]
                 if sd_num < 2:
                     norm_factor[i] = 0
                 else:
                     norm_factor[i] = (
-                        timestep / dv * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
+                        timestep / dv[cell] * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
                     )
             for d in numba.prange(prob.shape[0]):  # pylint: disable=not-an-iterable
                 prob[d] *= norm_factor[cell_idx[cell_id[d]]]
@@ -658,7 +958,7 @@ class CollisionsMethods(BackendMethods):
             cell_start.data,
             norm_factor.data,
             timestep,
-            dv,
+            np.broadcast_to(dv, (cell_start.shape[0] - 1,)),
         )
 
     @cached_property
@@ -671,8 +971,7 @@ class CollisionsMethods(BackendMethods):
             while i < new_length:
                 if idx[i] == flag or multiplicity[idx[i]] == 0:
                     new_length -= 1
-                    idx[i] = idx[new_length]
-                    idx[new_length] = flag
+                    idx[i], idx[new_length] = idx[new_length], idx[i]
                 else:
                     i += 1
             return new_length
@@ -745,26 +1044,12 @@ class CollisionsMethods(BackendMethods):
         @numba.njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments,too-many-locals
         def body(params, output, radii, is_first_in_pair, idx, length, unit):
-            A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
             output[:] = 0
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
                 if is_first_in_pair[i]:
-                    if radii[idx[i]] > radii[idx[i + 1]]:
-                        r = radii[idx[i]] / unit
-                        r_s = radii[idx[i + 1]] / unit
-                    else:
-                        r = radii[idx[i + 1]] / unit
-                        r_s = radii[idx[i]] / unit
-                    p = r_s / r
-                    if p not in (0, 1):
-                        G = (G1 / r) ** Mg + G2 + G3 * r
-                        Gp = (1 - p) ** G
-                        if Gp != 0:
-                            D = D1 / r**D2
-                            E = E1 / r**E2
-                            F = (F1 / r) ** Mf + F2
-                            output[i // 2] = A + B * p + D / p**F + E / Gp
-                            output[i // 2] = max(0, output[i // 2])
+                    output[i // 2] = parameterized_collection_efficiency(
+                        params, radii[idx[i]], radii[idx[i + 1]], unit
+                    )
 
         return body
 
@@ -4,6 +4,7 @@ CPU implementation of backend methods for water condensation/evaporation
 
 from collections import namedtuple
 import math
+import time
 from functools import lru_cache
 
 import numba
@@ -11,12 +12,27 @@ import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 from PySDM.backends.impl_numba import conf
-from PySDM.backends.impl_numba.toms748 import toms748_solve
+from PySDM.backends.impl_numba.atomic_operations import atomic_add
+from PySDM.backends.impl_numba.toms748 import (
+    BATCH_SIZE,
+    TOMS748_WORKSPACE_ROWS,
+    toms748_solve,
+    toms748_solve_batch,
+)
 from PySDM.backends.impl_numba.warnings import warn
 
+# pylint: disable=too-many-lines
+
 _Counters = namedtuple(
     typename="_Counters",
-    field_names=("n_substeps", "n_activating", "n_deactivating", "n_ripening"),
+    field_names=(
+        "n_substeps",
+        "n_activating",
+        "n_deactivating",
+        "n_ripening",
+        "n_trial_solves",
+        "n_equilibrium_skips",
+    ),
 )
 _Attributes = namedtuple(
     typename="_Attributes",
@@ -44,6 +60,34 @@ _CellData = namedtuple(
         "air_dynamic_viscosity",
     ),
 )
+# rows of the per-droplet equilibrium cache (see `make_calculate_ml_new`); entries
+# are valid only if flagged with a non-zero value in the `_CACHE_VALID` row (the cache
+# is zero-initialised as NaN comparisons are not reliable with `fastmath`)
+(
+    _CACHE_VALID,
+    _CACHE_MASS,
+    _CACHE_VDRY,
+    _CACHE_KAPPA,
+    _CACHE_F_ORG,
+    _CACHE_T,
+    _CACHE_RH_EQ,
+) = range(7)
+EQUILIBRIUM_CACHE_ROWS = 7
+
+# per-droplet outcomes of the first pass of `calculate_ml_new`
+_SKIPPED, _IN_EQUILIBRIUM, _UNCHANGED, _SOLVED, _TO_SOLVE, _FAILED = range(6)
+# rows of the per-droplet parameters of the implicit-step root-finding problem
+_PARAM_X_OLD, _PARAM_KAPPA, _PARAM_F_ORG, _PARAM_RD3, _PARAM_FK, _PARAM_FD = range(6)
+_N_PARAMS = 6
+# rows of the per-droplet workspace of the batched root-finding (float and int
+# parts, each followed by the rows of the `toms748_solve_batch` workspace)
+_WS_X_NEW, _WS_BRACKETS, _WS_PARAMS = 0, 1, 5
+_WS_STATUS, _WS_ITERS, _WS_MAX_ITER = range(3)
+ROOT_FINDING_WORKSPACE_ROWS = (
+    _WS_PARAMS + _N_PARAMS + TOMS748_WORKSPACE_ROWS[0],
+    _WS_MAX_ITER + 1 + TOMS748_WORKSPACE_ROWS[1],
+)
+
 _RelativeTolerances = namedtuple(
     typename="_RelativeTolerances", field_names=("x", "thd")
 )
@@ -53,8 +97,17 @@ class CondensationMethods(BackendMethods):
     # pylint: disable=unused-argument
     @staticmethod
     def condensation(**kwargs):
-        n_threads = min(numba.get_num_threads(), kwargs["n_cell"])
-        CondensationMethods._condensation(
+        # with intra-cell parallelism, cells are processed sequentially as nested
+        # parallel regions are not supported by all Numba threading layers
+        n_threads = (
+            1
+            if kwargs["intra_cell_parallel"]
+            else min(numba.get_num_threads(), kwargs["n_cell"])
+        )
+        CondensationMethods._make_condensation(
+            cell_parallel=not kwargs["intra_cell_parallel"],
+            timed=kwargs["thread_busy_time"] is not None,
+        )(
             solver=kwargs["solver"],
             n_threads=n_threads,
             n_cell=kwargs["n_cell"],
@@ -73,7 +126,7 @@ class CondensationMethods(BackendMethods):
                 rhod=kwargs["rhod"].data,
                 thd=kwargs["thd"].data,
                 water_vapour_mixing_ratio=kwargs["water_vapour_mixing_ratio"].data,
-                dv_mean=kwargs["dv"],
+                dv_mean=np.broadcast_to(kwargs["dv"], (kwargs["n_cell"],)),
                 prhod=kwargs["prhod"].data,
                 pthd=kwargs["pthd"].data,
                 predicted_water_vapour_mixing_ratio=(
@@ -92,87 +145,159 @@ class CondensationMethods(BackendMethods):
                 n_activating=kwargs["counters"]["n_activating"].data,
                 n_deactivating=kwargs["counters"]["n_deactivating"].data,
                 n_ripening=kwargs["counters"]["n_ripening"].data,
+                n_trial_solves=kwargs["counters"]["n_trial_solves"].data,
+                n_equilibrium_skips=kwargs["counters"]["n_equilibrium_skips"].data,
+            ),
+            trial_masses=kwargs["trial_masses"].data,
+            equilibrium_cache=kwargs["equilibrium_cache"].data,
+            root_finding_workspace=(
+                kwargs["root_finding_workspace"][0].data,
+                kwargs["root_finding_workspace"][1].data,
             ),
             cell_order=kwargs["cell_order"],
+            cells_per_chunk=(
+                max(1, kwargs["n_cell"] // (16 * n_threads))
+                if kwargs["dynamic_schedule"]
+                else 0
+            ),
+            thread_busy_time=(
+                np.empty(0)
+                if kwargs["thread_busy_time"] is None
+                else kwargs["thread_busy_time"].data
+            ),
             RH_max=kwargs["RH_max"].data,
             success=kwargs["success"].data,
         )
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
-    def _condensation(  # pylint: disable=too-many-locals
-        *,
-        solver,
-        n_threads,
-        n_cell,
-        cell_start_arg,
-        attributes,
-        cell_data,
-        idx,
-        rtols,
-        timestep,
-        counters,
-        cell_order,
-        RH_max,
-        success,
-    ):
-        # arrays within namedtuples in prange loops do not work
-        # https://github.com/numba/numba/issues/5872
-        cdt_predicted_water_vapour_mixing_ratio = (
-            cell_data.predicted_water_vapour_mixing_ratio
+    @lru_cache()
+    def _make_condensation(cell_parallel, timed):
+        """with `timed`, per-thread wall time is recorded in `thread_busy_time` (using
+        object-mode calls to `time.perf_counter()`, hence in a separate variant)"""
+        if timed:
+
+            @numba.njit(**{**conf.JIT_FLAGS, "parallel": False, "cache": False})
+            def clock():
+                with numba.objmode(now="float64"):
+                    now = time.perf_counter()
+                return now
+
+        else:
+
+            @numba.njit(**{**conf.JIT_FLAGS, "parallel": False, "cache": False})
+            def clock():
+                return np.nan
+
+        @numba.njit(
+            **{
+                **conf.JIT_FLAGS,
+                **{"cache": False},
+                **({} if cell_parallel else {"parallel": False}),
+            }
         )
-        cdt_pthd = cell_data.pthd
-        cnt_n_substeps = counters.n_substeps
-        cnt_n_activating = counters.n_activating
-        cnt_n_deactivating = counters.n_deactivating
-        cnt_n_ripening = counters.n_ripening
-
-        for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
-            for i in range(thread_id, n_cell, n_threads):
-                cell_id = cell_order[i]
-                cell_start = cell_start_arg[cell_id]
-                cell_end = cell_start_arg[cell_id + 1]
-                n_sd_in_cell = cell_end - cell_start
-                if n_sd_in_cell == 0:
-                    continue
+        def body(  # pylint: disable=too-many-locals
+            *,
+            solver,
+            n_threads,
+            n_cell,
+            cell_start_arg,
+            attributes,
+            cell_data,
+            idx,
+            rtols,
+            timestep,
+            counters,
+            trial_masses,
+            equilibrium_cache,
+            root_finding_workspace,
+            cell_order,
+            cells_per_chunk,
+            thread_busy_time,
+            RH_max,
+            success,
+        ):
+            """with `cells_per_chunk == 0`, cells are statically assigned to threads
+            in a round-robin fashion; otherwise, threads pick consecutive chunks of
+            `cell_order` from a shared (atomically incremented) work-queue counter"""
+            # arrays within namedtuples in prange loops do not work
+            # https://github.com/numba/numba/issues/5872
+            cdt_predicted_water_vapour_mixing_ratio = (
+                cell_data.predicted_water_vapour_mixing_ratio
+            )
+            cdt_pthd = cell_data.pthd
+            cnt_n_substeps = counters.n_substeps
+            cnt_n_activating = counters.n_activating
+            cnt_n_deactivating = counters.n_deactivating
+            cnt_n_ripening = counters.n_ripening
+            cnt_n_trial_solves = counters.n_trial_solves
+            cnt_n_equilibrium_skips = counters.n_equilibrium_skips
 
-                (
-                    success[cell_id],
-                    cdt_predicted_water_vapour_mixing_ratio[cell_id],
-                    cdt_pthd[cell_id],
-                    cnt_n_substeps[cell_id],
-                    cnt_n_activating[cell_id],
-                    cnt_n_deactivating[cell_id],
-                    cnt_n_ripening[cell_id],
-                    RH_max[cell_id],
-                ) = solver(
-                    attributes=attributes,
-                    cell_idx=idx[cell_start:cell_end],
-                    thd=cell_data.thd[cell_id],
-                    water_vapour_mixing_ratio=cell_data.water_vapour_mixing_ratio[
-                        cell_id
-                    ],
-                    rhod=cell_data.rhod[cell_id],
-                    dthd_dt=(cell_data.pthd[cell_id] - cell_data.thd[cell_id])
-                    / timestep,
-                    d_water_vapour_mixing_ratio__dt=(
-                        cell_data.predicted_water_vapour_mixing_ratio[cell_id]
-                        - cell_data.water_vapour_mixing_ratio[cell_id]
+            next_chunk = np.zeros(1, dtype=np.int64)
+            thread_busy_time[:] = np.nan
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                start = clock()
+                i = np.int64(thread_id if cells_per_chunk == 0 else 0)
+                chunk_end = np.int64(0)
+                while True:
+                    if cells_per_chunk != 0 and i == chunk_end:
+                        i = np.int64(atomic_add(next_chunk, 0, 1) * cells_per_chunk)
+                        chunk_end = np.int64(min(i + cells_per_chunk, n_cell))
+                    if i >= n_cell:
+                        break
+                    cell_id = cell_order[i]
+                    i += n_threads if cells_per_chunk == 0 else 1
+                    cell_start = cell_start_arg[cell_id]
+                    cell_end = cell_start_arg[cell_id + 1]
+                    n_sd_in_cell = cell_end - cell_start
+                    if n_sd_in_cell == 0:
+                        continue
+
+                    (
+                        success[cell_id],
+                        cdt_predicted_water_vapour_mixing_ratio[cell_id],
+                        cdt_pthd[cell_id],
+                        cnt_n_substeps[cell_id],
+                        cnt_n_activating[cell_id],
+                        cnt_n_deactivating[cell_id],
+                        cnt_n_ripening[cell_id],
+                        cnt_n_trial_solves[cell_id],
+                        cnt_n_equilibrium_skips[cell_id],
+                        RH_max[cell_id],
+                    ) = solver(
+                        attributes=attributes,
+                        cell_idx=idx[cell_start:cell_end],
+                        thd=cell_data.thd[cell_id],
+                        water_vapour_mixing_ratio=cell_data.water_vapour_mixing_ratio[
+                            cell_id
+                        ],
+                        rhod=cell_data.rhod[cell_id],
+                        dthd_dt=(cell_data.pthd[cell_id] - cell_data.thd[cell_id])
+                        / timestep,
+                        d_water_vapour_mixing_ratio__dt=(
+                            cell_data.predicted_water_vapour_mixing_ratio[cell_id]
+                            - cell_data.water_vapour_mixing_ratio[cell_id]
+                        )
+                        / timestep,
+                        drhod_dt=(cell_data.prhod[cell_id] - cell_data.rhod[cell_id])
+                        / timestep,
+                        m_d=(
+                            (cell_data.prhod[cell_id] + cell_data.rhod[cell_id])
+                            / 2
+                            * cell_data.dv_mean[cell_id]
+                        ),
+                        air_density=cell_data.air_density[cell_id],
+                        air_dynamic_viscosity=cell_data.air_dynamic_viscosity[cell_id],
+                        rtols=rtols,
+                        timestep=timestep,
+                        n_substeps=counters.n_substeps[cell_id],
+                        trial_masses=trial_masses,
+                        equilibrium_cache=equilibrium_cache,
+                        root_finding_workspace=root_finding_workspace,
                     )
-                    / timestep,
-                    drhod_dt=(cell_data.prhod[cell_id] - cell_data.rhod[cell_id])
-                    / timestep,
-                    m_d=(
-                        (cell_data.prhod[cell_id] + cell_data.rhod[cell_id])
-                        / 2
-                        * cell_data.dv_mean
-                    ),
-                    air_density=cell_data.air_density[cell_id],
-                    air_dynamic_viscosity=cell_data.air_dynamic_viscosity[cell_id],
-                    rtols=rtols,
-                    timestep=timestep,
-                    n_substeps=counters.n_substeps[cell_id],
-                )
+                if timed:
+                    thread_busy_time[thread_id] = clock() - start
+
+        return body
 
     @staticmethod
     def make_adapt_substeps(
@@ -188,9 +313,14 @@ class CondensationMethods(BackendMethods):
         n_substeps_min = math.ceil(timestep / dt_range[1])
 
         @numba.njit(**jit_flags)
-        def adapt_substeps(step_impl_args, n_substeps, thd, rtol_thd):
+        def adapt_substeps(step_impl_args, n_substeps, thd, rtol_thd, trial_masses):
+            """returns the number of substeps, success flag, number of trial
+            solves and the row of `trial_masses` holding droplet masses after
+            the first of the returned substeps (or -1 if not recorded)"""
             n_substeps = np.maximum(n_substeps_min, n_substeps // multiplier)
             success = False
+            n_trial_solves = 0
+            long_slot = 0
             for burnout in range(fuse + 1):
                 if burnout == fuse:
                     return warn(
@@ -200,20 +330,35 @@ class CondensationMethods(BackendMethods):
                             "thd",
                             thd,
                         ),
-                        return_value=(0, False),
+                        return_value=(0, False, n_trial_solves, -1),
                     )
-                thd_new_long, success = step_fake(step_impl_args, timestep, n_substeps)
+                thd_new_long, success = step_fake(
+                    step_impl_args, timestep, n_substeps, trial_masses[long_slot]
+                )
+                n_trial_solves += 1
                 if success:
                     break
                 n_substeps *= multiplier
             for burnout in range(fuse + 1):
                 if burnout == fuse:
-                    return warn("burnout (short)", __file__, return_value=(0, False))
+                    return warn(
+                        "burnout (short)",
+                        __file__,
+                        return_value=(0, False, n_trial_solves, -1),
+                    )
                 thd_new_short, success = step_fake(
-                    step_impl_args, timestep, n_substeps * multiplier
+                    step_impl_args,
+                    timestep,
+                    n_substeps * multiplier,
+                    trial_masses[1 - long_slot],
                 )
+                n_trial_solves += 1
                 if not success:
-                    return warn("short failed", __file__, return_value=(0, False))
+                    return warn(
+                        "short failed",
+                        __file__,
+                        return_value=(0, False, n_trial_solves, -1),
+                    )
                 dthd_long = thd_new_long - thd
                 dthd_short = thd_new_short - thd
                 error_estimate = np.abs(dthd_long - multiplier * dthd_short)
@@ -221,18 +366,25 @@ class CondensationMethods(BackendMethods):
                 if formulae.trivia__within_tolerance(error_estimate, thd, rtol_thd):
                     break
                 n_substeps *= multiplier
+                long_slot = 1 - long_slot
                 if n_substeps > n_substeps_max:
                     break
-            return np.minimum(n_substeps_max, n_substeps), success
+            if n_substeps > n_substeps_max:
+                return n_substeps_max, success, n_trial_solves, -1
+            return n_substeps, success, n_trial_solves, long_slot
 
         return adapt_substeps
 
     @staticmethod
     def make_step_fake(jit_flags, step_impl):
         @numba.njit(**jit_flags)
-        def step_fake(step_impl_args, dt, n_substeps):
+        def step_fake(step_impl_args, dt, n_substeps, mass_buffer):
+            """single substep of length `dt / n_substeps` not altering particle
+            masses (the new ones are recorded in `mass_buffer` unless it is empty)"""
             dt /= n_substeps
-            _, thd_new, _, _, _, _, success = step_impl(*step_impl_args, dt, 1, True)
+            _, thd_new, _, _, _, _, _, success = step_impl(
+                *step_impl_args, dt, 1, True, mass_buffer
+            )
             return thd_new, success
 
         return step_fake
@@ -240,8 +392,11 @@ class CondensationMethods(BackendMethods):
     @staticmethod
     def make_step(jit_flags, step_impl):
         @numba.njit(**jit_flags)
-        def step(step_impl_args, dt, n_substeps):
-            return step_impl(*step_impl_args, dt, n_substeps, False)
+        def step(step_impl_args, dt, n_substeps, mass_buffer):
+            """`n_substeps` substeps, the first one taking particle masses from
+            `mass_buffer` (recorded by `step_fake`) instead of solving for them
+            unless the buffer is empty"""
+            return step_impl(*step_impl_args, dt, n_substeps, False, mass_buffer)
 
         return step
 
@@ -252,6 +407,7 @@ class CondensationMethods(BackendMethods):
         formulae,
         calculate_ml_old,
         calculate_ml_new,
+        apply_ml_new,
     ):
         @numba.njit(**jit_flags)
         def step_impl(  # pylint: disable=too-many-arguments,too-many-locals
@@ -267,18 +423,22 @@ class CondensationMethods(BackendMethods):
             air_density,
             air_dynamic_viscosity,
             rtol_x,
+            equilibrium_cache,
+            root_finding_workspace,
             timestep,
             n_substeps,
             fake,
+            mass_buffer,
         ):
             timestep /= n_substeps
             ml_old = calculate_ml_old(
                 attributes.signed_water_mass, attributes.multiplicity, cell_idx
             )
             count_activating, count_deactivating, count_ripening = 0, 0, 0
+            count_equilibrium_skips = 0
             RH_max = 0
             success = True
-            for _ in range(n_substeps):
+            for substep in range(n_substeps):
                 # note: no example yet showing that the trapezoidal scheme brings any improvement
                 thd += timestep * dthd_dt_pred / 2
                 water_vapour_mixing_ratio += (
@@ -300,27 +460,41 @@ class CondensationMethods(BackendMethods):
                     diffusivity=DTp,
                     density=air_density,
                 )
-                (
-                    ml_new,
-                    success_within_substep,
-                    n_activating,
-                    n_deactivating,
-                    n_ripening,
-                ) = calculate_ml_new(
-                    attributes,
-                    timestep,
-                    fake,
-                    T,
-                    p,
-                    RH,
-                    Sc,
-                    cell_idx,
-                    lv,
-                    pvs,
-                    DTp,
-                    KTp,
-                    rtol_x,
-                )
+                if substep == 0 and not fake and len(mass_buffer) > 0:
+                    (
+                        ml_new,
+                        success_within_substep,
+                        n_activating,
+                        n_deactivating,
+                        n_ripening,
+                        n_equilibrium_skips,
+                    ) = apply_ml_new(attributes, cell_idx, mass_buffer)
+                else:
+                    (
+                        ml_new,
+                        success_within_substep,
+                        n_activating,
+                        n_deactivating,
+                        n_ripening,
+                        n_equilibrium_skips,
+                    ) = calculate_ml_new(
+                        attributes,
+                        timestep,
+                        fake,
+                        T,
+                        p,
+                        RH,
+                        Sc,
+                        cell_idx,
+                        lv,
+                        pvs,
+                        DTp,
+                        KTp,
+                        rtol_x,
+                        equilibrium_cache,
+                        root_finding_workspace,
+                        mass_buffer,
+                    )
                 dml_dt = (ml_new - ml_old) / timestep
                 d_water_vapour_mixing_ratio__dt_corrected = -dml_dt / m_d
                 dthd_dt_corr = formulae.state_variable_triplet__dthd_dt(
@@ -341,6 +515,7 @@ class CondensationMethods(BackendMethods):
                 count_activating += n_activating
                 count_deactivating += n_deactivating
                 count_ripening += n_ripening
+                count_equilibrium_skips += n_equilibrium_skips
                 RH_max = max(RH_max, RH)
                 success = success and success_within_substep
             return (
@@ -349,6 +524,7 @@ class CondensationMethods(BackendMethods):
                 count_activating,
                 count_deactivating,
                 count_ripening,
+                count_equilibrium_skips,
                 RH_max,
                 success,
             )
@@ -360,7 +536,8 @@ class CondensationMethods(BackendMethods):
         @numba.njit(**jit_flags)
         def calculate_ml_old(signed_water_mass, multiplicity, cell_idx):
             result = 0
-            for drop in cell_idx:
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
                 if signed_water_mass[drop] > 0:
                     result += multiplicity[drop] * signed_water_mass[drop]
             return result
@@ -368,13 +545,54 @@ class CondensationMethods(BackendMethods):
         return calculate_ml_old
 
     @staticmethod
-    def make_calculate_ml_new(  # pylint: disable=too-many-statements
+    def make_calculate_ml_new(  # pylint: disable=too-many-statements,too-many-locals
         *,
         formulae,
         jit_flags,
         max_iters,
         RH_rtol,
+        update_mass,
+        equilibrium_cache_T_rtol,
+        batched,
+        organic_fraction_dependent,
     ):
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def is_cached(equilibrium_cache, attributes, drop, T):
+            """checks if the cache holds `RH_eq` for the current droplet mass, dry
+            volume, kappa and organic fraction and for temperature within tolerance
+            (the organic fraction, a NaN-filled dummy attribute for surface-tension
+            models not depending on it, is compared only if `organic_fraction_dependent`)
+            """
+            if equilibrium_cache.shape[1] == 0:
+                return False
+            return (
+                equilibrium_cache[_CACHE_VALID, drop] != 0
+                and equilibrium_cache[_CACHE_MASS, drop]
+                == attributes.signed_water_mass[drop]
+                and equilibrium_cache[_CACHE_VDRY, drop] == attributes.vdry[drop]
+                and equilibrium_cache[_CACHE_KAPPA, drop] == attributes.kappa[drop]
+                and (
+                    not organic_fraction_dependent
+                    or equilibrium_cache[_CACHE_F_ORG, drop] == attributes.f_org[drop]
+                )
+                and formulae.trivia__within_tolerance(
+                    np.abs(T - equilibrium_cache[_CACHE_T, drop]),
+                    T,
+                    equilibrium_cache_T_rtol,
+                )
+            )
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def store_in_cache(equilibrium_cache, attributes, drop, T, RH_eq):
+            equilibrium_cache[_CACHE_MASS, drop] = attributes.signed_water_mass[drop]
+            equilibrium_cache[_CACHE_VDRY, drop] = attributes.vdry[drop]
+            equilibrium_cache[_CACHE_KAPPA, drop] = attributes.kappa[drop]
+            if organic_fraction_dependent:
+                equilibrium_cache[_CACHE_F_ORG, drop] = attributes.f_org[drop]
+            equilibrium_cache[_CACHE_T, drop] = T
+            equilibrium_cache[_CACHE_RH_EQ, drop] = RH_eq
+            equilibrium_cache[_CACHE_VALID, drop] = 1
+
         @numba.njit(**jit_flags)
         def minfun(  # pylint: disable=too-many-arguments,too-many-locals
             x_new, x_old, timestep, kappa, f_org, rd3, temperature, RH, Fk, Fd
@@ -405,6 +623,169 @@ class CondensationMethods(BackendMethods):
                 + timestep * formulae.diffusion_coordinate__dx_dt(mass_new, dm_dt)
             )
 
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def minfun_batch(  # pylint: disable=too-many-arguments
+            x_new, i, params, timestep, temperature, RH
+        ):
+            return minfun(
+                x_new,
+                params[_PARAM_X_OLD, i],
+                timestep,
+                params[_PARAM_KAPPA, i],
+                params[_PARAM_F_ORG, i],
+                params[_PARAM_RD3, i],
+                temperature,
+                RH,
+                params[_PARAM_FK, i],
+                params[_PARAM_FD, i],
+            )
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def implicit_step_problem(  # pylint: disable=too-many-arguments,too-many-locals
+            attributes,
+            drop,
+            timestep,
+            T,
+            RH,
+            Sc,
+            lv,
+            pvs,
+            DTp,
+            KTp,
+            lambdaK,
+            lambdaD,
+            equilibrium_cache,
+        ):
+            """returns the status (`_IN_EQUILIBRIUM`, `_UNCHANGED` or `_TO_SOLVE`),
+            the explicit-step increment `dx_old`, the lower limit `x_insane` and
+            the `minfun` arguments of the implicit-step problem for a droplet"""
+            cache_hit = is_cached(equilibrium_cache, attributes, drop, T)
+            if cache_hit:
+                RH_eq = equilibrium_cache[_CACHE_RH_EQ, drop]
+                if formulae.trivia__within_tolerance(np.abs(RH - RH_eq), RH, RH_rtol):
+                    return (
+                        _IN_EQUILIBRIUM,
+                        0.0,
+                        0.0,
+                        (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+                    )
+            v_drop = formulae.particle_shape_and_density__mass_to_volume(
+                attributes.signed_water_mass[drop]
+            )
+            x_old = formulae.diffusion_coordinate__x(attributes.signed_water_mass[drop])
+            r_old = formulae.trivia__radius(v_drop)
+            x_insane = formulae.diffusion_coordinate__x(
+                formulae.particle_shape_and_density__volume_to_mass(
+                    attributes.vdry[drop] / 100
+                )
+            )
+            rd3 = attributes.vdry[drop] / formulae.constants.PI_4_3
+            if not cache_hit:
+                sgm = formulae.surface_tension__sigma(
+                    T, v_drop, attributes.vdry[drop], attributes.f_org[drop]
+                )
+                RH_eq = formulae.hygroscopicity__RH_eq(
+                    r_old, T, attributes.kappa[drop], rd3, sgm
+                )
+                if equilibrium_cache.shape[1] > 0:
+                    store_in_cache(equilibrium_cache, attributes, drop, T, RH_eq)
+            Fk = 0.0
+            Fd = 0.0
+            dx_old = 0.0
+            if not formulae.trivia__within_tolerance(np.abs(RH - RH_eq), RH, RH_rtol):
+                Dr = formulae.diffusion_kinetics__D(DTp, r_old, lambdaD)
+                Kr = formulae.diffusion_kinetics__K(KTp, r_old, lambdaK)
+                mass_ventilation_factor = formulae.ventilation__ventilation_coefficient(
+                    sqrt_re_times_cbrt_sc=formulae.trivia__sqrt_re_times_cbrt_sc(
+                        Re=attributes.reynolds_number[drop],
+                        Sc=Sc,
+                    )
+                )
+                heat_ventilation_factor = mass_ventilation_factor  # TODO #1588
+                Fk = formulae.drop_growth__Fk(
+                    T=T, K=Kr * heat_ventilation_factor, lv=lv
+                )
+                Fd = formulae.drop_growth__Fd(
+                    T=T, D=Dr * mass_ventilation_factor, pvs=pvs
+                )
+                r_dr_dt_old = formulae.drop_growth__r_dr_dt(
+                    RH_eq=RH_eq, RH=RH, Fk=Fk, Fd=Fd
+                )
+                mass_old = formulae.diffusion_coordinate__mass(x_old)
+                dm_dt_old = formulae.particle_shape_and_density__dm_dt(
+                    r=r_old, r_dr_dt=r_dr_dt_old
+                )
+                dx_old = timestep * formulae.diffusion_coordinate__dx_dt(
+                    mass_old, dm_dt_old
+                )
+            minfun_args = (
+                x_old,
+                timestep,
+                attributes.kappa[drop],
+                attributes.f_org[drop],
+                rd3,
+                T,
+                RH,
+                Fk,
+                Fd,
+            )
+            return (
+                _UNCHANGED if dx_old == 0 else _TO_SOLVE,
+                dx_old,
+                x_insane,
+                minfun_args,
+            )
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def bracket_root(minfun_args, dx_old, x_insane, fake, p):
+            """returns `a < b` and `fa`, `fb` such that `fa * fb < 0` (with `a == b`
+            if the root is at `x_old`), and a success flag"""
+            x_old = minfun_args[0]
+            a = x_old
+            b = max(x_insane, a + dx_old)
+            fa = minfun(a, *minfun_args)
+            fb = minfun(b, *minfun_args)
+
+            counter = 0
+            while not fa * fb < 0:
+                counter += 1
+                if counter > max_iters:
+                    if not fake:
+                        warn(
+                            "failed to find interval",
+                            __file__,
+                            context=(
+                                "T",
+                                minfun_args[5],
+                                "p",
+                                p,
+                                "RH",
+                                minfun_args[6],
+                                "a",
+                                a,
+                                "b",
+                                b,
+                                "fa",
+                                fa,
+                                "fb",
+                                fb,
+                            ),
+                        )
+                    return a, b, fa, fb, False
+                b = max(x_insane, a + math.ldexp(dx_old, counter))
+                fb = minfun(b, *minfun_args)
+            if a > b:
+                a, b = b, a
+                fa, fb = fb, fa
+            return a, b, fa, fb, True
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def new_mass(attributes, drop, status, x_new, equilibrium_cache):
+            if status == _UNCHANGED and equilibrium_cache.shape[1] > 0:
+                # keeping the mass bitwise unchanged for the cache to remain valid
+                return attributes.signed_water_mass[drop]
+            return formulae.diffusion_coordinate__mass(x_new)
+
         @numba.njit(**jit_flags)
         def calculate_ml_new(  # pylint: disable=too-many-branches,too-many-arguments,too-many-locals
             attributes,
@@ -420,122 +801,58 @@ class CondensationMethods(BackendMethods):
             DTp,
             KTp,
             rtol_x,
+            equilibrium_cache,
+            workspace,  # pylint: disable=unused-argument
+            mass_buffer,
         ):
             result = 0
             n_activating = 0
             n_deactivating = 0
             n_activated_and_growing = 0
-            success = True
+            n_failed = 0
+            n_equilibrium_skips = 0
             lambdaK = formulae.diffusion_kinetics__lambdaK(T, p)
             lambdaD = formulae.diffusion_kinetics__lambdaD(DTp, T)
-            for drop in cell_idx:
+            # note: with parallel jit flags, the loop (incl. the sums) is split
+            #       across threads; upon failure, remaining droplets are still processed
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
                 if attributes.signed_water_mass[drop] <= 0:
                     continue
-                v_drop = formulae.particle_shape_and_density__mass_to_volume(
-                    attributes.signed_water_mass[drop]
-                )
-                x_old = formulae.diffusion_coordinate__x(
-                    attributes.signed_water_mass[drop]
-                )
-                r_old = formulae.trivia__radius(v_drop)
-                x_insane = formulae.diffusion_coordinate__x(
-                    formulae.particle_shape_and_density__volume_to_mass(
-                        attributes.vdry[drop] / 100
-                    )
-                )
-                rd3 = attributes.vdry[drop] / formulae.constants.PI_4_3
-                sgm = formulae.surface_tension__sigma(
-                    T, v_drop, attributes.vdry[drop], attributes.f_org[drop]
-                )
-                RH_eq = formulae.hygroscopicity__RH_eq(
-                    r_old, T, attributes.kappa[drop], rd3, sgm
+                status, dx_old, x_insane, minfun_args = implicit_step_problem(
+                    attributes,
+                    drop,
+                    timestep,
+                    T,
+                    RH,
+                    Sc,
+                    lv,
+                    pvs,
+                    DTp,
+                    KTp,
+                    lambdaK,
+                    lambdaD,
+                    equilibrium_cache,
                 )
-                if not formulae.trivia__within_tolerance(
-                    np.abs(RH - RH_eq), RH, RH_rtol
-                ):
-                    Dr = formulae.diffusion_kinetics__D(DTp, r_old, lambdaD)
-                    Kr = formulae.diffusion_kinetics__K(KTp, r_old, lambdaK)
-                    mass_ventilation_factor = formulae.ventilation__ventilation_coefficient(
-                        sqrt_re_times_cbrt_sc=formulae.trivia__sqrt_re_times_cbrt_sc(
-                            Re=attributes.reynolds_number[drop],
-                            Sc=Sc,
-                        )
-                    )
-                    heat_ventilation_factor = mass_ventilation_factor  # TODO #1588
-                    Fk = formulae.drop_growth__Fk(
-                        T=T, K=Kr * heat_ventilation_factor, lv=lv
+                if status == _IN_EQUILIBRIUM:
+                    # droplet in equilibrium: mass (and counts) unchanged
+                    n_equilibrium_skips += 1
+                    result += (
+                        attributes.multiplicity[drop]
+                        * attributes.signed_water_mass[drop]
                     )
-                    Fd = formulae.drop_growth__Fd(
-                        T=T, D=Dr * mass_ventilation_factor, pvs=pvs
-                    )
-                    minfun_args = (
-                        x_old,
-                        timestep,
-                        attributes.kappa[drop],
-                        attributes.f_org[drop],
-                        rd3,
-                        T,
-                        RH,
-                        Fk,
-                        Fd,
-                    )
-                    r_dr_dt_old = formulae.drop_growth__r_dr_dt(
-                        RH_eq=RH_eq, RH=RH, Fk=Fk, Fd=Fd
-                    )
-                    mass_old = formulae.diffusion_coordinate__mass(x_old)
-                    dm_dt_old = formulae.particle_shape_and_density__dm_dt(
-                        r=r_old, r_dr_dt=r_dr_dt_old
-                    )
-                    dx_old = timestep * formulae.diffusion_coordinate__dx_dt(
-                        mass_old, dm_dt_old
+                    if fake and len(mass_buffer) > 0:
+                        mass_buffer[drop] = attributes.signed_water_mass[drop]
+                    continue
+                x_new = minfun_args[0]
+                if status == _TO_SOLVE:
+                    a, b, fa, fb, bracketed = bracket_root(
+                        minfun_args, dx_old, x_insane, fake, p
                     )
-                else:
-                    dx_old = 0.0
-                if dx_old == 0:
-                    x_new = x_old
-                else:
-                    a = x_old
-                    b = max(x_insane, a + dx_old)
-                    fa = minfun(a, *minfun_args)
-                    fb = minfun(b, *minfun_args)
-
-                    counter = 0
-                    while not fa * fb < 0:
-                        counter += 1
-                        if counter > max_iters:
-                            if not fake:
-                                warn(
-                                    "failed to find interval",
-                                    __file__,
-                                    context=(
-                                        "T",
-                                        T,
-                                        "p",
-                                        p,
-                                        "RH",
-                                        RH,
-                                        "a",
-                                        a,
-                                        "b",
-                                        b,
-                                        "fa",
-                                        fa,
-                                        "fb",
-                                        fb,
-                                    ),
-                                )
-                            success = False
-                            break
-                        b = max(x_insane, a + math.ldexp(dx_old, counter))
-                        fb = minfun(b, *minfun_args)
-
-                    if not success:
-                        break
+                    if not bracketed:
+                        n_failed += 1
+                        continue
                     if a != b:
-                        if a > b:
-                            a, b = b, a
-                            fa, fb = fb, fa
-
                         x_new, iters_taken = toms748_solve(
                             minfun,
                             minfun_args,
@@ -550,32 +867,236 @@ class CondensationMethods(BackendMethods):
                         if iters_taken in (-1, max_iters):
                             if not fake:
                                 warn("TOMS failed", __file__)
-                            success = False
-                            break
-                    else:
-                        x_new = x_old
-
-                mass_new = formulae.diffusion_coordinate__mass(x_new)
-                mass_cr = formulae.particle_shape_and_density__volume_to_mass(
-                    attributes.v_cr[drop]
+                            n_failed += 1
+                            continue
+
+                mass_new = new_mass(attributes, drop, status, x_new, equilibrium_cache)
+                result += attributes.multiplicity[drop] * mass_new
+                if not fake:
+                    activated_and_growing, activating, deactivating = update_mass(
+                        attributes, drop, mass_new
+                    )
+                    n_activated_and_growing += activated_and_growing
+                    n_activating += activating
+                    n_deactivating += deactivating
+                elif len(mass_buffer) > 0:
+                    mass_buffer[drop] = mass_new
+            n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
+            return (
+                result,
+                n_failed == 0,
+                n_activating,
+                n_deactivating,
+                n_ripening,
+                n_equilibrium_skips,
+            )
+
+        @numba.njit(**jit_flags)
+        def calculate_ml_new_batched(  # pylint: disable=too-many-branches,too-many-arguments,too-many-locals
+            attributes,
+            timestep,
+            fake,
+            T,
+            p,
+            RH,
+            Sc,
+            cell_idx,
+            lv,
+            pvs,
+            DTp,
+            KTp,
+            rtol_x,
+            equilibrium_cache,
+            workspace,
+            mass_buffer,
+        ):
+            """droplets are first classified (and, if needed, their root-finding
+            intervals bracketed), then the implicit-step problems are solved for in
+            batches (see `toms748_solve_batch`), and finally the masses are updated;
+            per-droplet state is kept in the columns of the preallocated `workspace`
+            (see `ROOT_FINDING_WORKSPACE_ROWS`) so that nothing is allocated"""
+            x_new = workspace[0][_WS_X_NEW]
+            brackets = workspace[0][_WS_BRACKETS : _WS_BRACKETS + 4]
+            params = workspace[0][_WS_PARAMS : _WS_PARAMS + _N_PARAMS]
+            status = workspace[1][_WS_STATUS]
+            iters_taken = workspace[1][_WS_ITERS]
+            max_iter = workspace[1][_WS_MAX_ITER]
+            toms748_workspace = (
+                workspace[0][_WS_PARAMS + _N_PARAMS :],
+                workspace[1][_WS_MAX_ITER + 1 :],
+            )
+            lambdaK = formulae.diffusion_kinetics__lambdaK(T, p)
+            lambdaD = formulae.diffusion_kinetics__lambdaD(DTp, T)
+            # note: with parallel jit flags, the loops (incl. the sums) are split
+            #       across threads; upon failure, remaining droplets are still processed
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
+                max_iter[drop] = 0
+                if attributes.signed_water_mass[drop] <= 0:
+                    status[drop] = _SKIPPED
+                    continue
+                drop_status, dx_old, x_insane, minfun_args = implicit_step_problem(
+                    attributes,
+                    drop,
+                    timestep,
+                    T,
+                    RH,
+                    Sc,
+                    lv,
+                    pvs,
+                    DTp,
+                    KTp,
+                    lambdaK,
+                    lambdaD,
+                    equilibrium_cache,
+                )
+                status[drop] = drop_status
+                x_new[drop] = minfun_args[0]
+                if drop_status != _TO_SOLVE:
+                    continue
+                a, b, fa, fb, bracketed = bracket_root(
+                    minfun_args, dx_old, x_insane, fake, p
+                )
+                if not bracketed:
+                    status[drop] = _FAILED
+                elif a != b:
+                    params[_PARAM_X_OLD, drop] = minfun_args[0]
+                    params[_PARAM_KAPPA, drop] = minfun_args[2]
+                    params[_PARAM_F_ORG, drop] = minfun_args[3]
+                    params[_PARAM_RD3, drop] = minfun_args[4]
+                    params[_PARAM_FK, drop] = minfun_args[7]
+                    params[_PARAM_FD, drop] = minfun_args[8]
+                    brackets[0, drop] = a
+                    brackets[1, drop] = b
+                    brackets[2, drop] = fa
+                    brackets[3, drop] = fb
+                    max_iter[drop] = max_iters
+                else:
+                    status[drop] = _SOLVED
+
+            # droplets not to be solved for have max_iter == 0 and are skipped
+            n_batches = (len(cell_idx) + BATCH_SIZE - 1) // BATCH_SIZE
+            for batch in numba.prange(n_batches):  # pylint: disable=not-an-iterable
+                toms748_solve_batch(
+                    minfun_batch,
+                    (params, timestep, T, RH),
+                    cell_idx[batch * BATCH_SIZE : (batch + 1) * BATCH_SIZE],
+                    brackets[0],
+                    brackets[1],
+                    brackets[2],
+                    brackets[3],
+                    rtol_x,
+                    max_iter,
+                    formulae.trivia__within_tolerance,
+                    x_new,
+                    iters_taken,
+                    toms748_workspace,
+                )
+
+            result = 0
+            n_activating = 0
+            n_deactivating = 0
+            n_activated_and_growing = 0
+            n_failed = 0
+            n_equilibrium_skips = 0
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
+                if status[drop] == _SKIPPED:
+                    continue
+                if status[drop] == _FAILED:
+                    n_failed += 1
+                    continue
+                if status[drop] == _IN_EQUILIBRIUM:
+                    # droplet in equilibrium: mass (and counts) unchanged
+                    n_equilibrium_skips += 1
+                    result += (
+                        attributes.multiplicity[drop]
+                        * attributes.signed_water_mass[drop]
+                    )
+                    if fake and len(mass_buffer) > 0:
+                        mass_buffer[drop] = attributes.signed_water_mass[drop]
+                    continue
+                if max_iter[drop] > 0 and iters_taken[drop] in (-1, max_iters):
+                    if not fake:
+                        warn("TOMS failed", __file__)
+                    n_failed += 1
+                    continue
+
+                mass_new = new_mass(
+                    attributes, drop, status[drop], x_new[drop], equilibrium_cache
                 )
                 result += attributes.multiplicity[drop] * mass_new
                 if not fake:
-                    if (
-                        mass_new > mass_cr
-                        and mass_new > attributes.signed_water_mass[drop]
-                    ):
-                        n_activated_and_growing += attributes.multiplicity[drop]
-                    if mass_new > mass_cr > attributes.signed_water_mass[drop]:
-                        n_activating += attributes.multiplicity[drop]
-                    if mass_new < mass_cr < attributes.signed_water_mass[drop]:
-                        n_deactivating += attributes.multiplicity[drop]
-                    attributes.signed_water_mass[drop] = mass_new
+                    activated_and_growing, activating, deactivating = update_mass(
+                        attributes, drop, mass_new
+                    )
+                    n_activated_and_growing += activated_and_growing
+                    n_activating += activating
+                    n_deactivating += deactivating
+                elif len(mass_buffer) > 0:
+                    mass_buffer[drop] = mass_new
             n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
-            return result, success, n_activating, n_deactivating, n_ripening
+            return (
+                result,
+                n_failed == 0,
+                n_activating,
+                n_deactivating,
+                n_ripening,
+                n_equilibrium_skips,
+            )
 
+        if batched:
+            return calculate_ml_new_batched
         return calculate_ml_new
 
+    @staticmethod
+    def make_update_mass(*, formulae, jit_flags):
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def update_mass(attributes, drop, mass_new):
+            """sets the new droplet mass and returns the droplet multiplicity (or zero)
+            to be added to the activated-and-growing, activating and deactivating
+            counts, respectively"""
+            mass_cr = formulae.particle_shape_and_density__volume_to_mass(
+                attributes.v_cr[drop]
+            )
+            mass_old = attributes.signed_water_mass[drop]
+            multiplicity = attributes.multiplicity[drop]
+            attributes.signed_water_mass[drop] = mass_new
+            return (
+                multiplicity if mass_new > mass_cr and mass_new > mass_old else 0,
+                multiplicity if mass_new > mass_cr > mass_old else 0,
+                multiplicity if mass_new < mass_cr < mass_old else 0,
+            )
+
+        return update_mass
+
+    @staticmethod
+    def make_apply_ml_new(*, jit_flags, update_mass):
+        @numba.njit(**jit_flags)
+        def apply_ml_new(attributes, cell_idx, mass_buffer):
+            """counterpart of `calculate_ml_new` taking the new droplet masses
+            from `mass_buffer` instead of solving for them"""
+            result = 0
+            n_activating = 0
+            n_deactivating = 0
+            n_activated_and_growing = 0
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
+                if attributes.signed_water_mass[drop] <= 0:
+                    continue
+                mass_new = mass_buffer[drop]
+                result += attributes.multiplicity[drop] * mass_new
+                activated_and_growing, activating, deactivating = update_mass(
+                    attributes, drop, mass_new
+                )
+                n_activated_and_growing += activated_and_growing
+                n_activating += activating
+                n_deactivating += deactivating
+            n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
+            return result, True, n_activating, n_deactivating, n_ripening, 0
+
+        return apply_ml_new
+
     # pylint disable=unused-argument
     def make_condensation_solver(
         self,
@@ -588,9 +1109,14 @@ class CondensationMethods(BackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
+        intra_cell_parallel=False,
+        equilibrium_cache_T_rtol=0,
+        batched_root_finding=False,
     ):
         return CondensationMethods.make_condensation_solver_impl(
             formulae=self.formulae_flattened,
+            organic_fraction_dependent=self.formulae.surface_tension.__name__
+            != "Constant",
             timestep=timestep,
             dt_range=dt_range,
             adaptive=adaptive,
@@ -598,11 +1124,14 @@ class CondensationMethods(BackendMethods):
             multiplier=multiplier,
             RH_rtol=RH_rtol,
             max_iters=max_iters,
+            intra_cell_parallel=intra_cell_parallel,
+            equilibrium_cache_T_rtol=equilibrium_cache_T_rtol,
+            batched_root_finding=batched_root_finding,
         )
 
     @staticmethod
     @lru_cache()
-    def make_condensation_solver_impl(
+    def make_condensation_solver_impl(  # pylint: disable=too-many-locals
         *,
         formulae,
         timestep,
@@ -612,21 +1141,43 @@ class CondensationMethods(BackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
+        intra_cell_parallel,
+        equilibrium_cache_T_rtol,
+        batched_root_finding,
+        organic_fraction_dependent,
     ):
+        """with `intra_cell_parallel`, the per-droplet solves and the reductions over
+        droplets within a cell are multi-threaded (while the substep-wise coupling
+        with cell thermodynamics remains sequential); with `batched_root_finding`,
+        the implicit-step problems are solved in batches (which requires a workspace
+        with `ROOT_FINDING_WORKSPACE_ROWS` rows of the size of the droplet storage)"""
         jit_flags = {
             **conf.JIT_FLAGS,
             **{"parallel": False, "cache": False, "fastmath": formulae.fastmath},
         }
+        droplet_loop_jit_flags = {**jit_flags, "parallel": intra_cell_parallel}
+        update_mass = CondensationMethods.make_update_mass(
+            formulae=formulae, jit_flags=jit_flags
+        )
 
         step_impl = CondensationMethods.make_step_impl(
             jit_flags=jit_flags,
             formulae=formulae,
-            calculate_ml_old=CondensationMethods.make_calculate_ml_old(jit_flags),
+            calculate_ml_old=CondensationMethods.make_calculate_ml_old(
+                droplet_loop_jit_flags
+            ),
             calculate_ml_new=CondensationMethods.make_calculate_ml_new(
-                jit_flags=jit_flags,
+                jit_flags=droplet_loop_jit_flags,
                 formulae=formulae,
                 max_iters=max_iters,
                 RH_rtol=RH_rtol,
+                update_mass=update_mass,
+                equilibrium_cache_T_rtol=equilibrium_cache_T_rtol,
+                batched=batched_root_finding,
+                organic_fraction_dependent=organic_fraction_dependent,
+            ),
+            apply_ml_new=CondensationMethods.make_apply_ml_new(
+                jit_flags=droplet_loop_jit_flags, update_mass=update_mass
             ),
         )
         step_fake = CondensationMethods.make_step_fake(jit_flags, step_impl)
@@ -657,7 +1208,14 @@ class CondensationMethods(BackendMethods):
             rtols,
             timestep,
             n_substeps,
+            trial_masses,
+            equilibrium_cache,
+            root_finding_workspace,
         ):
+            """if `trial_masses` is non-empty (two rows of the size of the droplet
+            storage), droplet masses from the accepted adaptivity trial are recorded
+            therein and reused in the first substep (and the trial is then not
+            included in the returned number of trial solves)"""
             step_impl_args = (
                 attributes,
                 cell_idx,
@@ -671,12 +1229,19 @@ class CondensationMethods(BackendMethods):
                 air_density,
                 air_dynamic_viscosity,
                 rtols.x,
+                equilibrium_cache,
+                root_finding_workspace,
             )
             success = True
+            n_trial_solves = 0
+            reused_slot = -1
             if adaptive:
-                n_substeps, success = adapt_substeps(
-                    step_impl_args, n_substeps, thd, rtols.thd
+                n_substeps, success, n_trial_solves, reused_slot = adapt_substeps(
+                    step_impl_args, n_substeps, thd, rtols.thd, trial_masses
                 )
+                if success and reused_slot >= 0 and trial_masses.shape[1] > 0:
+                    # the reused trial takes the place of the first substep solve
+                    n_trial_solves -= 1
             if success:
                 (
                     water_vapour_mixing_ratio,
@@ -684,11 +1249,22 @@ class CondensationMethods(BackendMethods):
                     n_activating,
                     n_deactivating,
                     n_ripening,
+                    n_equilibrium_skips,
                     RH_max,
                     success,
-                ) = step(step_impl_args, timestep, n_substeps)
+                ) = step(
+                    step_impl_args,
+                    timestep,
+                    n_substeps,
+                    (
+                        trial_masses[reused_slot]
+                        if reused_slot >= 0
+                        else trial_masses[0, :0]
+                    ),
+                )
             else:
-                n_activating, n_deactivating, n_ripening, RH_max = -1, -1, -1, -1
+                n_activating, n_deactivating, n_ripening = -1, -1, -1
+                n_equilibrium_skips, RH_max = -1, -1
             return (
                 success,
                 water_vapour_mixing_ratio,
@@ -697,6 +1273,8 @@ class CondensationMethods(BackendMethods):
                 n_activating,
                 n_deactivating,
                 n_ripening,
+                n_trial_solves,
+                n_equilibrium_skips,
                 RH_max,
             )
 
@@ -7,6 +7,7 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.atomic_operations import atomic_add
 
 
 # TODO #1524
@@ -119,6 +120,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
             temperature,
             rhod,
             thd,
+            cell_idx,
             signed_water_mass,
             saturation_ratio_ice,
             total_pressure,
@@ -128,7 +130,8 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
         ):
             latent_heat_sub = formulae.latent_heat_sublimation__ls(temperature)
             delta_rv = 0
-            for i, ksi in enumerate(multiplicity):
+            for i in cell_idx:
+                ksi = multiplicity[i]
                 if not formulae.trivia__unfrozen(signed_water_mass[i]):
                     mass_deposition_rate = mass_deposition_rate_per_droplet(
                         temperature=temperature,
@@ -172,64 +175,53 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
             return delta_rv, delta_thd
 
         @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
-        def body(  # pylint: disable=too-many-arguments
-            *,
+        def cell_body(  # pylint: disable=too-many-arguments
             adaptive,
+            n_substeps_prev,
+            cell_idx,
             multiplicity,
             signed_water_mass,
-            current_vapour_mixing_ratio,
-            current_dry_air_density,
-            current_dry_potential_temperature,
-            cell_volume,
+            vapour_mixing_ratio,
+            dry_air_density,
+            dry_potential_temperature,
+            rv_tendency,
+            thd_tendency,
+            rhod_tendency,
+            dry_air_mass_mean,
             time_step,
-            cell_id,
-            # to be modified
-            predicted_vapour_mixing_ratio,
-            predicted_dry_potential_temperature,
-            predicted_dry_air_density,
         ):
             """simplest adaptivity:
-            - global dt - no cell-wise logic (we don't have any test/example for it!)
-            - no mechanism to retain dt value over timesteps
+            - substep count doubled until halving the substep changes the ice
+              saturation ratio consistently, starting from a half of the count
+              found for the cell in the previous timestep
             - explicit Euler mass integration (vs. implicit in condensation)
+            returns the predicted vapour mixing ratio and dry potential temperature
+            and the number of substeps
             """
             # pylint: disable=too-many-locals
             n_substeps = 1
-            cid = cell_id[0]  # TODO #1524: add support for multi-cell environments
-
-            rv_tendency = (
-                predicted_vapour_mixing_ratio[cid] - current_vapour_mixing_ratio[cid]
-            ) / time_step
-            thd_tendency = (
-                predicted_dry_potential_temperature[cid]
-                - current_dry_potential_temperature[cid]
-            ) / time_step
-            rhod_tendency = (
-                predicted_dry_air_density[cid] - current_dry_air_density[cid]
-            ) / time_step
-            dry_air_mass_mean = (
-                cell_volume
-                * (predicted_dry_air_density[cid] + current_dry_air_density[cid])
-                / 2
-            )
-
             if adaptive:
-                n_substeps = 1 / multiplier
-                delta_rh_long = np.nan
+                n_substeps = max(1, n_substeps_prev // multiplier)
+                # the first trial, with a `multiplier` times longer substep,
+                # only provides the reference for the subsequent one
+                reference = True
+                delta_rh_long = 0.0
                 for burnout in range(fuse + 1):
                     if burnout == fuse:
                         assert False
                     sub_time_step = time_step / n_substeps
+                    if reference:
+                        sub_time_step *= multiplier
                     rhod = (
-                        current_dry_air_density[cid]
+                        dry_air_density
                         + rhod_tendency * (0.5 if midpoint else 1) * sub_time_step
                     )
                     rv = (
-                        current_vapour_mixing_ratio[cid]
+                        vapour_mixing_ratio
                         + rv_tendency * (0.5 if midpoint else 1) * sub_time_step
                     )
                     thd = (
-                        current_dry_potential_temperature[cid]
+                        dry_potential_temperature
                         + thd_tendency * (0.5 if midpoint else 1) * sub_time_step
                     )
 
@@ -245,6 +237,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                         temperature=temperature,
                         rhod=rhod,
                         thd=thd,
+                        cell_idx=cell_idx,
                         signed_water_mass=signed_water_mass,
                         saturation_ratio_ice=saturation_ratio_ice,
                         total_pressure=total_pressure,
@@ -261,7 +254,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                         - saturation_ratio_ice
                     )
                     if (
-                        n_substeps < 1
+                        reference
                         or rv < -delta_rv
                         or not formulae.trivia__within_tolerance(
                             abs(delta_rh_long - multiplier * delta_rh_short),
@@ -269,18 +262,19 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                             rel_tol_rh,
                         )
                     ):
+                        if not reference:
+                            n_substeps *= multiplier
+                        reference = False
                         delta_rh_long = delta_rh_short
-                        n_substeps *= multiplier
                     else:
                         break
             sub_time_step = time_step / n_substeps
 
-            rv = current_vapour_mixing_ratio[cid]
-            thd = current_dry_potential_temperature[cid]
-            rhod = current_dry_air_density[cid]
+            rv = vapour_mixing_ratio
+            thd = dry_potential_temperature
+            rhod = dry_air_density
 
-            assert n_substeps == int(n_substeps)
-            for _ in range(int(n_substeps)):
+            for _ in range(n_substeps):
                 rv += sub_time_step * rv_tendency * (0.5 if midpoint else 1)
                 thd += sub_time_step * thd_tendency * (0.5 if midpoint else 1)
                 rhod += sub_time_step * rhod_tendency * (0.5 if midpoint else 1)
@@ -297,6 +291,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                     temperature=temperature,
                     rhod=rhod,
                     thd=thd,
+                    cell_idx=cell_idx,
                     signed_water_mass=signed_water_mass,
                     saturation_ratio_ice=saturation_ratio_ice,
                     total_pressure=total_pressure,
@@ -313,8 +308,92 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                     rv += sub_time_step * rv_tendency / 2
                     rhod += sub_time_step * rhod_tendency / 2
 
-            predicted_dry_potential_temperature[cid] = thd
-            predicted_vapour_mixing_ratio[cid] = rv
+            return rv, thd, n_substeps
+
+        @numba.njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-arguments
+            *,
+            adaptive,
+            n_threads,
+            n_cell,
+            cell_start_arg,
+            idx,
+            cell_order,
+            cells_per_chunk,
+            multiplicity,
+            signed_water_mass,
+            current_vapour_mixing_ratio,
+            current_dry_air_density,
+            current_dry_potential_temperature,
+            cell_volume,
+            time_step,
+            # to be modified
+            n_substeps,
+            predicted_vapour_mixing_ratio,
+            predicted_dry_potential_temperature,
+            predicted_dry_air_density,
+        ):
+            """cells are processed in parallel, with `cells_per_chunk == 0`
+            statically assigned to threads in a round-robin fashion; otherwise,
+            threads pick consecutive chunks of `cell_order` from a shared
+            (atomically incremented) work-queue counter"""
+            next_chunk = np.zeros(1, dtype=np.int64)
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                i = np.int64(thread_id if cells_per_chunk == 0 else 0)
+                chunk_end = np.int64(0)
+                while True:
+                    if cells_per_chunk != 0 and i == chunk_end:
+                        i = np.int64(atomic_add(next_chunk, 0, 1) * cells_per_chunk)
+                        chunk_end = np.int64(min(i + cells_per_chunk, n_cell))
+                    if i >= n_cell:
+                        break
+                    cid = cell_order[i]
+                    i += n_threads if cells_per_chunk == 0 else 1
+                    cell_start = cell_start_arg[cid]
+                    cell_end = cell_start_arg[cid + 1]
+                    if cell_end == cell_start:
+                        continue
+
+                    (
+                        predicted_vapour_mixing_ratio[cid],
+                        predicted_dry_potential_temperature[cid],
+                        n_substeps[cid],
+                    ) = cell_body(
+                        adaptive=adaptive,
+                        n_substeps_prev=n_substeps[cid],
+                        cell_idx=idx[cell_start:cell_end],
+                        multiplicity=multiplicity,
+                        signed_water_mass=signed_water_mass,
+                        vapour_mixing_ratio=current_vapour_mixing_ratio[cid],
+                        dry_air_density=current_dry_air_density[cid],
+                        dry_potential_temperature=current_dry_potential_temperature[
+                            cid
+                        ],
+                        rv_tendency=(
+                            predicted_vapour_mixing_ratio[cid]
+                            - current_vapour_mixing_ratio[cid]
+                        )
+                        / time_step,
+                        thd_tendency=(
+                            predicted_dry_potential_temperature[cid]
+                            - current_dry_potential_temperature[cid]
+                        )
+                        / time_step,
+                        rhod_tendency=(
+                            predicted_dry_air_density[cid]
+                            - current_dry_air_density[cid]
+                        )
+                        / time_step,
+                        dry_air_mass_mean=(
+                            cell_volume
+                            * (
+                                predicted_dry_air_density[cid]
+                                + current_dry_air_density[cid]
+                            )
+                            / 2
+                        ),
+                        time_step=time_step,
+                    )
 
         return body
 
@@ -329,13 +408,30 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
         current_dry_potential_temperature,
         cell_volume,
         time_step,
-        cell_id,
+        cell_start_arg,
+        idx,
+        n_substeps,
+        cell_order,
+        dynamic_schedule,
         predicted_vapour_mixing_ratio,
         predicted_dry_potential_temperature,
         predicted_dry_air_density,
     ):
+        """with `dynamic_schedule`, cells are processed in the order given by
+        `cell_order`, split into chunks picked by threads as they become idle;
+        `n_substeps` holds the per-cell substep counts (retained between timesteps)"""
+        n_cell = len(n_substeps)
+        n_threads = min(numba.get_num_threads(), n_cell)
         self._deposition(
             adaptive=adaptive,
+            n_threads=n_threads,
+            n_cell=n_cell,
+            cell_start_arg=cell_start_arg.data,
+            idx=idx.data,
+            cell_order=cell_order,
+            cells_per_chunk=(
+                max(1, n_cell // (16 * n_threads)) if dynamic_schedule else 0
+            ),
             multiplicity=multiplicity.data,
             signed_water_mass=signed_water_mass.data,
             current_vapour_mixing_ratio=current_vapour_mixing_ratio.data,
@@ -343,7 +439,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
             current_dry_potential_temperature=current_dry_potential_temperature.data,
             cell_volume=cell_volume,
             time_step=time_step,
-            cell_id=cell_id.data,
+            n_substeps=n_substeps.data,
             predicted_vapour_mixing_ratio=predicted_vapour_mixing_ratio.data,
             predicted_dry_potential_temperature=predicted_dry_potential_temperature.data,
             predicted_dry_air_density=predicted_dry_air_density.data,
@@ -5,8 +5,10 @@ CPU implementation of backend methods for particle displacement (advection and s
 from functools import cached_property
 
 import numba
+import numpy as np
 
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.atomic_operations import atomic_add
 
 from ...impl_common.backend_methods import BackendMethods
 
@@ -23,6 +25,40 @@ def calculate_displacement_body_common(
     )
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def courant_pair_1d(courant, cell_origin, droplet, _):
+    _l = cell_origin[0, droplet]
+    return courant[_l], courant[_l + 1]
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def courant_pair_2d(courant, cell_origin, droplet, dim):
+    _l = (
+        cell_origin[0, droplet],
+        cell_origin[1, droplet],
+    )
+    _r = (
+        cell_origin[0, droplet] + 1 * (dim == 0),
+        cell_origin[1, droplet] + 1 * (dim == 1),
+    )
+    return courant[_l], courant[_r]
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def courant_pair_3d(courant, cell_origin, droplet, dim):
+    _l = (
+        cell_origin[0, droplet],
+        cell_origin[1, droplet],
+        cell_origin[2, droplet],
+    )
+    _r = (
+        cell_origin[0, droplet] + 1 * (dim == 0),
+        cell_origin[1, droplet] + 1 * (dim == 1),
+        cell_origin[2, droplet] + 1 * (dim == 2),
+    )
+    return courant[_l], courant[_r]
+
+
 class DisplacementMethods(BackendMethods):
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
@@ -107,47 +143,37 @@ class DisplacementMethods(BackendMethods):
                 n_substeps,
             )
 
+    @cached_property
+    def _calculate_displacement_bodies(self):
+        """parallel variants of the (serial as compiled) static bodies"""
+        return tuple(
+            numba.njit(**{**self.default_jit_flags, "cache": False})(body.py_func)
+            for body in (
+                DisplacementMethods.calculate_displacement_body_1d,
+                DisplacementMethods.calculate_displacement_body_2d,
+                DisplacementMethods.calculate_displacement_body_3d,
+            )
+        )
+
     def calculate_displacement(
         self, *, dim, displacement, courant, cell_origin, position_in_cell, n_substeps
     ):
         n_dims = len(courant.shape)
-        scheme = self.formulae.particle_advection.displacement
-        if n_dims == 1:
-            DisplacementMethods.calculate_displacement_body_1d(
-                dim,
-                scheme,
-                displacement.data,
-                courant.data,
-                cell_origin.data,
-                position_in_cell.data,
-                n_substeps,
-            )
-        elif n_dims == 2:
-            DisplacementMethods.calculate_displacement_body_2d(
-                dim,
-                scheme,
-                displacement.data,
-                courant.data,
-                cell_origin.data,
-                position_in_cell.data,
-                n_substeps,
-            )
-        elif n_dims == 3:
-            DisplacementMethods.calculate_displacement_body_3d(
-                dim,
-                scheme,
-                displacement.data,
-                courant.data,
-                cell_origin.data,
-                position_in_cell.data,
-                n_substeps,
-            )
-        else:
+        if n_dims not in (1, 2, 3):
             raise NotImplementedError()
+        self._calculate_displacement_bodies[n_dims - 1](
+            dim,
+            self.formulae.particle_advection.displacement,
+            displacement.data,
+            courant.data,
+            cell_origin.data,
+            position_in_cell.data,
+            n_substeps,
+        )
 
     @cached_property
     def _flag_precipitated_body(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @numba.njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
         def body(
             cell_origin,
@@ -162,7 +188,7 @@ class DisplacementMethods(BackendMethods):
         ):
             rainfall_mass = 0.0
             flag = len(idx)
-            for i in range(length):
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
                 position_within_column = (
                     cell_origin[-1, idx[i]] + position_in_cell[-1, idx[i]]
                 )
@@ -182,13 +208,13 @@ class DisplacementMethods(BackendMethods):
 
     @cached_property
     def _flag_out_of_column_body(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @numba.njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
         def body(
             cell_origin, position_in_cell, idx, length, healthy, domain_top_level_index
         ):
             flag = len(idx)
-            for i in range(length):
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
                 position_within_column = (
                     cell_origin[-1, idx[i]] + position_in_cell[-1, idx[i]]
                 )
@@ -247,3 +273,291 @@ class DisplacementMethods(BackendMethods):
             healthy.data,
             domain_top_level_index,
         )
+
+    @cached_property
+    def _displacement_step_body(self):
+        scheme = self.formulae.particle_advection.displacement
+
+        @numba.njit(**self.default_jit_flags)
+        # pylint: disable=too-many-arguments,too-many-locals
+        def body(
+            courant,
+            courant_pair,
+            n_substeps,
+            grid,
+            displacement,
+            cell_origin,
+            position_in_cell,
+            idx,
+            length,
+            healthy,
+            domain_top_level_index,
+            sedimentation,
+            relative_fall_velocity,
+            dt_over_dz,
+            water_mass,
+            multiplicity,
+            precipitation_counting_level_index,
+        ):
+            rainfall_mass = 0.0
+            flag = len(idx)
+            n_dims = len(grid)
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = idx[k]
+                for dim in range(n_dims):
+                    c_l, c_r = courant_pair(courant[dim], cell_origin, i, dim)
+                    displacement[dim, i] = scheme(
+                        position_in_cell[dim, i], c_l / n_substeps, c_r / n_substeps
+                    )
+                if sedimentation:
+                    displacement[-1, i] -= relative_fall_velocity[i] * dt_over_dz
+                for dim in range(n_dims):
+                    position_in_cell[dim, i] += displacement[dim, i]
+
+                position_within_column = cell_origin[-1, i] + position_in_cell[-1, i]
+                if (
+                    sedimentation
+                    and displacement[-1, i] < 0
+                    and position_within_column < precipitation_counting_level_index
+                ):
+                    rainfall_mass += abs(water_mass[i]) * multiplicity[i]
+                    idx[k] = flag
+                    healthy[0] = 0
+                elif (
+                    position_within_column < 0
+                    or position_within_column > domain_top_level_index
+                ):
+                    idx[k] = flag
+                    healthy[0] = 0
+
+                for dim in range(n_dims):
+                    floor_of_position = np.floor(position_in_cell[dim, i])
+                    cell_origin[dim, i] = (
+                        cell_origin[dim, i] + np.int64(floor_of_position)
+                    ) % grid[dim]
+                    position_in_cell[dim, i] -= floor_of_position
+            return rainfall_mass
+
+        return body
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def displacement_step(
+        self,
+        *,
+        courant,
+        n_substeps,
+        grid,
+        displacement,
+        cell_origin,
+        position_in_cell,
+        idx,
+        length,
+        healthy,
+        domain_top_level_index,
+        relative_fall_velocity,
+        dt_over_dz,
+        water_mass,
+        multiplicity,
+        precipitation_counting_level_index,
+    ) -> float:
+        """single-sweep equivalent of `calculate_displacement` (followed by the
+        sedimentation correction if `relative_fall_velocity` is given), position
+        update, `flag_precipitated` (with sedimentation), `flag_out_of_column` and
+        the cell-origin update with periodic wrapping; returns the precipitated
+        water mass"""
+        return self._displacement_step_body(
+            tuple(component.data for component in courant),
+            (courant_pair_1d, courant_pair_2d, courant_pair_3d)[len(grid) - 1],
+            n_substeps,
+            np.asarray(grid, dtype=np.int64),
+            displacement.data,
+            cell_origin.data,
+            position_in_cell.data,
+            idx.data,
+            length,
+            healthy.data,
+            domain_top_level_index,
+            relative_fall_velocity is not None,
+            (
+                displacement.data[0, :0]
+                if relative_fall_velocity is None
+                else relative_fall_velocity.data
+            ),
+            dt_over_dz,
+            water_mass.data,
+            multiplicity.data,
+            precipitation_counting_level_index,
+        )
+
+    @cached_property
+    def _displacement_with_per_cell_substeps_body(self):
+        scheme = self.formulae.particle_advection.displacement
+
+        @numba.njit(**self.default_jit_flags)
+        # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        def body(
+            courant,
+            courant_pair,
+            n_substeps,
+            n_substeps_max,
+            grid,
+            strides,
+            displacement,
+            cell_origin,
+            position_in_cell,
+            idx,
+            cell_start,
+            cell_order,
+            n_threads,
+            cells_per_chunk,
+            healthy,
+            domain_top_level_index,
+            sedimentation,
+            relative_fall_velocity,
+            dt_over_dz,
+            water_mass,
+            multiplicity,
+            precipitation_counting_level_index,
+        ):
+            """with `cells_per_chunk == 0`, cells are statically assigned to threads
+            in a round-robin fashion; otherwise, threads pick consecutive chunks of
+            `cell_order` from a shared (atomically incremented) work-queue counter;
+            substep lengths are tracked in units of `1 / n_substeps_max`"""
+            flag = len(idx)
+            n_dims = len(grid)
+            n_cell = len(cell_order)
+            next_chunk = np.zeros(1, dtype=np.int64)
+            rainfall_mass = np.zeros(n_threads)
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                j = np.int64(thread_id if cells_per_chunk == 0 else 0)
+                chunk_end = np.int64(0)
+                while True:
+                    if cells_per_chunk != 0 and j == chunk_end:
+                        j = np.int64(atomic_add(next_chunk, 0, 1) * cells_per_chunk)
+                        chunk_end = np.int64(min(j + cells_per_chunk, n_cell))
+                    if j >= n_cell:
+                        break
+                    cell_id = cell_order[j]
+                    j += n_threads if cells_per_chunk == 0 else 1
+                    for k in range(cell_start[cell_id], cell_start[cell_id + 1]):
+                        i = idx[k]
+                        remaining = n_substeps_max
+                        while remaining > 0:
+                            current_cell = 0
+                            for dim in range(n_dims):
+                                current_cell += cell_origin[dim, i] * strides[dim]
+                            step = min(
+                                n_substeps_max // n_substeps[current_cell], remaining
+                            )
+                            remaining -= step
+                            fraction = step / n_substeps_max
+
+                            for dim in range(n_dims):
+                                c_l, c_r = courant_pair(
+                                    courant[dim], cell_origin, i, dim
+                                )
+                                displacement[dim, i] = scheme(
+                                    position_in_cell[dim, i],
+                                    c_l * fraction,
+                                    c_r * fraction,
+                                )
+                            if sedimentation:
+                                displacement[-1, i] -= (
+                                    relative_fall_velocity[i] * dt_over_dz * fraction
+                                )
+                            for dim in range(n_dims):
+                                position_in_cell[dim, i] += displacement[dim, i]
+
+                            position_within_column = (
+                                cell_origin[-1, i] + position_in_cell[-1, i]
+                            )
+                            if (
+                                sedimentation
+                                and displacement[-1, i] < 0
+                                and position_within_column
+                                < precipitation_counting_level_index
+                            ):
+                                rainfall_mass[thread_id] += (
+                                    abs(water_mass[i]) * multiplicity[i]
+                                )
+                                idx[k] = flag
+                                healthy[0] = 0
+                                break
+                            if (
+                                position_within_column < 0
+                                or position_within_column > domain_top_level_index
+                            ):
+                                idx[k] = flag
+                                healthy[0] = 0
+                                break
+
+                            for dim in range(n_dims):
+                                floor_of_position = np.floor(position_in_cell[dim, i])
+                                cell_origin[dim, i] = (
+                                    cell_origin[dim, i] + np.int64(floor_of_position)
+                                ) % grid[dim]
+                                position_in_cell[dim, i] -= floor_of_position
+            return rainfall_mass.sum()
+
+        return body
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def displacement_with_per_cell_substeps(
+        self,
+        *,
+        courant,
+        n_substeps,
+        n_substeps_max,
+        grid,
+        strides,
+        displacement,
+        cell_origin,
+        position_in_cell,
+        idx,
+        cell_start,
+        cell_order,
+        dynamic_schedule,
+        healthy,
+        domain_top_level_index,
+        relative_fall_velocity,
+        dt_over_dz,
+        water_mass,
+        multiplicity,
+        precipitation_counting_level_index,
+    ) -> float:
+        """as `displacement_step` but covering the whole timestep, with each particle
+        taking `n_substeps[cell_id]` substeps per timestep while in a given cell
+        (`n_substeps` being powers of two dividing `n_substeps_max`); particles are
+        processed cell by cell, parallelised over cells in `cell_order` (with dynamic
+        scheduling if `dynamic_schedule` is set); `dt_over_dz` refers to the whole
+        timestep; returns the precipitated water mass"""
+        n_cell = len(cell_order)
+        n_threads = min(numba.get_num_threads(), n_cell)
+        return self._displacement_with_per_cell_substeps_body(
+            tuple(component.data for component in courant),
+            (courant_pair_1d, courant_pair_2d, courant_pair_3d)[len(grid) - 1],
+            n_substeps.data,
+            n_substeps_max,
+            np.asarray(grid, dtype=np.int64),
+            np.asarray(strides, dtype=np.int64).ravel(),
+            displacement.data,
+            cell_origin.data,
+            position_in_cell.data,
+            idx.data,
+            cell_start.data,
+            cell_order,
+            n_threads,
+            max(1, n_cell // (16 * n_threads)) if dynamic_schedule else 0,
+            healthy.data,
+            domain_top_level_index,
+            relative_fall_velocity is not None,
+            (
+                displacement.data[0, :0]
+                if relative_fall_velocity is None
+                else relative_fall_velocity.data
+            ),
+            dt_over_dz,
+            water_mass.data,
+            multiplicity.data,
+            precipitation_counting_level_index,
+        )
@@ -9,6 +9,7 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.active_particles import active_index, particle_id
 
 from ...impl_common.freezing_attributes import (
     SingularAttributes,
@@ -45,9 +46,9 @@ class FreezingMethods(BackendMethods):
         )
 
         @numba.njit(**self.default_jit_flags)
-        def body(attributes, cell, temperature):
-            n_sd = len(attributes.signed_water_mass)
-            for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
+        def body(attributes, cell, temperature, idx, length):
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 if frozen_and_above_freezing_point(
                     attributes.signed_water_mass[i], temperature[cell[i]]
                 ):
@@ -61,14 +62,17 @@ class FreezingMethods(BackendMethods):
         unfrozen_and_saturated = self.formulae.trivia.unfrozen_and_saturated
 
         @numba.njit(**self.default_jit_flags)
+        # pylint: disable=too-many-arguments
         def body(
             attributes,
             temperature,
             relative_humidity,
             cell,
+            idx,
+            length,
         ):
-            n_sd = len(attributes.freezing_temperature)
-            for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 if attributes.freezing_temperature[i] == 0:
                     continue
                 if (
@@ -96,9 +100,11 @@ class FreezingMethods(BackendMethods):
             cell,
             a_w_ice,
             relative_humidity,
+            idx,
+            length,
         ):
-            n_sd = len(attributes.signed_water_mass)
-            for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 if attributes.immersed_surface_area[i] == 0:
                     continue
                 cell_id = cell[i]
@@ -138,10 +144,11 @@ class FreezingMethods(BackendMethods):
             a_w_ice,
             temperature,
             relative_humidity_ice,
+            idx,
+            length,
         ):
-
-            n_sd = len(attributes.signed_water_mass)
-            for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 cell_id = cell[i]
                 if unfrozen_and_ice_saturated(
                     attributes.signed_water_mass[i], relative_humidity_ice[cell_id]
@@ -171,9 +178,10 @@ class FreezingMethods(BackendMethods):
         const = self.formulae.constants
 
         @numba.njit(**self.default_jit_flags)
-        def body(attributes, cell, temperature, relative_humidity_ice):
-            n_sd = len(attributes.signed_water_mass)
-            for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
+        # pylint: disable=too-many-arguments
+        def body(attributes, cell, temperature, relative_humidity_ice, idx, length):
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 cell_id = cell[i]
                 if unfrozen_and_ice_saturated(
                     attributes.signed_water_mass[i], relative_humidity_ice[cell_id]
@@ -196,6 +204,7 @@ class FreezingMethods(BackendMethods):
             ),
             cell.data,
             temperature.data,
+            *active_index(attributes.signed_water_mass),
         )
 
     def immersion_freezing_singular(
@@ -209,6 +218,7 @@ class FreezingMethods(BackendMethods):
             temperature.data,
             relative_humidity.data,
             cell.data,
+            *active_index(attributes.signed_water_mass),
         )
 
     def immersion_freezing_time_dependent(
@@ -231,6 +241,7 @@ class FreezingMethods(BackendMethods):
             cell.data,
             a_w_ice.data,
             relative_humidity.data,
+            *active_index(attributes.signed_water_mass),
         )
 
     def homogeneous_freezing_threshold(
@@ -248,6 +259,7 @@ class FreezingMethods(BackendMethods):
             cell.data,
             temperature.data,
             relative_humidity_ice.data,
+            *active_index(attributes.signed_water_mass),
         )
 
     def homogeneous_freezing_time_dependent(
@@ -272,6 +284,7 @@ class FreezingMethods(BackendMethods):
             a_w_ice.data,
             temperature.data,
             relative_humidity_ice.data,
+            *active_index(attributes.signed_water_mass),
         )
 
     @cached_property
@@ -279,8 +292,10 @@ class FreezingMethods(BackendMethods):
         ff = self.formulae_flattened
 
         @numba.njit(**{**self.default_jit_flags, "fastmath": False})
-        def body(data, cell_id, temperature, signed_water_mass):
-            for drop_id in numba.prange(len(data)):  # pylint: disable=not-an-iterable
+        # pylint: disable=too-many-arguments
+        def body(data, cell_id, temperature, signed_water_mass, idx, length):
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                drop_id = particle_id(idx, k)
                 if ff.trivia__unfrozen(signed_water_mass[drop_id]):
                     if data[drop_id] > 0:
                         data[drop_id] = np.nan
@@ -293,9 +308,12 @@ class FreezingMethods(BackendMethods):
     def record_freezing_temperatures(
         self, *, data, cell_id, temperature, signed_water_mass
     ):
+        idx, length = active_index(data)
         self._record_freezing_temperatures_body(
             data=data.data,
             cell_id=cell_id.data,
             temperature=temperature.data,
             signed_water_mass=signed_water_mass.data,
+            idx=idx,
+            length=length,
         )
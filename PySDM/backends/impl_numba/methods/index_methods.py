@@ -7,6 +7,9 @@ from functools import cached_property
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.storage import Storage
+
+SHUFFLE_BUCKET_SIZE = 256
 
 
 class IndexMethods(BackendMethods):
@@ -29,6 +32,91 @@ class IndexMethods(BackendMethods):
 
         return body
 
+    @cached_property
+    def shuffle_partial(self):
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def body(idx, length, u01, n_draws):
+            for i in range(n_draws):
+                j = i + int(u01[i] * (length - i))
+                idx[i], idx[j] = idx[j], idx[i]
+
+        return body
+
+    @cached_property
+    def _shuffle_global_parallel_body(self):
+        @numba.njit(**self.default_jit_flags)
+        # pylint: disable=too-many-arguments,too-many-locals
+        def body(idx, length, u01, tmp_idx, tmp_u01, bucket_start, chunk_bucket_start):
+            """random-key bucket shuffle: each element is sent to a bucket picked using
+            the integer part of `u01 * n_bucket` (stable, chunk-parallel scatter),
+            and then each bucket is Fisher-Yates-shuffled (in parallel) using
+            the fractional parts; the outcome does not depend on the number of chunks"""
+            n_bucket = len(bucket_start) - 1
+            n_chunk = chunk_bucket_start.shape[0]
+            for t in numba.prange(n_chunk):  # pylint: disable=not-an-iterable
+                chunk_bucket_start[t, :] = 0
+                for i in range(t * length // n_chunk, (t + 1) * length // n_chunk):
+                    bucket = min(int(u01[i] * n_bucket), n_bucket - 1)
+                    chunk_bucket_start[t, bucket] += 1
+
+            total = 0
+            for bucket in range(n_bucket):
+                bucket_start[bucket] = total
+                for t in range(n_chunk):
+                    count = chunk_bucket_start[t, bucket]
+                    chunk_bucket_start[t, bucket] = total
+                    total += count
+            bucket_start[n_bucket] = total
+
+            for t in numba.prange(n_chunk):  # pylint: disable=not-an-iterable
+                for i in range(t * length // n_chunk, (t + 1) * length // n_chunk):
+                    key = u01[i] * n_bucket
+                    bucket = min(int(key), n_bucket - 1)
+                    j = chunk_bucket_start[t, bucket]
+                    chunk_bucket_start[t, bucket] += 1
+                    tmp_idx[j] = idx[i]
+                    tmp_u01[j] = key - bucket
+
+            for bucket in numba.prange(n_bucket):  # pylint: disable=not-an-iterable
+                start = bucket_start[bucket]
+                for i in range(bucket_start[bucket + 1] - 1, start, -1):
+                    j = start + int(tmp_u01[i] * (i - start + 1))
+                    tmp_idx[i], tmp_idx[j] = tmp_idx[j], tmp_idx[i]
+
+        return body
+
+    def make_parallel_shuffler(self, idx_shape, idx_dtype):
+        backend = self
+
+        class ParallelShuffler:  # pylint: disable=too-few-public-methods
+            def __init__(self):
+                self.tmp_idx = Storage.empty(idx_shape, idx_dtype)
+                self.tmp_u01 = Storage.empty(idx_shape, float)
+                self.bucket_start = Storage.empty(
+                    max(1, idx_shape[0] // SHUFFLE_BUCKET_SIZE) + 1, dtype=int
+                )
+                self.chunk_bucket_start = Storage.empty(
+                    (
+                        numba.config.NUMBA_NUM_THREADS,  # pylint: disable=no-member
+                        len(self.bucket_start) - 1,
+                    ),
+                    dtype=int,
+                )
+
+            def __call__(self, idx, length, u01):
+                backend._shuffle_global_parallel_body(  # pylint: disable=protected-access
+                    idx.data,
+                    length,
+                    u01.data,
+                    self.tmp_idx.data,
+                    self.tmp_u01.data,
+                    self.bucket_start.data,
+                    self.chunk_bucket_start.data,
+                )
+                idx.data, self.tmp_idx.data = self.tmp_idx.data, idx.data
+
+        return ParallelShuffler()
+
     @cached_property
     def shuffle_local(self):
         @numba.njit(**self.default_jit_flags)
@@ -43,6 +131,67 @@ class IndexMethods(BackendMethods):
 
         return body
 
+    @cached_property
+    def _complete_permutation_body(self):
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def body(idx, length, keys):
+            keys[:] = 0
+            for i in range(length):
+                keys[idx[i]] = 1
+            j = length
+            for i in range(len(idx)):
+                if keys[i] == 0:
+                    idx[j] = i
+                    j += 1
+
+        return body
+
+    def complete_permutation(self, idx, length, keys):
+        """fills `idx` beyond `length` with the (ascending) indices of the slots
+        not referenced in `idx[:length]`, making `idx` a permutation of all slots"""
+        self._complete_permutation_body(idx.data, length, keys.data)
+
+    @cached_property
+    def _compact_index_body(self):
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def body(idx, length, keys):
+            keys[:] = 0
+            for i in range(length):
+                keys[idx[i]] = 1
+            live = 0
+            removed = length
+            for i in range(len(idx)):
+                if keys[i] == 0:
+                    idx[removed] = i
+                    removed += 1
+                else:
+                    idx[live] = i
+                    live += 1
+
+        return body
+
+    def compact_index(self, idx, length, keys):
+        """overwrites `idx` with a permutation of all slots listing first (in ascending
+        order) the ones referenced in `idx[:length]` and then the remaining ones"""
+        self._compact_index_body(idx.data, length, keys.data)
+
+    @cached_property
+    def _permute_in_place_body(self):
+        @numba.njit(**self.default_jit_flags)
+        def body(data, permutation, tmp):
+            for row in range(data.shape[0]):
+                for i in numba.prange(data.shape[1]):  # pylint: disable=not-an-iterable
+                    tmp[i] = data[row, permutation[i]]
+                for i in numba.prange(data.shape[1]):  # pylint: disable=not-an-iterable
+                    data[row, i] = tmp[i]
+
+        return body
+
+    def permute_in_place(self, data, permutation, tmp):
+        self._permute_in_place_body(
+            data.data.reshape((-1, data.shape[-1])), permutation.data, tmp.data
+        )
+
     @staticmethod
     def sort_by_key(idx, attr):
         idx.data[:] = attr.data.argsort(kind="stable")[::-1]
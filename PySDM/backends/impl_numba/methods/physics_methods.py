@@ -8,19 +8,23 @@ import numba
 from numba import prange
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.storage_utils import StorageBase
+from PySDM.backends.impl_numba.active_particles import active_index, particle_id
 
 
 class PhysicsMethods(BackendMethods):
     def __init__(self):
         BackendMethods.__init__(self)
+        self.__fused_elementwise_kernels = {}
 
     @cached_property
     def _critical_volume_body(self):
         ff = self.formulae_flattened
 
         @numba.njit(**self.default_jit_flags)
-        def body(*, v_cr, kappa, f_org, v_dry, v_wet, T, cell):
-            for i in prange(len(v_cr)):  # pylint: disable=not-an-iterable
+        def body(*, v_cr, kappa, f_org, v_dry, v_wet, T, cell, idx, length):
+            for k in prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 sigma = ff.surface_tension__sigma(
                     T[cell[i]], v_wet[i], v_dry[i], f_org[i]
                 )
@@ -36,6 +40,7 @@ class PhysicsMethods(BackendMethods):
         return body
 
     def critical_volume(self, *, v_cr, kappa, f_org, v_dry, v_wet, T, cell):
+        idx, length = active_index(v_cr)
         self._critical_volume_body(
             v_cr=v_cr.data,
             kappa=kappa.data,
@@ -44,6 +49,8 @@ class PhysicsMethods(BackendMethods):
             v_wet=v_wet.data,
             T=T.data,
             cell=cell.data,
+            idx=idx,
+            length=length,
         )
 
     @cached_property
@@ -109,28 +116,30 @@ class PhysicsMethods(BackendMethods):
         ff = self.formulae_flattened
 
         @numba.njit(**self.default_jit_flags)
-        def body(volume, mass):
-            for i in prange(volume.shape[0]):  # pylint: disable=not-an-iterable
+        def body(volume, mass, idx, length):
+            for k in prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 volume[i] = ff.particle_shape_and_density__mass_to_volume(mass[i])
 
         return body
 
     def volume_of_water_mass(self, volume, mass):
-        self._volume_of_mass_body(volume.data, mass.data)
+        self._volume_of_mass_body(volume.data, mass.data, *active_index(volume))
 
     @cached_property
     def _mass_of_volume_body(self):
         ff = self.formulae_flattened
 
         @numba.njit(**self.default_jit_flags)
-        def body(mass, volume):
-            for i in prange(volume.shape[0]):  # pylint: disable=not-an-iterable
+        def body(mass, volume, idx, length):
+            for k in prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 mass[i] = ff.particle_shape_and_density__volume_to_mass(volume[i])
 
         return body
 
     def mass_of_water_volume(self, mass, volume):
-        self._mass_of_volume_body(mass.data, volume.data)
+        self._mass_of_volume_body(mass.data, volume.data, *active_index(mass))
 
     @cached_property
     def __air_density_body(self):
@@ -176,8 +185,11 @@ class PhysicsMethods(BackendMethods):
             air_density,
             radius,
             velocity_wrt_air,
+            idx,
+            length,
         ):
-            for i in numba.prange(output.shape[0]):  # pylint: disable=not-an-iterable
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 output[i] = formulae.particle_shape_and_density__reynolds_number(
                     radius=radius[i],
                     velocity_wrt_air=velocity_wrt_air[i],
@@ -197,6 +209,7 @@ class PhysicsMethods(BackendMethods):
             density.data,
             radius.data,
             velocity_wrt_air.data,
+            *active_index(output),
         )
 
     @cached_property
@@ -211,3 +224,74 @@ class PhysicsMethods(BackendMethods):
 
     def explicit_euler(self, y, dt, dy_dt):
         self._explicit_euler_body(y.data, dt, dy_dt)
+
+    def make_fused_elementwise(self, expressions):
+        """returns a function evaluating a chain of element-wise expressions in a single
+        parallel loop; each expression is a `(function, operands, n_args)` tuple where
+        `function` is a scalar function of the operand values followed by `n_args` extra
+        arguments, and operands refer to outputs of preceding expressions (non-negative
+        indices) or to inputs (negative indices, -1 being the first input); the returned
+        function is called with lists of output and input storages and a list of
+        per-expression tuples of extra arguments (storages, arrays or scalars), and
+        iterates over the particles referenced in the index of the first output"""
+        if expressions not in self.__fused_elementwise_kernels:
+            self.__fused_elementwise_kernels[expressions] = (
+                self.__fused_elementwise_body(expressions)
+            )
+        body = self.__fused_elementwise_kernels[expressions]
+
+        def kernel(outputs, inputs, args):
+            body(
+                *active_index(outputs[0]),
+                *(output.data for output in outputs),
+                *(storage.data for storage in inputs),
+                *(
+                    arg.data if isinstance(arg, StorageBase) else arg
+                    for expression_args in args
+                    for arg in expression_args
+                ),
+            )
+
+        return kernel
+
+    @staticmethod
+    def fused_elementwise(kernel, outputs, inputs, args):
+        """performs a single sweep with a `kernel` from `make_fused_elementwise`"""
+        kernel(outputs, inputs, args)
+
+    def __fused_elementwise_body(self, expressions):
+        jit_flags = {**self.default_jit_flags, "parallel": False, "cache": False}
+        n_inputs = max(
+            (-operand for _, operands, _ in expressions for operand in operands),
+            default=0,
+        )
+        namespace = {"prange": prange, "particle_id": particle_id}
+        arguments = ["idx", "length"]
+        arguments += [f"out{k}" for k in range(len(expressions))]
+        arguments += [f"in{j}" for j in range(n_inputs)]
+        loop = []
+        for k, (function, operands, n_args) in enumerate(expressions):
+            namespace[f"f{k}"] = (
+                function
+                if isinstance(function, numba.core.dispatcher.Dispatcher)
+                else numba.njit(function, inline="always", **jit_flags)
+            )
+            extra = [f"arg{k}_{a}" for a in range(n_args)]
+            arguments += extra
+            values = [
+                f"v{operand}" if operand >= 0 else f"in{-1 - operand}[i]"
+                for operand in operands
+            ]
+            loop.append(f"        v{k} = f{k}({', '.join(values + extra)})")
+            loop.append(f"        out{k}[i] = v{k}")
+        source = (
+            f"def body({', '.join(arguments)}):\n"
+            + "    for j in prange(length):  # pylint: disable=not-an-iterable\n"
+            + "        i = particle_id(idx, j)\n"
+            + "\n".join(loop)
+            + "\n"
+        )
+        exec(source, namespace)  # pylint: disable=exec-used
+        return numba.njit(**{**self.default_jit_flags, "cache": False})(
+            namespace["body"]
+        )
@@ -7,12 +7,15 @@ import numba
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 
 
-class SeedingMethods(BackendMethods):  # pylint: disable=too-few-public-methods
+class SeedingMethods(BackendMethods):
     @cached_property
     def _seeding(self):
         @numba.njit(**{**self.default_jit_flags, "parallel": False})
         def body(  # pylint: disable=too-many-arguments
             idx,
+            length,
+            vacant,
+            n_vacant,
             multiplicity,
             extensive_attributes,
             seeded_particle_index,
@@ -20,29 +23,16 @@ class SeedingMethods(BackendMethods):  # pylint: disable=too-few-public-methods
             seeded_particle_extensive_attributes,
             number_of_super_particles_to_inject: int,
         ):
-            number_of_super_particles_already_injected = 0
-            # TODO #1387 start enumerating from the end of valid particle set
-            for i, mult in enumerate(multiplicity):
-                if (
-                    number_of_super_particles_to_inject
-                    == number_of_super_particles_already_injected
-                ):
-                    break
-                if mult == 0:
-                    idx[i] = -1
-                    s = seeded_particle_index[
-                        number_of_super_particles_already_injected
+            assert number_of_super_particles_to_inject <= n_vacant
+            for j in range(number_of_super_particles_to_inject):
+                i = vacant[n_vacant - 1 - j]
+                s = seeded_particle_index[j]
+                multiplicity[i] = seeded_particle_multiplicity[s]
+                for a in range(len(extensive_attributes)):
+                    extensive_attributes[a, i] = seeded_particle_extensive_attributes[
+                        a, s
                     ]
-                    number_of_super_particles_already_injected += 1
-                    multiplicity[i] = seeded_particle_multiplicity[s]
-                    for a in range(len(extensive_attributes)):
-                        extensive_attributes[a, i] = (
-                            seeded_particle_extensive_attributes[a, s]
-                        )
-            assert (
-                number_of_super_particles_to_inject
-                == number_of_super_particles_already_injected
-            )
+                idx[length + j] = i
 
         return body
 
@@ -50,6 +40,8 @@ class SeedingMethods(BackendMethods):  # pylint: disable=too-few-public-methods
         self,
         *,
         idx,
+        vacant,
+        n_vacant,
         multiplicity,
         extensive_attributes,
         seeded_particle_index,
@@ -57,8 +49,14 @@ class SeedingMethods(BackendMethods):  # pylint: disable=too-few-public-methods
         seeded_particle_extensive_attributes,
         number_of_super_particles_to_inject: int,
     ):
+        """pops `number_of_super_particles_to_inject` slots from the top of the stack
+        of vacant slots (`vacant[:n_vacant]`), fills them with the seeds listed first
+        in `seeded_particle_index` and appends them to `idx[:len(idx)]`"""
         self._seeding(
             idx=idx.data,
+            length=len(idx),
+            vacant=vacant.data,
+            n_vacant=n_vacant,
             multiplicity=multiplicity.data,
             extensive_attributes=extensive_attributes.data,
             seeded_particle_index=seeded_particle_index.data,
@@ -66,3 +64,45 @@ class SeedingMethods(BackendMethods):  # pylint: disable=too-few-public-methods
             seeded_particle_extensive_attributes=seeded_particle_extensive_attributes.data,
             number_of_super_particles_to_inject=number_of_super_particles_to_inject,
         )
+
+    @cached_property
+    def _collect_vacant_slots_body(self):
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def body(multiplicity, vacant):
+            n_vacant = 0
+            for i in range(len(multiplicity) - 1, -1, -1):
+                if multiplicity[i] == 0:
+                    vacant[n_vacant] = i
+                    n_vacant += 1
+            return n_vacant
+
+        return body
+
+    def collect_vacant_slots(self, *, multiplicity, vacant) -> int:
+        """fills the stack of vacant slots with all slots of zero multiplicity
+        (lowest slot on top) and returns their number"""
+        return self._collect_vacant_slots_body(multiplicity.data, vacant.data)
+
+    @cached_property
+    def _push_vacant_slots_body(self):
+        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        def body(  # pylint: disable=too-many-arguments
+            multiplicity, idx, start, stop, vacant, n_vacant
+        ):
+            for i in range(stop - 1, start - 1, -1):
+                if idx[i] < len(idx) and multiplicity[idx[i]] == 0:
+                    vacant[n_vacant] = idx[i]
+                    n_vacant += 1
+            return n_vacant
+
+        return body
+
+    def push_vacant_slots(  # pylint: disable=too-many-arguments
+        self, *, multiplicity, idx, start, stop, vacant, n_vacant
+    ) -> int:
+        """pushes onto the stack of vacant slots the zero-multiplicity slots listed
+        in `idx[start:stop]` (i.e., the ones just removed by `remove_zero_n_or_flagged`,
+        flagged ones being skipped) and returns the new stack height"""
+        return self._push_vacant_slots_body(
+            multiplicity.data, idx.data, start, stop, vacant.data, n_vacant
+        )
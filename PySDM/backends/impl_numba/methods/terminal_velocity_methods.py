@@ -7,14 +7,17 @@ from functools import cached_property
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.active_particles import active_index, particle_id
 
 
 class TerminalVelocityMethods(BackendMethods):
     @cached_property
     def _interpolation_body(self):
         @numba.njit(**self.default_jit_flags)
-        def body(output, radius, factor, b, c):
-            for i in numba.prange(len(radius)):  # pylint: disable=not-an-iterable
+        # pylint: disable=too-many-arguments
+        def body(output, radius, factor, b, c, idx, length):
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 if radius[i] < 0:
                     output[i] = 0
                 else:
@@ -26,7 +29,7 @@ class TerminalVelocityMethods(BackendMethods):
 
     def interpolation(self, *, output, radius, factor, b, c):
         return self._interpolation_body(
-            output.data, radius.data, factor, b.data, c.data
+            output.data, radius.data, factor, b.data, c.data, *active_index(output)
         )
 
     @cached_property
@@ -34,20 +37,25 @@ class TerminalVelocityMethods(BackendMethods):
         v_term = self.formulae.terminal_velocity.v_term
 
         @numba.njit(**self.default_jit_flags)
-        def body(*, values, radius):
-            for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
+        def body(*, values, radius, idx, length):
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 values[i] = v_term(radius[i])
 
         return body
 
     def terminal_velocity(self, *, values, radius):
-        self._terminal_velocity_body(values=values, radius=radius)
+        idx, length = active_index(values)
+        self._terminal_velocity_body(
+            values=values.data, radius=radius.data, idx=idx, length=length
+        )
 
     @cached_property
     def _power_series_body(self):
         @numba.njit(**self.default_jit_flags)
-        def body(*, values, radius, num_terms, prefactors, powers):
-            for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
+        def body(*, values, radius, num_terms, prefactors, powers, idx, length):
+            for k in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = particle_id(idx, k)
                 values[i] = 0.0
                 for j in range(num_terms):
                     values[i] = values[i] + prefactors[j] * radius[i] ** (powers[j] * 3)
@@ -55,10 +63,13 @@ class TerminalVelocityMethods(BackendMethods):
         return body
 
     def power_series(self, *, values, radius, num_terms, prefactors, powers):
+        idx, length = active_index(values)
         self._power_series_body(
-            values=values,
-            radius=radius,
+            values=values.data,
+            radius=radius.data,
             num_terms=num_terms,
             prefactors=prefactors,
             powers=powers,
+            idx=idx,
+            length=length,
         )
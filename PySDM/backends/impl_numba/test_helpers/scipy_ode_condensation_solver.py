@@ -30,10 +30,25 @@ def patch_particulator(particulator):
     particulator.condensation = types.MethodType(_condensation, particulator)
 
 
-def _condensation(
-    particulator, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order
+def _condensation(  # pylint: disable=unused-argument
+    particulator,
+    *,
+    rtol_x,
+    rtol_thd,
+    counters,
+    trial_masses,
+    equilibrium_cache,
+    root_finding_workspace,
+    RH_max,
+    success,
+    cell_order,
+    dynamic_schedule,
+    intra_cell_parallel,
+    thread_busy_time,
 ):
-    func = Numba._condensation
+    func = Numba._make_condensation(
+        cell_parallel=False, timed=thread_busy_time is not None
+    )
     if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
         func = func.py_func
     func(
@@ -57,7 +72,9 @@ def _condensation(
             water_vapour_mixing_ratio=particulator.environment[
                 "water_vapour_mixing_ratio"
             ].data,
-            dv_mean=particulator.environment.dv,
+            dv_mean=np.broadcast_to(
+                particulator.environment.dv, (particulator.mesh.n_cell,)
+            ),
             prhod=particulator.environment.get_predicted("rhod").data,
             pthd=particulator.environment.get_predicted("thd").data,
             predicted_water_vapour_mixing_ratio=particulator.environment.get_predicted(
@@ -78,8 +95,20 @@ def _condensation(
             n_activating=counters["n_activating"],
             n_deactivating=counters["n_deactivating"],
             n_ripening=counters["n_ripening"],
+            n_trial_solves=counters["n_trial_solves"],
+            n_equilibrium_skips=counters["n_equilibrium_skips"],
+        ),
+        trial_masses=trial_masses.data,
+        equilibrium_cache=equilibrium_cache.data,
+        root_finding_workspace=(
+            root_finding_workspace[0].data,
+            root_finding_workspace[1].data,
         ),
         cell_order=cell_order,
+        cells_per_chunk=0,
+        thread_busy_time=(
+            np.empty(0) if thread_busy_time is None else thread_busy_time.data
+        ),
         RH_max=RH_max.data,
         success=success.data,
     )
@@ -237,6 +266,9 @@ def _make_solve(formulae):  # pylint: disable=too-many-statements,too-many-local
         rtols,
         timestep,
         n_substeps,
+        trial_masses,
+        equilibrium_cache,
+        root_finding_workspace,
     ):
         n_sd_in_cell = len(cell_idx)
         y0 = np.empty(n_sd_in_cell + idx_x)
@@ -304,6 +336,8 @@ def _make_solve(formulae):  # pylint: disable=too-many-statements,too-many-local
             1,
             1,
             1,
+            0,
+            0,
             np.nan,
         )
 
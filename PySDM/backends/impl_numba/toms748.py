@@ -5,11 +5,15 @@ libcloudph++ version (GPL) which in turn was based on Boost implementation
 (Copyright John Maddock 2006 http://www.boost.org/LICENSE_1_0.txt)
 
 https://github.com/igfuw/libcloudphxx/blob/master/include/libcloudph%2B%2B/common/detail/toms748.hpp
+
+`toms748_solve_batch` advances multiple problems in lockstep (one function evaluation
+per problem per sweep) yielding results identical to those of `toms748_solve`
 """
 
 from sys import float_info
 
 import numba
+import numpy as np
 from numpy import nan
 
 from PySDM.backends.impl_numba.conf import JIT_FLAGS
@@ -20,8 +24,9 @@ float_info_max = float_info.max
 float_info_min = float_info.min
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False, "cache": False}})
-def bracket(f, args, a, b, c, fa, fb):
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+def bracket_point(a, b, c):
+    """adjusts the trial point `c` to lie within the (a, b) bracket"""
     tol = float_info_epsilon * 2
     if (b - a) < 2 * tol * a:
         c = a + (b - a) / 2
@@ -29,7 +34,12 @@ def bracket(f, args, a, b, c, fa, fb):
         c = a + abs(a) * tol
     elif c >= b - abs(b) * tol:
         c = b - abs(a) * tol
-    fc = f(c, *args)
+    return c
+
+
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+def bracket_update(a, b, c, fa, fb, fc):
+    """narrows the (a, b) bracket given the function value `fc` at `c`"""
     if fc == 0:
         a = c
         fa = 0
@@ -49,6 +59,13 @@ def bracket(f, args, a, b, c, fa, fb):
     return a, b, fa, fb, d, fd
 
 
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False, "cache": False}})
+def bracket(f, args, a, b, c, fa, fb):
+    c = bracket_point(a, b, c)
+    fc = f(c, *args)
+    return bracket_update(a, b, c, fa, fb, fc)
+
+
 @numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
 def safe_div(num, denom, r):
     if abs(denom) < 1:
@@ -106,6 +123,20 @@ def cubic_interpolate(a, b, d, e, fa, fb, fd, fe):
     return c
 
 
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+def close_values(fa, fb, fd, fe):
+    """checks if any two of the function values are too close for cubic interpolation"""
+    min_diff = float_info_min * 32
+    return (
+        abs(fa - fb) < min_diff
+        or abs(fa - fd) < min_diff
+        or abs(fa - fe) < min_diff
+        or abs(fb - fd) < min_diff
+        or abs(fb - fe) < min_diff
+        or abs(fd - fe) < min_diff
+    )
+
+
 @numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
 def tol_check(a, b, rtol, within_tolerance):
     return within_tolerance(abs(a - b), min(abs(a), abs(b)), rtol)
@@ -152,15 +183,7 @@ def toms748_solve(f, args, ax, bx, fax, fbx, rtol, max_iter, within_tolerance):
     while count > 0 and fa != 0 and not tol_check(a, b, rtol, within_tolerance):
         a0 = a
         b0 = b
-        min_diff = float_info_min * 32
-        prof = (
-            abs(fa - fb) < min_diff
-            or abs(fa - fd) < min_diff
-            or abs(fa - fe) < min_diff
-            or abs(fb - fd) < min_diff
-            or abs(fb - fe) < min_diff
-            or abs(fd - fe) < min_diff
-        )
+        prof = close_values(fa, fb, fd, fe)
         if prof:
             c = quadratic_interpolate(a, b, d, fa, fb, fd, 2)
         else:
@@ -171,14 +194,7 @@ def toms748_solve(f, args, ax, bx, fax, fbx, rtol, max_iter, within_tolerance):
         if count == 1 or fa == 0 or tol_check(a, b, rtol, within_tolerance):
             count -= 1
             break
-        prof = (
-            abs(fa - fb) < min_diff
-            or abs(fa - fd) < min_diff
-            or abs(fa - fe) < min_diff
-            or abs(fb - fd) < min_diff
-            or abs(fb - fe) < min_diff
-            or abs(fd - fe) < min_diff
-        )
+        prof = close_values(fa, fb, fd, fe)
         if prof:
             c = quadratic_interpolate(a, b, d, fa, fb, fd, 3)
         else:
@@ -215,3 +231,218 @@ def toms748_solve(f, args, ax, bx, fax, fbx, rtol, max_iter, within_tolerance):
     elif fb == 0:
         a = b
     return (a + b) / 2, max_iter
+
+
+BATCH_SIZE = 128
+""" default number of problems advanced in lockstep by `toms748_solve_batch` (callers
+split larger sets of problems into batches of this size, e.g. across threads) """
+
+# stages of the TOMS 748 iteration, each involving a single function evaluation
+(
+    _SECANT,
+    _QUADRATIC,
+    _LOOP_INTERPOLATE,
+    _LOOP_REINTERPOLATE,
+    _LOOP_DOUBLE_SECANT,
+    _LOOP_BISECT,
+    _DONE,
+) = range(7)
+
+
+# rows of the workspace of `toms748_solve_batch`
+(
+    _A,
+    _B,
+    _FA,
+    _FB,
+    _C,
+    _FC,
+    _D,
+    _FD,
+    _E,
+    _FE,
+    _A0,
+    _B0,
+) = range(12)
+(_COUNT, _STAGE, _ACTIVE) = range(3)
+TOMS748_WORKSPACE_ROWS = (12, 3)
+
+
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+def toms748_batch_workspace(size):
+    """returns the (float and integer) arrays for `toms748_solve_batch` problems
+    with ids below `size` (can be reused across calls and shared by concurrent
+    calls for disjoint sets of problems)"""
+    return (
+        np.empty((TOMS748_WORKSPACE_ROWS[0], size)),
+        np.empty((TOMS748_WORKSPACE_ROWS[1], size), dtype=np.int64),
+    )
+
+
+@numba.njit(**{**JIT_FLAGS, **{"parallel": False, "cache": False}})
+def toms748_solve_batch(
+    f,
+    args,
+    problems,
+    ax,
+    bx,
+    fax,
+    fbx,
+    rtol,
+    max_iter,
+    within_tolerance,
+    x,
+    iters,
+    workspace,
+):
+    """batched counterpart of `toms748_solve` for problems `f(x, i, *args) = 0`
+    with `i` in `problems` (brackets and iteration limits given in arrays `ax`, `bx`,
+    `fax`, `fbx`, `max_iter` indexed with `i`, problems with `max_iter[i] <= 0` being
+    skipped); all unconverged problems are advanced in lockstep: in each sweep, trial
+    points are picked for all active problems, then the function is evaluated for all
+    of them in a single loop, and then the brackets are narrowed and converged problems
+    compacted out of the list of active ones; roots and iteration counts (-1 marking
+    invalid brackets) are stored in `x[i]` and `iters[i]`, matching those from
+    `toms748_solve` calls for each problem; the iteration state is kept in columns `i`
+    of the `workspace` (see `toms748_batch_workspace`), hence nothing is allocated"""
+    mu = 0.5
+    a = workspace[0][_A]
+    b = workspace[0][_B]
+    fa = workspace[0][_FA]
+    fb = workspace[0][_FB]
+    c = workspace[0][_C]
+    fc = workspace[0][_FC]
+    d = workspace[0][_D]
+    fd = workspace[0][_FD]
+    e = workspace[0][_E]
+    fe = workspace[0][_FE]
+    a0 = workspace[0][_A0]
+    b0 = workspace[0][_B0]
+    count = workspace[1][_COUNT]
+    stage = workspace[1][_STAGE]
+    # the list of active problems is kept in the columns of the given ones
+    # (k-th entry in column `problems[k]`)
+    active = workspace[1][_ACTIVE]
+
+    n_active = 0
+    for i in problems:
+        if max_iter[i] <= 0:
+            continue
+        a[i] = ax[i]
+        b[i] = bx[i]
+        fa[i] = fax[i]
+        fb[i] = fbx[i]
+        fd[i] = 1e5
+        e[i] = 1e5
+        fe[i] = 1e5
+        count[i] = max_iter[i]
+        stage[i] = _SECANT
+        if not a[i] < b[i]:
+            x[i], iters[i] = warn(
+                "TOMS748 problem: not a < b", __file__, return_value=(nan, -1)
+            )
+        elif tol_check(a[i], b[i], rtol, within_tolerance) or fa[i] == 0 or fb[i] == 0:
+            if fa[i] == 0:
+                b[i] = a[i]
+            elif fb[i] == 0:
+                a[i] = b[i]
+            x[i] = (a[i] + b[i]) / 2
+            iters[i] = 0
+        elif not fa[i] * fb[i] < 0:
+            x[i], iters[i] = warn(
+                "TOMS748 problem: not fa * fb < 0", __file__, return_value=(nan, -1)
+            )
+        else:
+            active[problems[n_active]] = i
+            n_active += 1
+
+    while n_active > 0:
+        for k in range(n_active):
+            i = active[problems[k]]
+            if stage[i] == _SECANT:
+                c[i] = secant_interpolate(a[i], b[i], fa[i], fb[i])
+            elif stage[i] == _QUADRATIC:
+                c[i] = quadratic_interpolate(a[i], b[i], d[i], fa[i], fb[i], fd[i], 2)
+                e[i] = d[i]
+                fe[i] = fd[i]
+            elif stage[i] == _LOOP_INTERPOLATE:
+                a0[i] = a[i]
+                b0[i] = b[i]
+                if close_values(fa[i], fb[i], fd[i], fe[i]):
+                    c[i] = quadratic_interpolate(
+                        a[i], b[i], d[i], fa[i], fb[i], fd[i], 2
+                    )
+                else:
+                    c[i] = cubic_interpolate(
+                        a[i], b[i], d[i], e[i], fa[i], fb[i], fd[i], fe[i]
+                    )
+                e[i] = d[i]
+                fe[i] = fd[i]
+            elif stage[i] == _LOOP_REINTERPOLATE:
+                if close_values(fa[i], fb[i], fd[i], fe[i]):
+                    c[i] = quadratic_interpolate(
+                        a[i], b[i], d[i], fa[i], fb[i], fd[i], 3
+                    )
+                else:
+                    c[i] = cubic_interpolate(
+                        a[i], b[i], d[i], e[i], fa[i], fb[i], fd[i], fe[i]
+                    )
+            elif stage[i] == _LOOP_DOUBLE_SECANT:
+                if abs(fa[i]) < abs(fb[i]):
+                    u = a[i]
+                    fu = fa[i]
+                else:
+                    u = b[i]
+                    fu = fb[i]
+                c[i] = u - 2 * (fu / (fb[i] - fa[i])) * (b[i] - a[i])
+                if abs(c[i] - u) > (b[i] - a[i]) / 2:
+                    c[i] = a[i] + (b[i] - a[i]) / 2
+                e[i] = d[i]
+                fe[i] = fd[i]
+            else:
+                c[i] = a[i] + (b[i] - a[i]) / 2
+                e[i] = d[i]
+                fe[i] = fd[i]
+            c[i] = bracket_point(a[i], b[i], c[i])
+
+        for k in range(n_active):
+            i = active[problems[k]]
+            fc[i] = f(c[i], i, *args)
+
+        n_still_active = 0
+        for k in range(n_active):
+            i = active[problems[k]]
+            a[i], b[i], fa[i], fb[i], d[i], fd[i] = bracket_update(
+                a[i], b[i], c[i], fa[i], fb[i], fc[i]
+            )
+            converged = fa[i] == 0 or tol_check(a[i], b[i], rtol, within_tolerance)
+            if stage[i] in (_SECANT, _QUADRATIC, _LOOP_BISECT):
+                count[i] -= 1
+                stage[i] = (
+                    _DONE
+                    if count[i] <= 0 or converged
+                    else _QUADRATIC if stage[i] == _SECANT else _LOOP_INTERPOLATE
+                )
+            elif count[i] == 1 or converged:
+                count[i] -= 1
+                stage[i] = _DONE
+            elif stage[i] == _LOOP_DOUBLE_SECANT:
+                stage[i] = (
+                    _LOOP_INTERPOLATE
+                    if (b[i] - a[i]) < mu * (b0[i] - a0[i])
+                    else _LOOP_BISECT
+                )
+            else:
+                stage[i] += 1
+
+            if stage[i] == _DONE:
+                iters[i] = max_iter[i] - count[i]
+                if fa[i] == 0:
+                    b[i] = a[i]
+                elif fb[i] == 0:
+                    a[i] = b[i]
+                x[i] = (a[i] + b[i]) / 2
+            else:
+                active[problems[n_still_active]] = i
+                n_still_active += 1
+        n_active = n_still_active
@@ -715,6 +715,13 @@ class CollisionsMethods(
             i = len(dt_left)
         return cell_start[i]
 
+    # pylint: disable=unused-argument
+    def adaptive_sdm_schedule(
+        self, *, cell_idx, dt_left, active_cells, removed_cells, n_active
+    ):
+        cell_idx.sort_by_key(dt_left)
+        return n_active
+
     # pylint: disable=unused-argument
     @nice_thrust(**NICE_THRUST_FLAGS)
     def scale_prob_for_adaptive_sdm_gamma(
@@ -866,6 +873,10 @@ class CollisionsMethods(
             ),
         )
 
+    @staticmethod
+    def fused_collision_coalescence(**_):
+        raise NotImplementedError("fused collision step not available on GPU")
+
     @nice_thrust(**NICE_THRUST_FLAGS)
     def compute_gamma(
         self,
@@ -907,6 +918,8 @@ class CollisionsMethods(
     def normalize(
         self, *, prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv
     ):
+        if not isinstance(dv, (int, float)):
+            raise NotImplementedError("cell-wise dv not supported on GPU")
         n_cell = cell_start.shape[0] - 1
         device_dt_div_dv = self._get_floating_point(timestep / dv)
         self.__normalize_body_0.launch_n(
@@ -412,7 +412,13 @@ class CondensationMethods(
         rtol_thd,
         timestep,
         counters,
+        trial_masses,  # pylint: disable=unused-argument
+        equilibrium_cache,  # pylint: disable=unused-argument
+        root_finding_workspace,  # pylint: disable=unused-argument
         cell_order,
+        dynamic_schedule,
+        intra_cell_parallel,
+        thread_busy_time,
         RH_max,
         success,
         cell_id,
@@ -421,9 +427,13 @@ class CondensationMethods(
         air_dynamic_viscosity,
     ):
         assert solver is None
+        if not isinstance(dv, (int, float)):
+            raise NotImplementedError("cell-wise dv not supported on GPU")
 
         if self.adaptive:
             counters["n_substeps"][:] = 1  # TODO #527
+        counters["n_trial_solves"][:] = 0
+        counters["n_equilibrium_skips"][:] = 0
 
         n_substeps = counters["n_substeps"][0]
 
@@ -516,7 +526,11 @@ class CondensationMethods(
         multiplier,
         RH_rtol,
         max_iters,
+        intra_cell_parallel=False,  # pylint: disable=unused-argument
+        equilibrium_cache_T_rtol=0,  # pylint: disable=unused-argument
+        batched_root_finding=False,  # pylint: disable=unused-argument
     ):
+        # note: droplet-wise kernels are parallel regardless of `intra_cell_parallel`
         self.adaptive = adaptive
         self.RH_rtol = RH_rtol
         self.max_iters = max_iters
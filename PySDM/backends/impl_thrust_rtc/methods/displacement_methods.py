@@ -156,3 +156,11 @@ class DisplacementMethods(ThrustRTCBackendMethods):
         *, cell_origin, position_in_cell, idx, length, healthy, domain_top_level_index
     ):
         pass
+
+    @staticmethod
+    def displacement_step(**_):
+        raise NotImplementedError("fused displacement step not available on GPU")
+
+    @staticmethod
+    def displacement_with_per_cell_substeps(**_):
+        raise NotImplementedError("per-cell displacement substeps not available on GPU")
@@ -36,6 +36,109 @@ class IndexMethods(ThrustRTCBackendMethods):
 
         trtc.Sort_By_Key(u01.range(0, length), idx.range(0, length))
 
+    @cached_property
+    def __shuffle_partial_body(self):
+        return trtc.For(
+            param_names=("idx", "length", "u01", "n_draws"),
+            name_iter="k",
+            body="""
+            for (auto i = 0; i < n_draws; i += 1) {
+                auto j = i + (int64_t)(u01[i] * (length - i));
+                auto tmp = idx[i];
+                idx[i] = idx[j];
+                idx[j] = tmp;
+            }
+            """,
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def shuffle_partial(self, idx, length, u01, n_draws):
+        self.__shuffle_partial_body.launch_n(
+            1, (idx, trtc.DVInt64(length), u01, trtc.DVInt64(n_draws))
+        )
+
+    # pylint: disable=unused-argument
+    def make_parallel_shuffler(self, idx_shape, idx_dtype):
+        def shuffler(idx, length, u01):
+            self.shuffle_global(idx=idx.data, length=length, u01=u01.data)
+
+        return shuffler
+
+    @cached_property
+    def __complete_permutation_bodies(self):
+        return (
+            trtc.For(
+                param_names=("keys", "length"),
+                name_iter="i",
+                body="keys[i] = length + i;",
+            ),
+            trtc.For(
+                param_names=("keys", "idx"),
+                name_iter="i",
+                body="keys[idx[i]] = i;",
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def complete_permutation(self, idx, length, keys):
+        self.__complete_permutation_bodies[0].launch_n(
+            idx.shape[0], (keys.data, trtc.DVInt64(length))
+        )
+        self.__complete_permutation_bodies[1].launch_n(length, (keys.data, idx.data))
+        self.identity_index(idx.data)
+        trtc.Sort_By_Key(keys.data, idx.data)
+
+    @cached_property
+    def __compact_index_bodies(self):
+        return (
+            trtc.For(
+                param_names=("keys", "n_sd"),
+                name_iter="i",
+                body="keys[i] = n_sd + i;",
+            ),
+            trtc.For(
+                param_names=("keys", "idx"),
+                name_iter="i",
+                body="keys[idx[i]] = idx[i];",
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def compact_index(self, idx, length, keys):
+        self.__compact_index_bodies[0].launch_n(
+            idx.shape[0], (keys.data, trtc.DVInt64(idx.shape[0]))
+        )
+        self.__compact_index_bodies[1].launch_n(length, (keys.data, idx.data))
+        self.identity_index(idx.data)
+        trtc.Sort_By_Key(keys.data, idx.data)
+
+    @cached_property
+    def __permute_in_place_bodies(self):
+        return (
+            trtc.For(
+                param_names=("data", "permutation", "tmp", "offset"),
+                name_iter="i",
+                body="tmp[i] = data[offset + permutation[i]];",
+            ),
+            trtc.For(
+                param_names=("data", "tmp", "offset"),
+                name_iter="i",
+                body="data[offset + i] = tmp[i];",
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def permute_in_place(self, data, permutation, tmp):
+        n_sd = data.shape[-1]
+        for row in range(data.data.size() // n_sd):
+            offset = trtc.DVInt64(row * n_sd)
+            self.__permute_in_place_bodies[0].launch_n(
+                n_sd, (data.data, permutation.data, tmp.data, offset)
+            )
+            self.__permute_in_place_bodies[1].launch_n(
+                n_sd, (data.data, tmp.data, offset)
+            )
+
     @cached_property
     def __shuffle_local_body(self):
         return trtc.For(
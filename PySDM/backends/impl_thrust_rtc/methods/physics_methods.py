@@ -222,3 +222,13 @@ class PhysicsMethods(ThrustRTCBackendMethods):
                 velocity_wrt_air.data,
             ),
         )
+
+    @staticmethod
+    def make_fused_elementwise(_):
+        raise NotImplementedError("fused derived attributes not available on GPU")
+
+    @staticmethod
+    def fused_elementwise(
+        kernel, outputs, inputs, args
+    ):  # pylint: disable=unused-argument
+        raise NotImplementedError("fused derived attributes not available on GPU")
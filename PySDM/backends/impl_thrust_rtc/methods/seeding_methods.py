@@ -0,0 +1,88 @@
+"""
+GPU implementation of backend methods for bookkeeping of slots vacant for particle injections
+"""
+
+from functools import cached_property
+
+from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
+from PySDM.backends.impl_thrust_rtc.nice_thrust import nice_thrust
+
+from ..conf import trtc
+from ..methods.thrust_rtc_backend_methods import ThrustRTCBackendMethods
+
+
+class SeedingMethods(ThrustRTCBackendMethods):
+    # note: the stack of vacant slots is ordered (lowest slot on top), hence
+    #       the single-threaded kernels below (mirroring the CPU ones)
+    @cached_property
+    def __collect_vacant_slots_body(self):
+        return trtc.For(
+            param_names=("multiplicity", "n_sd", "vacant", "n_vacant"),
+            name_iter="_",
+            body="""
+            for (auto i = n_sd - 1; i > -1; i -= 1) {
+                if (multiplicity[i] == 0) {
+                    vacant[n_vacant[0]] = i;
+                    n_vacant[0] += 1;
+                }
+            }
+            """,
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def collect_vacant_slots(self, *, multiplicity, vacant) -> int:
+        n_vacant = trtc.device_vector("int64_t", 1)
+        trtc.Fill(n_vacant, trtc.DVInt64(0))
+        self.__collect_vacant_slots_body.launch_n(
+            1,
+            (
+                multiplicity.data,
+                trtc.DVInt64(multiplicity.shape[0]),
+                vacant.data,
+                n_vacant,
+            ),
+        )
+        return int(n_vacant.to_host()[0])
+
+    @cached_property
+    def __push_vacant_slots_body(self):
+        return trtc.For(
+            param_names=(
+                "multiplicity",
+                "idx",
+                "n_sd",
+                "start",
+                "stop",
+                "vacant",
+                "n_vacant",
+            ),
+            name_iter="_",
+            body="""
+            for (auto i = stop - 1; i > start - 1; i -= 1) {
+                if (idx[i] < n_sd && multiplicity[idx[i]] == 0) {
+                    vacant[n_vacant[0]] = idx[i];
+                    n_vacant[0] += 1;
+                }
+            }
+            """,
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def push_vacant_slots(  # pylint: disable=too-many-arguments
+        self, *, multiplicity, idx, start, stop, vacant, n_vacant
+    ) -> int:
+        new_n_vacant = trtc.device_vector("int64_t", 1)
+        trtc.Fill(new_n_vacant, trtc.DVInt64(n_vacant))
+        self.__push_vacant_slots_body.launch_n(
+            1,
+            (
+                multiplicity.data,
+                idx.data,
+                trtc.DVInt64(idx.shape[0]),
+                trtc.DVInt64(start),
+                trtc.DVInt64(stop),
+                vacant.data,
+                new_n_vacant,
+            ),
+        )
+        return int(new_n_vacant.to_host()[0])
@@ -129,7 +129,7 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
     def interpolation(self, *, output, radius, factor, b, c):
         factor_device = trtc.DVInt64(factor)
         self.__interpolation_body.launch_n(
-            len(radius), (output.data, radius.data, factor_device, b.data, c.data)
+            radius.shape[0], (output.data, radius.data, factor_device, b.data, c.data)
         )
 
     @cached_property
@@ -153,7 +153,8 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
         powers = self._get_floating_point(powers)
         num_terms = self._get_floating_point(num_terms)
         self.__power_series_body.launch_n(
-            values.size(), (values, radius, num_terms, prefactors, powers)
+            values.shape[0],
+            (values.data, radius.data, num_terms, prefactors, powers),
         )
 
     @cached_property
@@ -172,4 +173,6 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
 
     @nice_thrust(**NICE_THRUST_FLAGS)
     def terminal_velocity(self, *, values, radius):
-        self.__terminal_velocity_body.launch_n(n=values.size(), args=[values, radius])
+        self.__terminal_velocity_body.launch_n(
+            n=values.shape[0], args=[values.data, radius.data]
+        )
@@ -21,6 +21,7 @@ from PySDM.backends.impl_thrust_rtc.methods.isotope_methods import IsotopeMethod
 from PySDM.backends.impl_thrust_rtc.methods.moments_methods import MomentsMethods
 from PySDM.backends.impl_thrust_rtc.methods.pair_methods import PairMethods
 from PySDM.backends.impl_thrust_rtc.methods.physics_methods import PhysicsMethods
+from PySDM.backends.impl_thrust_rtc.methods.seeding_methods import SeedingMethods
 from PySDM.backends.impl_thrust_rtc.methods.terminal_velocity_methods import (
     TerminalVelocityMethods,
 )
@@ -29,7 +30,7 @@ from PySDM.backends.impl_thrust_rtc.storage import make_storage_class
 from PySDM.formulae import Formulae
 
 
-class ThrustRTC(  # pylint: disable=duplicate-code,too-many-ancestors
+class ThrustRTC(  # pylint: disable=duplicate-code,too-many-ancestors,abstract-method
     CollisionsMethods,
     PairMethods,
     IndexMethods,
@@ -40,6 +41,7 @@ class ThrustRTC(  # pylint: disable=duplicate-code,too-many-ancestors
     TerminalVelocityMethods,
     FreezingMethods,
     IsotopeMethods,
+    SeedingMethods,
 ):
     ENABLE = True
     Random = ImportedRandom
@@ -66,6 +68,7 @@ class ThrustRTC(  # pylint: disable=duplicate-code,too-many-ancestors
         DisplacementMethods.__init__(self)
         TerminalVelocityMethods.__init__(self)
         FreezingMethods.__init__(self)
+        SeedingMethods.__init__(self)
 
         trtc.Set_Kernel_Debug(debug)
         trtc.Set_Verbose(verbose)
@@ -7,14 +7,18 @@ import warnings
 
 import numpy as np
 
+from PySDM.attributes.impl import DerivedAttribute
 from PySDM.attributes.impl.attribute_registry import get_attribute_class
+from PySDM.attributes.impl.fused_derivation import FusedDerivation
 from PySDM.impl.particle_attributes_factory import ParticleAttributesFactory
+from PySDM.impl.profiler import Profiler
 from PySDM.impl.wall_timer import WallTimer
 from PySDM.initialisation.discretise_multiplicities import (  # TODO #324
     discretise_multiplicities,
 )
 from PySDM.particulator import Particulator
 from PySDM.physics.particle_shape_and_density import LiquidSpheres, MixedPhaseSpheres
+from PySDM.products.impl.moments_planner import MomentsPlanner
 
 
 def _warn_env_as_ctor_arg():
@@ -86,12 +90,36 @@ class Builder:
         else:
             self._resolve_attribute(attribute_name)
 
-    def build(
+    def build(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
         self,
         attributes: dict,
         products: tuple = (),
         int_caster=discretise_multiplicities,
+        shared_product_moments: bool = False,
+        physical_reordering_period: int = 0,
+        compaction_period: int = 0,
+        profiling: bool = False,
+        fused_derived_attributes: bool = False,
+        growable_storage: bool = False,
     ):
+        """if `shared_product_moments` is set, identical moment requests of moment-based
+        products are evaluated once per output step and shared through
+        `PySDM.products.impl.moments_planner.MomentsPlanner`;
+        if `physical_reordering_period` is non-zero, every that many timesteps the particle
+        attribute storages are permuted into cell order
+        (see `PySDM.impl.particle_attributes.ParticleAttributes.reorder_physically`);
+        if `compaction_period` is non-zero, every that many timesteps the super-droplets
+        in use are moved to the front of the storages
+        (see `PySDM.impl.particle_attributes.ParticleAttributes.compact`);
+        if `profiling` is set, backend-method calls and derived-attribute recalculations
+        are timed (see `PySDM.impl.profiler.Profiler`);
+        if `fused_derived_attributes` is set, chains of element-wise derived attributes
+        are computed in single sweeps (see
+        `PySDM.attributes.impl.fused_derivation.FusedDerivation`);
+        if `growable_storage` is set, seeding more super-droplets than there are vacant
+        slots doubles the number of slots instead of failing, and compaction halves it
+        when less than a quarter is in use (see `PySDM.particulator.Particulator.reserve`)
+        """
         assert self.particulator.environment is not None
 
         if "n" in attributes and "multiplicity" not in attributes:
@@ -130,6 +158,13 @@ class Builder:
         for key, dynamic in self.particulator.dynamics.items():
             self.particulator.dynamics[key] = dynamic.instantiate(builder=self)
 
+        self.particulator.physical_reordering_period = physical_reordering_period
+        self.particulator.compaction_period = compaction_period
+        self.particulator.growable_storage = growable_storage
+        if fused_derived_attributes:
+            self.particulator.fused_derivation = FusedDerivation(self.particulator)
+        if shared_product_moments:
+            self.particulator.moments_planner = MomentsPlanner(self.particulator)
         single_buffer_for_all_products = np.empty(self.particulator.mesh.grid)
         for product in products:
             self._register_product(product, single_buffer_for_all_products)
@@ -157,6 +192,13 @@ class Builder:
         for key in self.particulator.dynamics:
             self.particulator.timers[key] = WallTimer()
 
+        if profiling:
+            self.particulator.profiler = Profiler()
+            self.particulator.profiler.attach_backend(self.particulator.backend)
+            for attribute in self.req_attr.values():
+                if isinstance(attribute, DerivedAttribute):
+                    self.particulator.profiler.attach_attribute(attribute)
+
         if (attributes["multiplicity"] == 0).any():
             self.particulator.attributes.healthy = False
             self.particulator.attributes.sanitize()
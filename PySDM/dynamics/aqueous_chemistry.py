@@ -15,8 +15,14 @@ from PySDM.dynamics.impl.chemistry_utils import (
 )
 from PySDM.dynamics.impl import register_dynamic
 
-DEFAULTS = namedtuple("_", ("pH_min", "pH_max", "pH_rtol", "ionic_strength_threshold"))(
-    pH_min=-1.0, pH_max=14.0, pH_rtol=1e-6, ionic_strength_threshold=0.02 * M
+DEFAULTS = namedtuple(
+    "_", ("pH_min", "pH_max", "pH_rtol", "ionic_strength_threshold", "schedule")
+)(
+    pH_min=-1.0,
+    pH_max=14.0,
+    pH_rtol=1e-6,
+    ionic_strength_threshold=0.02 * M,
+    schedule="static",
 )
 
 
@@ -34,7 +40,11 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         pH_H_min=None,
         pH_H_max=None,
         pH_rtol=DEFAULTS.pH_rtol,
+        schedule: str = DEFAULTS.schedule,
     ):
+        """`schedule` controls how cells are assigned to threads in dissolution:
+        "static" (round-robin) or "dynamic" (chunks from a shared work queue,
+        cells with most super-droplets first), as in condensation"""
         self.environment_mole_fractions = environment_mole_fractions
         self.environment_mixing_ratios = {}
         self.particulator = None
@@ -49,6 +59,10 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         self.pH_H_max = pH_H_max
         self.pH_H_min = pH_H_min
         self.pH_rtol = pH_rtol
+        if schedule not in ("static", "dynamic"):
+            raise NotImplementedError()
+        self.schedule = schedule
+        self.cell_order = None
 
         self.kinetic_consts = {}
         self.equilibrium_consts = {}
@@ -63,7 +77,7 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         )
 
         for key, compound in GASEOUS_COMPOUNDS.items():
-            shape = (1,)
+            shape = (self.particulator.mesh.n_cell,)
             self.environment_mixing_ratios[compound] = np.full(
                 shape,
                 self.particulator.formulae.trivia.mole_fraction_2_mixing_ratio(
@@ -90,6 +104,11 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
             self.equilibrium_consts[key] = self.particulator.Storage.empty(
                 self.particulator.mesh.n_cell, dtype=float
             )
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+        self.cell_order = np.arange(self.particulator.mesh.n_cell)
+
+    def reallocate(self):
         for key in DIFFUSION_CONST:
             self.dissociation_factors[key] = self.particulator.Storage.empty(
                 self.particulator.n_sd, dtype=float
@@ -103,6 +122,11 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
             equilibrium_consts=self.equilibrium_consts,
             kinetic_consts=self.kinetic_consts,
         )
+        if self.schedule == "dynamic":
+            self.cell_order = np.argsort(
+                -np.diff(self.particulator.attributes.cell_start.to_ndarray()),
+                kind="stable",
+            )
         for _ in range(self.n_substep):
             self.particulator.chem_recalculate_drop_data(
                 equilibrium_consts=self.equilibrium_consts,
@@ -115,6 +139,8 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
                 environment_mixing_ratios=self.environment_mixing_ratios,
                 timestep=self.particulator.dt / self.n_substep,
                 do_chemistry_flag=self.do_chemistry_flag,
+                cell_order=self.cell_order,
+                dynamic_schedule=self.schedule == "dynamic",
             )
             self.particulator.chem_recalculate_drop_data(
                 equilibrium_consts=self.equilibrium_consts,
@@ -18,6 +18,10 @@ class Gaussian(
 
     def register(self, builder):
         super().register(builder)
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         self.sum_of_volumes = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
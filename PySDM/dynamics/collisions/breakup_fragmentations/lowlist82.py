@@ -18,12 +18,16 @@ class LowList1982Nf(VolumeBasedFragmentationFunction):
 
     def register(self, builder):
         super().register(builder)
-        self.sum_of_volumes = self.particulator.PairwiseStorage.empty(
-            self.particulator.n_sd // 2, dtype=float
-        )
         self.const = self.particulator.formulae.constants
         builder.request_attribute("radius")
         builder.request_attribute("relative fall velocity")
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
+        self.sum_of_volumes = self.particulator.PairwiseStorage.empty(
+            self.particulator.n_sd // 2, dtype=float
+        )
         for key in ("Sc", "St", "tmp", "tmp2", "CKE", "We", "W2", "ds", "dl", "dcoal"):
             self.arrays[key] = self.particulator.PairwiseStorage.empty(
                 self.particulator.n_sd // 2, dtype=float
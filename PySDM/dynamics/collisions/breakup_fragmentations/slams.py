@@ -32,6 +32,10 @@ class SLAMS(VolumeBasedFragmentationFunction):
 
     def register(self, builder):
         super().register(builder)
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         self.p_vec = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
@@ -21,15 +21,19 @@ class Straub2010Nf(VolumeBasedFragmentationFunction):
 
     def register(self, builder):
         super().register(builder)
+        self.const = self.particulator.formulae.constants
+        builder.request_attribute("radius")
+        builder.request_attribute("relative fall velocity")
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         self.max_size = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
         self.sum_of_volumes = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
-        self.const = self.particulator.formulae.constants
-        builder.request_attribute("radius")
-        builder.request_attribute("relative fall velocity")
         for key in ("Sc", "tmp", "tmp2", "CKE", "We", "gam", "CW", "ds"):
             self.arrays[key] = self.particulator.PairwiseStorage.empty(
                 self.particulator.n_sd // 2, dtype=float
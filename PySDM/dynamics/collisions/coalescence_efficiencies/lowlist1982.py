@@ -19,16 +19,20 @@ class LowList1982Ec:
 
     def register(self, builder):
         self.particulator = builder.particulator
+        self.const = self.particulator.formulae.constants
+        builder.request_attribute("radius")
+        builder.request_attribute("water mass")
+        builder.request_attribute("relative fall velocity")
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         self.max_size = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
         self.sum_of_masses = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
-        self.const = self.particulator.formulae.constants
-        builder.request_attribute("radius")
-        builder.request_attribute("water mass")
-        builder.request_attribute("relative fall velocity")
         for key in ("Sc", "St", "dS", "tmp", "tmp2", "CKE", "Et", "ds", "dl"):
             self.arrays[key] = self.particulator.PairwiseStorage.empty(
                 self.particulator.n_sd // 2, dtype=float
@@ -19,6 +19,10 @@ class Straub2010Ec:
         self.const = self.particulator.formulae.constants
         builder.request_attribute("volume")
         builder.request_attribute("relative fall velocity")
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         for key in ("Sc", "tmp", "tmp2", "We"):
             self.arrays[key] = self.particulator.PairwiseStorage.empty(
                 self.particulator.n_sd // 2, dtype=float
@@ -53,8 +53,14 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         dt_coal_range=DEFAULTS.dt_coal_range,
         enable_breakup: bool = True,
         warn_overflows: bool = True,
+        fused: bool = False,
     ):
+        """if `fused` is set, pairing, probability and gamma evaluation and coalescence
+        are done in a single per-cell pass (CPU backend only, coalescence only, for
+        kernels implementing `fused_kernel_args()`, i.e.: `Golovin`, `ConstantK`,
+        `Geometric` and `Hydrodynamic` and other Berry-parameterised ones)"""
         assert substeps == 1 or adaptive is False
+        assert not (fused and enable_breakup)
 
         self.particulator = None
 
@@ -78,6 +84,8 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.optimized_random = optimized_random
         self.__substeps = substeps
         self.adaptive = adaptive
+        self.fused = fused
+        self.dt_todo = None
         self.stats_n_substep = None
         self.stats_dt_min = None
         self.dt_coal_range = tuple(dt_coal_range)
@@ -91,6 +99,8 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.gamma = None
         self.is_first_in_pair = None
         self.dt_left = None
+        self.active_cells = None
+        self.removed_cells = None
 
         self.collision_rate = None
         self.collision_rate_deficit = None
@@ -116,17 +126,18 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             self.dt_coal_range = (self.dt_coal_range[0], self.particulator.dt)
         assert self.dt_coal_range[0] <= self.dt_coal_range[1]
 
-        empty_args_pairwise = {"shape": self.particulator.n_sd // 2, "dtype": float}
         empty_args_cellwise = {"shape": self.particulator.mesh.n_cell, "dtype": float}
-        self.kernel_temp = self.particulator.PairwiseStorage.empty(
-            **empty_args_pairwise
-        )
         self.norm_factor_temp = self.particulator.Storage.empty(**empty_args_cellwise)
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
 
-        self.gamma = self.particulator.PairwiseStorage.empty(**empty_args_pairwise)
-
-        self.is_first_in_pair = self.particulator.PairIndicator(self.particulator.n_sd)
         self.dt_left = self.particulator.Storage.empty(**empty_args_cellwise)
+        self.active_cells = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=int
+        )
+        self.removed_cells = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=int
+        )
 
         self.stats_n_substep = self.particulator.Storage.empty(
             self.particulator.mesh.n_cell, dtype=int
@@ -138,6 +149,14 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.rnd_opt_coll.register(builder)
         self.collision_kernel.register(builder)
 
+        if self.fused:
+            if not hasattr(self.collision_kernel, "fused_kernel_args"):
+                raise NotImplementedError(
+                    f"{type(self.collision_kernel).__name__} kernel"
+                    " not supported in the fused collision step"
+                )
+            self.dt_todo = self.particulator.Storage.empty(**empty_args_cellwise)
+
         if self.croupier is None:
             self.croupier = self.particulator.backend.default_croupier
 
@@ -148,6 +167,25 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         )
         self.coalescence_rate = self.particulator.Storage.from_ndarray(*counter_args)
 
+        if self.enable_breakup:
+            self.rnd_opt_proc.register(builder)
+            self.rnd_opt_frag.register(builder)
+            self.compute_coalescence_efficiency.register(builder)
+            self.compute_breakup_efficiency.register(builder)
+            self.compute_number_of_fragments.register(builder)
+            self.breakup_rate = self.particulator.Storage.from_ndarray(*counter_args)
+            self.breakup_rate_deficit = self.particulator.Storage.from_ndarray(
+                *counter_args
+            )
+
+    def reallocate(self):
+        """(re)allocates the buffers sized by the number of super-droplet slots"""
+        empty_args_pairwise = {"shape": self.particulator.n_sd // 2, "dtype": float}
+        self.kernel_temp = self.particulator.PairwiseStorage.empty(
+            **empty_args_pairwise
+        )
+        self.gamma = self.particulator.PairwiseStorage.empty(**empty_args_pairwise)
+        self.is_first_in_pair = self.particulator.PairIndicator(self.particulator.n_sd)
         if self.enable_breakup:
             self.n_fragment = self.particulator.PairwiseStorage.empty(
                 **empty_args_pairwise
@@ -161,15 +199,6 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             self.Eb_temp = self.particulator.PairwiseStorage.empty(
                 **empty_args_pairwise
             )
-            self.rnd_opt_proc.register(builder)
-            self.rnd_opt_frag.register(builder)
-            self.compute_coalescence_efficiency.register(builder)
-            self.compute_breakup_efficiency.register(builder)
-            self.compute_number_of_fragments.register(builder)
-            self.breakup_rate = self.particulator.Storage.from_ndarray(*counter_args)
-            self.breakup_rate_deficit = self.particulator.Storage.from_ndarray(
-                *counter_args
-            )
 
     def __call__(self):
         if self.enable:
@@ -178,9 +207,19 @@ class Collision:  # pylint: disable=too-many-instance-attributes
                     self.step()
             else:
                 self.dt_left[:] = self.particulator.dt
+                self.active_cells.upload(
+                    np.arange(self.particulator.mesh.n_cell)[::-1].copy()
+                )
+                n_active = self.particulator.mesh.n_cell
 
                 while self.particulator.attributes.get_working_length() != 0:
-                    self.particulator.attributes.cell_idx.sort_by_key(self.dt_left)
+                    n_active = self.particulator.backend.adaptive_sdm_schedule(
+                        cell_idx=self.particulator.attributes.cell_idx,
+                        dt_left=self.dt_left,
+                        active_cells=self.active_cells,
+                        removed_cells=self.removed_cells,
+                        n_active=n_active,
+                    )
                     self.step()
                     self.particulator.attributes.cut_working_length(
                         self.particulator.adaptive_sdm_end(self.dt_left)
@@ -196,6 +235,10 @@ class Collision:  # pylint: disable=too-many-instance-attributes
     def step(self):
         pairs_rand, rand = self.rnd_opt_coll.get_random_arrays()
 
+        if self.fused:
+            self.fused_step(pairs_rand, rand)
+            return
+
         self.toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
             self.is_first_in_pair, pairs_rand
         )
@@ -233,10 +276,36 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             max_multiplicity=self.max_multiplicity,
         )
 
+    def fused_step(self, pairs_rand, rand):
+        self.permutation(pairs_rand)
+        self.particulator.fused_collision_coalescence(
+            kernel_args=self.collision_kernel.fused_kernel_args(),
+            rand=rand,
+            adaptive=self.adaptive,
+            n_substeps=self.__substeps,
+            dt_left=self.dt_left,
+            dt_range=self.dt_coal_range,
+            dt_todo=self.dt_todo,
+            stats_n_substep=self.stats_n_substep,
+            stats_dt_min=self.stats_dt_min,
+            collision_rate=self.collision_rate,
+            collision_rate_deficit=self.collision_rate_deficit,
+            coalescence_rate=self.coalescence_rate,
+        )
+        if self.adaptive and self.stats_dt_min.amin() == self.dt_coal_range[0]:
+            warnings.warn("adaptive time-step reached dt_min")
+
+    def permutation(self, u01):
+        self.particulator.attributes.permutation(
+            u01,
+            local=self.croupier == "local",
+            parallel=self.croupier == "global_parallel",
+        )
+
     def toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
         self, is_first_in_pair, u01
     ):
-        self.particulator.attributes.permutation(u01, self.croupier == "local")
+        self.permutation(u01)
         is_first_in_pair.update(
             self.particulator.attributes.cell_start,
             self.particulator.attributes.cell_idx,
@@ -302,6 +371,7 @@ class Coalescence(Collision):
         substeps: int = DEFAULTS.substeps,
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
+        fused: bool = False,
     ):
         breakup_efficiency = ConstEb(Eb=0)
         fragmentation_function = AlwaysN(n=1)
@@ -316,6 +386,7 @@ class Coalescence(Collision):
             adaptive=adaptive,
             dt_coal_range=dt_coal_range,
             enable_breakup=False,
+            fused=fused,
         )
 
 
@@ -11,5 +11,9 @@ class ConstantK:
     def __call__(self, output, is_first_in_pair):
         output.fill(self.a)
 
+    def fused_kernel_args(self):
+        """see `PySDM.dynamics.collisions.collision.Collision` `fused` option"""
+        return {"kernel": "ConstantK", "params": (self.a,)}
+
     def register(self, builder):
         self.particulator = builder.particulator
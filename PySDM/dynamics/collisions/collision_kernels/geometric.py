@@ -20,3 +20,12 @@ class Geometric(Gravitational):
             self.particulator.attributes["relative fall velocity"], is_first_in_pair
         )
         output *= self.pair_tmp
+
+    def fused_kernel_args(self):
+        """see `PySDM.dynamics.collisions.collision.Collision` `fused` option"""
+        return {
+            "kernel": "Geometric",
+            "params": (const.PI * self.collection_efficiency,),
+            "x": self.particulator.attributes["radius"],
+            "v": self.particulator.attributes["relative fall velocity"],
+        }
@@ -15,6 +15,14 @@ class Golovin:
         output.sum(self.particulator.attributes["volume"], is_first_in_pair)
         output *= self.b
 
+    def fused_kernel_args(self):
+        """see `PySDM.dynamics.collisions.collision.Collision` `fused` option"""
+        return {
+            "kernel": "Golovin",
+            "params": (self.b,),
+            "x": self.particulator.attributes["volume"],
+        }
+
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("volume")
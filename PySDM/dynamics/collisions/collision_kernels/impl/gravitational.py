@@ -10,6 +10,10 @@ class Gravitational:  # pylint: disable=too-few-public-methods
         self.particulator = builder.particulator
         builder.request_attribute("radius")
         builder.request_attribute("relative fall velocity")
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         self.pair_tmp = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
@@ -28,3 +28,12 @@ class Parameterized(Gravitational):
             self.particulator.attributes["relative fall velocity"], is_first_in_pair
         )
         output *= self.pair_tmp
+
+    def fused_kernel_args(self):
+        """see `PySDM.dynamics.collisions.collision.Collision` `fused` option"""
+        return {
+            "kernel": "Parameterized",
+            "params": (*self.params, const.si.um),
+            "x": self.particulator.attributes["radius"],
+            "v": self.particulator.attributes["relative fall velocity"],
+        }
@@ -13,6 +13,10 @@ class SimpleGeometric:
         self.particulator = builder.particulator
         builder.request_attribute("radius")
         builder.request_attribute("area")
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         self.pair_tmp = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
@@ -7,6 +7,10 @@ from collections import namedtuple
 
 import numpy as np
 
+from PySDM.backends.impl_numba.methods.condensation_methods import (
+    EQUILIBRIUM_CACHE_ROWS,
+    ROOT_FINDING_WORKSPACE_ROWS,
+)
 from PySDM.physics import si
 from PySDM.dynamics.impl import register_dynamic
 
@@ -31,7 +35,35 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         schedule: str = DEFAULTS.schedule,
         max_iters: int = 16,
         update_thd: bool = True,
+        intra_cell_parallel: bool = False,
+        reuse_trial_solves: bool = False,
+        cache_equilibrium: bool = False,
+        equilibrium_cache_T_rtol: float = 1e-6,
+        time_threads: bool = False,
+        batched_root_finding: bool = False,
     ):
+        """if `intra_cell_parallel` is set, droplets within each cell are solved for
+        in parallel (CPU backend; intended for single-cell, e.g. parcel or box,
+        simulations with large numbers of super-droplets per cell; cells are then
+        processed one after another);
+        if `reuse_trial_solves` is set (with `adaptive`), droplet masses obtained in
+        the adaptivity trial of the accepted substep count are kept and used in the
+        first substep instead of solving for them again (CPU backend; the number of
+        trial solves per cell, excluding the reused one, is kept in the
+        `n_trial_solves` counter);
+        if `cache_equilibrium` is set, the equilibrium relative humidity of each droplet
+        is kept between timesteps and reused as long as the droplet mass, dry volume,
+        kappa and organic fraction are unchanged and the temperature is within
+        `equilibrium_cache_T_rtol`, with droplets found in equilibrium with
+        the ambient humidity skipped altogether (CPU backend; the number of
+        skipped droplet solves per cell is kept in the `n_equilibrium_skips`
+        counter);
+        if `time_threads` is set, the wall time spent by each thread is recorded
+        in `thread_busy_time` (CPU backend, NaN for unused threads);
+        if `batched_root_finding` is set, the implicit-step problems of droplets
+        within a cell are solved for in batches advanced in lockstep rather than
+        one after another, using a per-droplet workspace allocated upfront
+        (CPU backend)"""
         if adaptive and substeps != 1:
             raise ValueError(
                 "if specifying substeps count manually, adaptivity must be disabled"
@@ -54,8 +86,18 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         self.max_iters = max_iters
 
         self.cell_order = None
+        self.time_threads = time_threads
+        self.thread_busy_time = None
 
         self.update_thd = update_thd
+        self.intra_cell_parallel = intra_cell_parallel
+        self.reuse_trial_solves = reuse_trial_solves
+        self.trial_masses = None
+        self.cache_equilibrium = cache_equilibrium
+        self.equilibrium_cache_T_rtol = equilibrium_cache_T_rtol
+        self.equilibrium_cache = None
+        self.batched_root_finding = batched_root_finding
+        self.root_finding_workspace = None
 
     def register(self, builder):
         self.particulator = builder.particulator
@@ -67,13 +109,23 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
             multiplier=2,
             RH_rtol=1e-7,
             max_iters=self.max_iters,
+            intra_cell_parallel=self.intra_cell_parallel,
+            equilibrium_cache_T_rtol=self.equilibrium_cache_T_rtol,
+            batched_root_finding=self.batched_root_finding,
         )
         builder.request_attribute("critical volume")
         builder.request_attribute("kappa")
         builder.request_attribute("dry volume organic fraction")
         builder.request_attribute("Reynolds number")
 
-        for counter in ("n_substeps", "n_activating", "n_deactivating", "n_ripening"):
+        for counter in (
+            "n_substeps",
+            "n_activating",
+            "n_deactivating",
+            "n_ripening",
+            "n_trial_solves",
+            "n_equilibrium_skips",
+        ):
             self.counters[counter] = self.particulator.Storage.empty(
                 self.particulator.mesh.n_cell, dtype=int
             )
@@ -91,11 +143,48 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         )
         self.success[:] = False
         self.cell_order = np.arange(self.particulator.mesh.n_cell)
+        if self.time_threads:
+            # at most one thread per cell is used, unused entries are set to NaN
+            self.thread_busy_time = self.particulator.Storage.empty(
+                self.particulator.mesh.n_cell, dtype=float
+            )
+            self.thread_busy_time[:] = np.nan
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
+        self.trial_masses = self.particulator.Storage.from_ndarray(
+            np.full(
+                (2, self.particulator.n_sd if self.reuse_trial_solves else 0), np.nan
+            )
+        )
+        self.equilibrium_cache = self.particulator.Storage.from_ndarray(
+            np.zeros(
+                (
+                    EQUILIBRIUM_CACHE_ROWS,
+                    self.particulator.n_sd if self.cache_equilibrium else 0,
+                )
+            )
+        )
+        n_sd = self.particulator.n_sd if self.batched_root_finding else 0
+        self.root_finding_workspace = (
+            self.particulator.Storage.from_ndarray(
+                np.empty((ROOT_FINDING_WORKSPACE_ROWS[0], n_sd))
+            ),
+            self.particulator.Storage.from_ndarray(
+                np.empty((ROOT_FINDING_WORKSPACE_ROWS[1], n_sd), dtype=np.int64)
+            ),
+        )
 
     def __call__(self):
         if self.enable:
             if self.schedule == "dynamic":
-                self.cell_order = np.argsort(self.counters["n_substeps"])
+                # cost model: number of substeps (from previous step) times
+                # number of super-droplets; most expensive cells are queued first
+                cost = np.maximum(
+                    self.counters["n_substeps"].to_ndarray(), 1
+                ) * np.diff(self.particulator.attributes.cell_start.to_ndarray())
+                self.cell_order = np.argsort(-cost, kind="stable")
             elif self.schedule == "static":
                 pass
             else:
@@ -105,9 +194,15 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
                 rtol_x=self.rtol_x,
                 rtol_thd=self.rtol_thd,
                 counters=self.counters,
+                trial_masses=self.trial_masses,
+                equilibrium_cache=self.equilibrium_cache,
+                root_finding_workspace=self.root_finding_workspace,
                 RH_max=self.rh_max,
                 success=self.success,
                 cell_order=self.cell_order,
+                dynamic_schedule=self.schedule == "dynamic",
+                intra_cell_parallel=self.intra_cell_parallel,
+                thread_busy_time=self.thread_busy_time,
             )
             if not self.success.all():
                 raise RuntimeError("Condensation failed")
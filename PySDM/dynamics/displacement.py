@@ -13,7 +13,9 @@ import numpy as np
 
 from PySDM.dynamics.impl import register_dynamic
 
-DEFAULTS = namedtuple("_", ("rtol", "adaptive"))(rtol=1e-2, adaptive=True)
+DEFAULTS = namedtuple("_", ("rtol", "adaptive", "schedule"))(
+    rtol=1e-2, adaptive=True, schedule="dynamic"
+)
 
 
 @register_dynamic()
@@ -24,7 +26,20 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         precipitation_counting_level_index: int = 0,
         adaptive=DEFAULTS.adaptive,
         rtol=DEFAULTS.rtol,
+        fused: bool = False,
+        per_cell_substeps: bool = False,
+        schedule: str = DEFAULTS.schedule,
     ):  # pylint: disable=too-many-arguments
+        """if `fused` is set, each substep (displacement evaluation, position and
+        cell-origin updates and removal of particles leaving the domain) is done
+        in a single parallel sweep over particles (CPU backend only);
+        if `per_cell_substeps` is set (requires `adaptive`), the number of substeps
+        is chosen for each cell separately and each particle takes the substeps of
+        the cell it is currently in, with cells processed in parallel in the order
+        given by `schedule` (as in `PySDM.dynamics.condensation.Condensation`;
+        CPU backend only)"""
+        if per_cell_substeps and not adaptive:
+            raise ValueError("per-cell substepping requires adaptivity to be enabled")
         self.particulator = None
         self.enable_sedimentation = enable_sedimentation
         self.dimension = None
@@ -37,7 +52,12 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
 
         self.adaptive = adaptive
         self.rtol = rtol
+        self.fused = fused
+        self.per_cell_substeps = per_cell_substeps
+        self.schedule = schedule
         self._n_substeps = 1
+        self.n_substeps = None
+        self.cell_order = None
 
     def register(self, builder):
         builder.request_attribute("relative fall velocity")
@@ -65,6 +85,14 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
             self.particulator.Storage.from_ndarray(courant_field[i])
             for i in range(self.dimension)
         )
+        self.n_substeps = self.particulator.Storage.from_ndarray(
+            np.full(self.particulator.mesh.n_cell, self._n_substeps, dtype=np.int64)
+        )
+        self.cell_order = np.arange(self.particulator.mesh.n_cell)
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         self.displacement = self.particulator.Storage.from_ndarray(
             np.zeros((self.dimension, self.particulator.n_sd))
         )
@@ -76,7 +104,7 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         for i, component in enumerate(courant_field):
             self.courant[i].upload(component)
 
-        # note: to be improved, should make n_substeps variable in space as in cond/coal
+        # note: the global count is the maximum over cells of the per-cell counts
         if self.adaptive:
             error_estimate = self.rtol
             self._n_substeps = 0.5
@@ -96,6 +124,46 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
                             else 1 / (1 / max_abs_delta_courant - 1)
                         ),
                     )
+        if self.per_cell_substeps:
+            self.n_substeps.upload(
+                np.minimum(
+                    self.__n_substeps_per_cell(courant_field), self._n_substeps
+                ).ravel()
+            )
+        else:
+            self.n_substeps[:] = self._n_substeps
+
+    def __n_substeps_per_cell(self, courant_field):
+        """smallest power-of-two substep counts for which the error estimate
+        within each cell is below `rtol` (cells are bounded by the two faces
+        of each Courant-field component differenced along its axis)"""
+        max_abs_delta_courant = np.amax(
+            [
+                np.abs(np.diff(courant_component, axis=i))
+                for i, courant_component in enumerate(courant_field)
+            ],
+            axis=0,
+        )
+        n_substeps = np.ones(max_abs_delta_courant.shape, dtype=np.int64)
+        while True:
+            delta = max_abs_delta_courant / n_substeps
+            with np.errstate(divide="ignore"):
+                error_estimate = np.where(delta == 0, 0, 1 / (1 / delta - 1))
+            too_coarse = error_estimate >= self.rtol
+            if not too_coarse.any():
+                return n_substeps
+            n_substeps[too_coarse] *= 2
+
+    def __update_cell_order(self):
+        if self.schedule == "dynamic":
+            # cost model: number of substeps times number of super-droplets;
+            # most expensive cells are queued first
+            cost = self.n_substeps.to_ndarray() * np.diff(
+                self.particulator.attributes.cell_start.to_ndarray()
+            )
+            self.cell_order = np.argsort(-cost, kind="stable")
+        elif self.schedule != "static":
+            raise NotImplementedError()
 
     def __call__(self):
         # TIP: not need all array only [idx[:sd_num]]
@@ -103,20 +171,43 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         position_in_cell = self.particulator.attributes["position in cell"]
 
         self.precipitation_mass_in_last_step = 0.0
-        for _ in range(self._n_substeps):
-            self.calculate_displacement(
-                self.displacement, self.courant, cell_origin, position_in_cell
+        if self.per_cell_substeps:
+            self.__update_cell_order()
+            precipitation_mass = self.particulator.displacement_with_per_cell_substeps(
+                displacement=self.displacement,
+                courant=self.courant,
+                n_substeps=self.n_substeps,
+                n_substeps_max=self._n_substeps,
+                cell_order=self.cell_order,
+                dynamic_schedule=self.schedule == "dynamic",
+                sedimentation=self.enable_sedimentation,
+                precipitation_counting_level_index=self.precipitation_counting_level_index,
             )
-            self.update_position(position_in_cell, self.displacement)
-            if self.enable_sedimentation:
-                self.precipitation_mass_in_last_step += self.particulator.remove_precipitated(
-                    displacement=self.displacement,
-                    precipitation_counting_level_index=self.precipitation_counting_level_index,
+            self.precipitation_mass_in_last_step = precipitation_mass
+        else:
+            for _ in range(self._n_substeps):
+                if self.fused:
+                    self.precipitation_mass_in_last_step += self.particulator.displacement_step(
+                        displacement=self.displacement,
+                        courant=self.courant,
+                        n_substeps=self._n_substeps,
+                        sedimentation=self.enable_sedimentation,
+                        precipitation_counting_level_index=self.precipitation_counting_level_index,
+                    )
+                    continue
+                self.calculate_displacement(
+                    self.displacement, self.courant, cell_origin, position_in_cell
                 )
-            self.particulator.flag_out_of_column()
-            self.update_cell_origin(cell_origin, position_in_cell)
-            self.boundary_condition(cell_origin)
-            self.particulator.recalculate_cell_id()
+                self.update_position(position_in_cell, self.displacement)
+                if self.enable_sedimentation:
+                    self.precipitation_mass_in_last_step += self.particulator.remove_precipitated(
+                        displacement=self.displacement,
+                        precipitation_counting_level_index=self.precipitation_counting_level_index,
+                    )
+                self.particulator.flag_out_of_column()
+                self.update_cell_origin(cell_origin, position_in_cell)
+                self.boundary_condition(cell_origin)
+                self.particulator.recalculate_cell_id()
 
         for key in ("position in cell", "cell origin", "cell id"):
             self.particulator.attributes.mark_updated(key)
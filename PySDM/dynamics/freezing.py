@@ -6,6 +6,7 @@ and homogeneous freezing and thaw
 
 from typing import Optional
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.dynamics.impl.random_generator import make_random
 
 
 @register_dynamic()
@@ -67,12 +68,17 @@ class Freezing:  # pylint: disable=too-many-instance-attributes
             self.homogeneous_freezing == "time-dependent"
             or self.immersion_freezing == "time-dependent"
         ):
-            self.rand = self.particulator.Storage.empty(
-                self.particulator.n_sd, dtype=float
-            )
-            self.rng = self.particulator.Random(
-                self.particulator.n_sd, self.particulator.formulae.seed
-            )
+            self.reallocate()
+            self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
+        self.rand = self.particulator.Storage.empty(self.particulator.n_sd, dtype=float)
+        self.rng = make_random(
+            self.particulator,
+            self.rng,
+            self.particulator.n_sd,
+            self.particulator.formulae.seed,
+        )
 
     def __call__(self):
         if "Coalescence" in self.particulator.dynamics:
@@ -0,0 +1,14 @@
+"""
+helper for (re)creating random number generators sized by the number of super-droplet slots
+"""
+
+
+def make_random(particulator, current, size: int, seed: int):
+    """returns the `current` generator if it is large enough for `size` numbers,
+    otherwise a new one (seeded with an offset `seed` if replacing an existing one,
+    so that the stream of the previous generator is not replayed)"""
+    if current is None:
+        return particulator.Random(size, seed)
+    if current.size >= size:
+        return current
+    return particulator.Random(size, seed + size)
@@ -4,6 +4,8 @@ clever reuser of random numbers for use in adaptive coalescence
 
 import math
 
+from PySDM.dynamics.impl.random_generator import make_random
+
 
 class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
     def __init__(self, optimized_random, dt_min, seed):
@@ -18,6 +20,13 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
 
     def register(self, builder):
         self.particulator = builder.particulator
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
+        """(re)allocates the buffers sized by the number of super-droplet slots
+        (the generator is replaced only if too small, and then reseeded
+        with a size-dependent seed so that its stream is not replayed)"""
         shift = (
             math.ceil(self.particulator.dt / self.dt_min)
             if self.optimized_random
@@ -29,7 +38,10 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
         self.rand = self.particulator.Storage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
-        self.rnd = self.particulator.Random(self.particulator.n_sd + shift, self.seed)
+        self.rnd = make_random(
+            self.particulator, self.rnd, self.particulator.n_sd + shift, self.seed
+        )
+        self.substep = 0
 
     def reset(self):
         self.substep = 0
@@ -4,6 +4,8 @@ TODO #744
 
 import math
 
+from PySDM.dynamics.impl.random_generator import make_random
+
 
 class RandomGeneratorOptimizerNoPair:
     def __init__(self, optimized_random, dt_min, seed):
@@ -17,6 +19,10 @@ class RandomGeneratorOptimizerNoPair:
 
     def register(self, builder):
         self.particulator = builder.particulator
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         shift = (
             math.ceil(self.particulator.dt / self.dt_min)
             if self.optimized_random
@@ -25,7 +31,10 @@ class RandomGeneratorOptimizerNoPair:
         self.rand = self.particulator.Storage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
-        self.rnd = self.particulator.Random(self.particulator.n_sd + shift, self.seed)
+        self.rnd = make_random(
+            self.particulator, self.rnd, self.particulator.n_sd + shift, self.seed
+        )
+        self.substep = 0
 
     def reset(self):
         self.substep = 0
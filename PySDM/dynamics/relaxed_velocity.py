@@ -68,9 +68,14 @@ class RelaxedVelocity:  # pylint: disable=too-many-instance-attributes
             "square root of radius"
         )
 
+        self.reallocate()
+        self.particulator.capacity_observers.append(self)
+
+    def reallocate(self):
         self.tmp_momentum_diff = self.create_storage(self.particulator.n_sd)
         self.tmp_tau = self.create_storage(self.particulator.n_sd)
         self.tmp_scale = self.create_storage(self.particulator.n_sd)
+        self.tmp_tau_init = False
 
     def __call__(self):
         # calculate momentum difference
@@ -80,12 +80,9 @@ class Seeding:
             )
 
             if self.rnd is not None:
-                self.u01.urand(self.rnd)
-                # TODO #1387 make shuffle smarter
-                # e.g. don't need to shuffle if only one type of seed particle
-                # or if the number of super particles to inject
-                # is equal to the number of possible seeds
-                self.index.shuffle(self.u01)
+                u01 = self.u01[:number_of_super_particles_to_inject]
+                u01.urand(self.rnd)
+                self.index.shuffle(u01, n_draws=number_of_super_particles_to_inject)
             self.particulator.seeding(
                 seeded_particle_index=self.index,
                 number_of_super_particles_to_inject=number_of_super_particles_to_inject,
@@ -125,15 +125,33 @@ class GunnKinzer1949:  # pylint: disable=too-few-public-methods
         self.b = particulator.backend.Storage.from_ndarray(b)
 
     def __call__(self, output, radius):
+        self.validate(radius)
+        self.particulator.backend.interpolation(
+            output=output, radius=radius, factor=self.factor, b=self.a, c=self.b
+        )
+
+    def validate(self, radius):
         r_max = radius.amax()
         if r_max > self.maximum_radius:
             raise ValueError(
                 f"Radii can be interpolated up to {self.maximum_radius} m"
                 + f" (max value of {r_max} m within input data)"
             )
-        self.particulator.backend.interpolation(
-            output=output, radius=radius, factor=self.factor, b=self.a, c=self.b
-        )
+
+    @staticmethod
+    def elementwise(radius, factor, b, c):
+        """scalar counterpart of the backend `interpolation()` method
+        (yielding NaN beyond the table range, see `validate()`)"""
+        if radius < 0:
+            return 0.0
+        r_id = int(factor * radius)
+        if r_id >= len(b):
+            return np.nan
+        r_rest = ((factor * radius) % 1) / factor
+        return b[r_id] + r_rest * c[r_id]
+
+    def elementwise_args(self):
+        return self.factor, self.a, self.b
 
 
 class TpDependent:
@@ -9,6 +9,17 @@ class RogersYau:  # pylint: disable=too-few-public-methods
 
     def __call__(self, output, radius):
         self.particulator.backend.terminal_velocity(
-            values=output.data,
-            radius=radius.data,
+            values=output,
+            radius=radius,
         )
+
+    @property
+    def elementwise(self):
+        return self.particulator.formulae.terminal_velocity.v_term
+
+    @staticmethod
+    def elementwise_args():
+        return ()
+
+    def validate(self, _):
+        pass
@@ -1,14 +1,22 @@
 """basic water vapor deposition on ice"""
 
+import numpy as np
+
 from PySDM.dynamics.impl import register_dynamic
 
 
 @register_dynamic()
 class VapourDepositionOnIce:
-    def __init__(self, adaptive: bool = True):
-        """called by the user while building a particulator"""
+    def __init__(self, adaptive: bool = True, schedule: str = "dynamic"):
+        """called by the user while building a particulator;
+        with `schedule="dynamic"` cells are processed in the order of decreasing
+        cost (number of substeps in the previous timestep times number of
+        super-droplets), with `schedule="static"` in the order of cell ids"""
         self.particulator = None
         self.adaptive = adaptive
+        self.schedule = schedule
+        self.n_substeps = None
+        self.cell_order = None
 
     def register(self, *, builder):
         """called by the builder"""
@@ -16,6 +24,25 @@ class VapourDepositionOnIce:
         assert builder.formulae.particle_shape_and_density.supports_mixed_phase()
         builder.request_attribute("Reynolds number")
 
+        self.n_substeps = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=int
+        )
+        self.n_substeps[:] = 1 if not self.adaptive else -1
+        self.cell_order = np.arange(self.particulator.mesh.n_cell)
+
     def __call__(self):
         """called by the particulator during simulation"""
-        self.particulator.deposition(adaptive=self.adaptive)
+        if self.schedule == "dynamic":
+            cost = np.maximum(self.n_substeps.to_ndarray(), 1) * np.diff(
+                self.particulator.attributes.cell_start.to_ndarray()
+            )
+            self.cell_order = np.argsort(-cost, kind="stable")
+        elif self.schedule != "static":
+            raise NotImplementedError()
+
+        self.particulator.deposition(
+            adaptive=self.adaptive,
+            n_substeps=self.n_substeps,
+            cell_order=self.cell_order,
+            dynamic_schedule=self.schedule == "dynamic",
+        )
@@ -7,4 +7,5 @@ Classes representing particle environment:
 from .box import Box
 from .kinematic_1d import Kinematic1D
 from .kinematic_2d import Kinematic2D
+from .multi_parcel import MultiParcel
 from .parcel import Parcel
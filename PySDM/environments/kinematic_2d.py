@@ -36,7 +36,7 @@ class Kinematic2D(Moist):
     def dv(self):
         return self.mesh.dv
 
-    def init_attributes(
+    def init_attributes(  # pylint: disable=too-many-locals
         self,
         *,
         spatial_discretisation,
@@ -45,7 +45,11 @@ class Kinematic2D(Moist):
         rtol=default_rtol,
         n_sd=None,
         spectral_sampling=ConstantMultiplicity,
+        tabulated_equilibrium: bool = False,
     ):
+        """if `tabulated_equilibrium` is set, wet radii are interpolated from
+        a table of equilibrium radii (see
+        `PySDM.initialisation.hygroscopic_equilibrium.equilibrate_wet_radii`)"""
         super().sync()
         self.notify()
         n_sd = n_sd or self.particulator.n_sd
@@ -75,6 +79,7 @@ class Kinematic2D(Moist):
                     kappa_times_dry_volume=attributes["kappa times dry volume"],
                     rtol=rtol,
                     cell_id=attributes["cell id"],
+                    tabulated=tabulated_equilibrium,
                 )
             rhod = self["rhod"].to_ndarray()
             cell_id = attributes["cell id"]
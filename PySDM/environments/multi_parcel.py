@@ -0,0 +1,181 @@
+"""
+Ensemble of independent zero-dimensional adiabatic parcels, each represented
+ by one cell of a single particulator (for batching parameter sweeps)
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+from PySDM.environments.impl.moist import Moist
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.hygroscopic_equilibrium import (
+    default_rtol,
+    equilibrate_wet_radii,
+)
+from PySDM.environments.impl import register_environment
+
+
+@register_environment()
+class MultiParcel(Moist):  # pylint: disable=too-many-instance-attributes
+    """`PySDM.environments.parcel.Parcel` logic vectorised across `n_parcel` cells;
+    `mass_of_dry_air`, `p0`, `initial_water_vapour_mixing_ratio`, `T0` and `z0` can be
+    given as scalars or as arrays of length `n_parcel`, while `w` can be a scalar, an array
+    or a callable returning one of these for a given time"""
+
+    def __init__(
+        self,
+        *,
+        dt,
+        n_parcel: int,
+        mass_of_dry_air: Union[float, np.ndarray],
+        p0: Union[float, np.ndarray],
+        initial_water_vapour_mixing_ratio: Union[float, np.ndarray],
+        T0: Union[float, np.ndarray],
+        w: Union[float, np.ndarray, callable],
+        z0: Union[float, np.ndarray] = 0,
+        mixed_phase=False,
+        variables: Optional[List[str]] = None,
+    ):
+        variables = (variables or []) + ["rhod", "z"]
+        mesh = Mesh(grid=(n_parcel,), size=(n_parcel,))
+        super().__init__(dt, mesh, variables, mixed_phase=mixed_phase)
+
+        def per_parcel(value):
+            return np.broadcast_to(np.asarray(value, dtype=float), (n_parcel,)).copy()
+
+        self.p0 = per_parcel(p0)
+        self.initial_water_vapour_mixing_ratio = per_parcel(
+            initial_water_vapour_mixing_ratio
+        )
+        self.T0 = per_parcel(T0)
+        self.z0 = per_parcel(z0)
+        self.mass_of_dry_air = per_parcel(mass_of_dry_air)
+        self.w = (
+            (lambda t: per_parcel(w(t))) if callable(w) else lambda _: per_parcel(w)
+        )
+        self.delta_liquid_water_mixing_ratio = np.full(n_parcel, np.nan)
+
+    @property
+    def n_parcel(self):
+        return self.mesh.n_cell
+
+    @property
+    def dv(self):
+        rhod_mean = (
+            self.get_predicted("rhod").to_ndarray() + self["rhod"].to_ndarray()
+        ) / 2
+        return self.particulator.formulae.trivia.volume_of_density_mass(
+            rhod_mean, self.mass_of_dry_air
+        )
+
+    def register(self, builder):
+        formulae = builder.particulator.formulae
+        pd0 = formulae.trivia.p_d(self.p0, self.initial_water_vapour_mixing_ratio)
+        rhod0 = formulae.state_variable_triplet.rhod_of_pd_T(pd0, self.T0)
+        self.mesh.dv = formulae.trivia.volume_of_density_mass(
+            rhod0, self.mass_of_dry_air
+        )
+
+        Moist.register(self, builder)
+
+        self["water_vapour_mixing_ratio"].upload(self.initial_water_vapour_mixing_ratio)
+        self["thd"].upload(formulae.trivia.th_std(pd0, self.T0))
+        self["rhod"].upload(rhod0)
+        self["z"].upload(self.z0)
+
+        self._tmp["water_vapour_mixing_ratio"].upload(
+            self.initial_water_vapour_mixing_ratio
+        )
+        self.sync_parcel_vars()
+        Moist.sync(self)
+        self.notify()
+
+    def init_attributes(
+        self,
+        *,
+        n_in_dv: np.ndarray,
+        kappa: Union[float, np.ndarray],
+        r_dry: np.ndarray,
+        rtol=default_rtol,
+        include_dry_volume_in_attribute: bool = True,
+    ):
+        """`n_in_dv` and `r_dry` are expected to be of shape `(n_parcel, n_sd_per_parcel)`
+        (or `(n_sd_per_parcel,)` if all parcels share the same spectrum), `kappa` can
+        be a scalar or an array of length `n_parcel`; the particulator's `n_sd` is expected
+        to equal `n_parcel * n_sd_per_parcel`"""
+        shape = np.broadcast_shapes(np.shape(n_in_dv), np.shape(r_dry))
+        shape = (self.n_parcel, shape[-1])
+        r_dry = np.broadcast_to(r_dry, shape).ravel()
+        n_in_dv = np.broadcast_to(n_in_dv, shape).ravel()
+        kappa = np.broadcast_to(np.asarray(kappa)[..., None], shape).ravel()
+
+        attributes = {}
+        attributes["cell id"] = np.repeat(np.arange(self.n_parcel), shape[1])
+        dry_volume = self.particulator.formulae.trivia.volume(radius=r_dry)
+        attributes["kappa times dry volume"] = dry_volume * kappa
+        attributes["multiplicity"] = n_in_dv
+        r_wet = equilibrate_wet_radii(
+            r_dry=r_dry,
+            environment=self,
+            cell_id=attributes["cell id"],
+            kappa_times_dry_volume=attributes["kappa times dry volume"],
+            rtol=rtol,
+        )
+        attributes["volume"] = self.particulator.formulae.trivia.volume(radius=r_wet)
+        if include_dry_volume_in_attribute:
+            attributes["dry volume"] = dry_volume
+        return attributes
+
+    def advance_parcel_vars(self):
+        """compute new values of displacement, dry-air density and volume
+        (for all parcels at once), and write them to self._tmp and self.mesh.dv"""
+        dt = self.particulator.dt
+        formulae = self.particulator.formulae
+        T = self["T"].to_ndarray()
+        p = self["p"].to_ndarray()
+
+        dz_dt = self.w((self.particulator.n_steps + 1 / 2) * dt)  # "mid-point"
+        water_vapour_mixing_ratio = (
+            self["water_vapour_mixing_ratio"].to_ndarray()
+            - self.delta_liquid_water_mixing_ratio / 2
+        )
+
+        # derivative evaluated at p_old, T_old, mixrat_mid, w_mid
+        drho_dz = formulae.hydrostatics.drho_dz(
+            p=p,
+            T=T,
+            water_vapour_mixing_ratio=water_vapour_mixing_ratio,
+            lv=formulae.latent_heat_vapourisation.lv(T),
+            d_liquid_water_mixing_ratio__dz=(
+                self.delta_liquid_water_mixing_ratio / dz_dt / dt
+            ),
+        )
+        drhod_dz = drho_dz  # TODO #407
+
+        rhod = self["rhod"].to_ndarray()
+        self._tmp["z"].upload(self._tmp["z"].to_ndarray() + dt * dz_dt)
+        self._tmp["rhod"].upload(self._tmp["rhod"].to_ndarray() + dt * dz_dt * drhod_dz)
+
+        self.mesh.dv = formulae.trivia.volume_of_density_mass(
+            (self._tmp["rhod"].to_ndarray() + rhod) / 2, self.mass_of_dry_air
+        )
+
+    def get_thd(self):
+        return self["thd"]
+
+    def get_water_vapour_mixing_ratio(self):
+        return self["water_vapour_mixing_ratio"]
+
+    def sync_parcel_vars(self):
+        self.delta_liquid_water_mixing_ratio = (
+            self._tmp["water_vapour_mixing_ratio"].to_ndarray()
+            - self["water_vapour_mixing_ratio"].to_ndarray()
+        )
+        for var in self.variables:
+            self._tmp[var][:] = self[var][:]
+
+    def sync(self):
+        self.sync_parcel_vars()
+        self.advance_parcel_vars()
+        super().sync()
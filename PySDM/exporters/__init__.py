@@ -4,5 +4,6 @@ Exporters handling output to metadata-rich file formats incl. netCDF and VTK
 
 from .netcdf_exporter import NetCDFExporter
 from .netcdf_exporter_1d import NetCDFExporter_1d, readNetCDF_1d
+from .netcdf_streaming_exporter import NetCDFStreamingExporter
 from .vtk_exporter import VTKExporter
 from .vtk_exporter_1d import VTKExporter_1d
@@ -0,0 +1,233 @@
+"""
+streaming netCDF exporter appending products to chunked, optionally compressed
+ netCDF4/HDF5 variables as the simulation proceeds (with file I/O done in a background
+ thread), implemented using [netCDF4](https://pypi.org/project/netCDF4/)
+"""
+
+import numbers
+import queue
+import threading
+
+import numpy as np
+
+from PySDM.exporters.netcdf_exporter import DIM_SUFFIX
+
+SPATIAL_DIMENSIONS = {0: (), 1: ("Z",), 2: ("X", "Z")}
+
+
+class NetCDFStreamingExporter:  # pylint: disable=too-many-instance-attributes
+    """
+    Example of use:
+
+    with NetCDFStreamingExporter(particulator, filename="output.nc", output_interval=10):
+        particulator.run(steps=1000)
+
+    the exporter registers itself as a particulator observer, evaluates products every
+    `output_interval` steps (and upon construction, if it coincides with an output step)
+    and hands copies of their values to a writer thread; at most `max_queue_length`
+    output steps are kept in memory (if the writer lags behind, the simulation waits)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        particulator,
+        *,
+        filename,
+        output_interval: int = 1,
+        products=None,
+        settings=None,
+        compression="zlib",
+        complevel: int = 4,
+        chunk_length: int = 16,
+        max_queue_length: int = 4,
+        background: bool = True,
+    ):
+        import netCDF4  # pylint: disable=import-outside-toplevel
+
+        self._netCDF4 = netCDF4
+        self.particulator = particulator
+        self.filename = filename
+        self.output_interval = output_interval
+        self.products = tuple(products or particulator.products.keys())
+        self.compression = compression
+        self.complevel = complevel
+        self.chunk_length = chunk_length
+
+        mesh = particulator.mesh
+        self.__spatial = {
+            "labels": SPATIAL_DIMENSIONS[mesh.n_dims],
+            "grid": tuple(mesh.grid),
+            "size": tuple(mesh.size),
+            "squeeze": mesh.n_dims == 0,
+        }
+        self.__metadata = {}
+        for name in self.products:
+            product = particulator.products[name]
+            bins = getattr(product, "attr_bins_edges", None)
+            self.__metadata[name] = {
+                "unit": product.unit,
+                "bins": None if bins is None else bins.to_ndarray()[:-1],
+                "bins_unit": getattr(product, "attr_unit", None),
+            }
+        self.__settings = self.__attributes(settings)
+
+        self.__dataset = None
+        self.__vars = None
+        self.__index = 0
+        self.__error = None
+        self.__queue = None
+        self.__thread = None
+        if background:
+            self.__queue = queue.Queue(maxsize=max_queue_length)
+            self.__thread = threading.Thread(target=self.__writer_loop, daemon=True)
+            self.__thread.start()
+
+        # inserted (not appended) so that it is notified last, i.e. after the environment
+        particulator.observers.insert(0, self)
+        if particulator.n_steps % output_interval == 0:
+            self.export()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def notify(self):
+        if self.particulator.n_steps % self.output_interval == 0:
+            self.export()
+
+    def export(self):
+        """evaluates the products and queues (or, without a background thread, writes)
+        their values for the current timestep"""
+        self.__raise_writer_error()
+        values = {}
+        for name in self.products:
+            value = np.array(self.particulator.products[name].get(), copy=True)
+            if self.__spatial["squeeze"] and value.shape == self.__spatial["grid"]:
+                value = value.reshape(())
+            values[name] = value
+        record = (self.particulator.n_steps * self.particulator.dt, values)
+        if self.__queue is None:
+            self.__write(record)
+        else:
+            self.__queue.put(record)
+
+    def close(self):
+        """waits for the queued output to be written, closes the file and
+        deregisters the exporter from the particulator observers"""
+        if self in self.particulator.observers:
+            self.particulator.observers.remove(self)
+        if self.__thread is not None:
+            self.__queue.put(None)
+            self.__thread.join()
+            self.__thread = None
+        else:
+            self.__close_dataset()
+        self.__raise_writer_error()
+
+    def __raise_writer_error(self):
+        if self.__error is not None:
+            raise self.__error
+
+    def __writer_loop(self):
+        while True:
+            record = self.__queue.get()
+            if record is None:
+                break
+            if self.__error is None:
+                try:
+                    self.__write(record)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    self.__error = error
+        self.__close_dataset()
+
+    def __close_dataset(self):
+        if self.__dataset is not None:
+            self.__dataset.close()
+            self.__dataset = None
+
+    def __write(self, record):
+        time, values = record
+        if self.__dataset is None:
+            self.__create(values)
+        self.__vars["T"][self.__index] = time
+        for name, value in values.items():
+            self.__vars[name][self.__index, ...] = value
+        self.__index += 1
+
+    @staticmethod
+    def __attributes(settings):
+        result = {}
+        if settings is not None:
+            for setting in dir(settings):
+                if setting.startswith("_"):
+                    continue
+                value = getattr(settings, setting)
+                if isinstance(value, (numbers.Number, str)) or (
+                    isinstance(value, (np.ndarray, list, tuple))
+                    and np.asarray(value).dtype.kind in "biuf"
+                ):
+                    result[setting] = value
+        return result
+
+    def __create(self, values):
+        self.__dataset = self._netCDF4.Dataset(self.filename, mode="w")
+        self.__dataset.setncatts(self.__settings)
+        self.__vars = {}
+
+        self.__dataset.createDimension("T", None)
+        self.__vars["T"] = self.__dataset.createVariable("T", "f8", ("T",))
+        self.__vars["T"].units = "seconds"
+
+        for index, label in enumerate(self.__spatial["labels"]):
+            n_cells = self.__spatial["grid"][index]
+            self.__dataset.createDimension(label, n_cells)
+            self.__vars[label] = self.__dataset.createVariable(label, "f8", (label,))
+            self.__vars[label][:] = (self.__spatial["size"][index] / n_cells) * (
+                1 / 2 + np.arange(n_cells)
+            )
+            self.__vars[label].units = "metres"
+
+        for name, value in values.items():
+            if name in self.__vars:
+                raise AssertionError(
+                    f"product ({name}) has same name as one of netCDF dimensions"
+                )
+            self.__vars[name] = self.__dataset.createVariable(
+                name,
+                value.dtype,
+                ("T",) + self.__dimensions(name, value.shape),
+                compression=self.compression,
+                complevel=self.complevel,
+                chunksizes=(self.chunk_length,) + value.shape,
+            )
+            self.__vars[name].units = self.__metadata[name]["unit"]
+
+    def __dimensions(self, name, shape):
+        labels = self.__spatial["labels"]
+        n_spatial = len(labels)
+        if shape[:n_spatial] != self.__spatial["grid"][:n_spatial]:
+            n_spatial = 0
+        dimensions = list(labels[:n_spatial])
+
+        bins = self.__metadata[name]["bins"]
+        for index, size in enumerate(shape[n_spatial:]):
+            if (
+                bins is not None
+                and n_spatial + index == len(shape) - 1
+                and size == len(bins)
+            ):
+                label = f"{name}{DIM_SUFFIX}"
+                self.__dataset.createDimension(label, size)
+                self.__vars[label] = self.__dataset.createVariable(
+                    label, "f8", (label,)
+                )
+                self.__vars[label][:] = bins
+                if self.__metadata[name]["bins_unit"] is not None:
+                    self.__vars[label].units = self.__metadata[name]["bins_unit"]
+            else:
+                label = f"{name}_dim{index}"
+                self.__dataset.createDimension(label, size)
+            dimensions.append(label)
+        return tuple(dimensions)
@@ -2,10 +2,15 @@
 Logic for enabling common CPU/GPU physics formulae code
 """
 
+import hashlib
+import importlib.util
 import inspect
 import math
 import numbers
+import os
 import re
+import sys
+import tempfile
 import warnings
 from collections import namedtuple
 from functools import lru_cache, partial, cached_property
@@ -64,7 +69,16 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         air_dynamic_viscosity: str = "ZografosEtAl1987",
         bulk_phase_partitioning: str = "Null",
         handle_all_breakups: bool = False,
+        jit_cache_dir: Optional[str] = None,
+        tabulated: Optional[dict] = None,
+        tabulation_rtol: float = 1e-6,
     ):
+        """`tabulated` maps names of single- or two-argument formulae (as in `flatten`,
+        e.g. `"saturation_vapour_pressure__pvs_water"`) to sequences of `(min, max)`
+        ranges of their arguments; such formulae are replaced with interpolation in
+        tables refined until the relative error is within `tabulation_rtol` (achieved
+        errors are kept in `tabulation_errors`), falling back to the analytic form
+        outside of the ranges (CPU backend only, GPU code uses the analytic form)"""
         # initialisation of the fields below is just to silence pylint and to enable code hints
         # in PyCharm and alike, all these fields are later overwritten within this ctor
         self.optical_albedo = optical_albedo
@@ -139,10 +153,16 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         self.seed = seed if seed is not None else physics.constants.default_random_seed
         self.fastmath = fastmath
         self.handle_all_breakups = handle_all_breakups
+        self.jit_cache_dir = jit_cache_dir
         dimensional_analysis = physics.impl.flag.DIMENSIONAL_ANALYSIS
 
         self.trivia = _magick(
-            "Trivia", physics.trivia, fastmath, constants, dimensional_analysis
+            "Trivia",
+            physics.trivia,
+            fastmath,
+            constants,
+            dimensional_analysis,
+            jit_cache_dir,
         )
 
         # each `component` corresponds to one subdirectory of PySDM/physics
@@ -156,9 +176,23 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
                     fastmath=fastmath,
                     constants=constants,
                     dimensional_analysis=dimensional_analysis,
+                    jit_cache_dir=jit_cache_dir,
                 ),
             )
 
+        self.tabulation_errors = {}
+        if not dimensional_analysis:
+            for name, ranges in (tabulated or {}).items():
+                component, function = name.split("__")
+                namespace, self.tabulation_errors[name] = _tabulate(
+                    getattr(self, component),
+                    function,
+                    ranges=ranges,
+                    rtol=tabulation_rtol,
+                    fastmath=fastmath,
+                )
+                setattr(self, component, namespace)
+
         # TODO #348
         self.terminal_velocity_class = {
             "GunnKinzer1949": GunnKinzer1949,
@@ -172,7 +206,7 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         for attr in dir(self):
             if not attr.startswith("_") and attr != "flatten":
                 attr_value = getattr(self, attr)
-                if attr_value.__class__ in (bool, int, float):
+                if attr_value.__class__ in (bool, int, float, str, type(None)):
                     value = attr_value
                 elif attr_value.__class__.__name__ == "Constants":
                     value = str(attr_value)
@@ -204,7 +238,9 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         return getattr(self.constants, key)
 
 
-def _formula(func, constants, dimensional_analysis, **kw):
+def _formula(  # pylint: disable=too-many-locals
+    func, constants, dimensional_analysis, jit_cache_dir=None, **kw
+):
     parameters_keys = tuple(inspect.signature(func).parameters.keys())
     special_params = ("_", "const")
 
@@ -217,7 +253,6 @@ def _formula(func, constants, dimensional_analysis, **kw):
     source = "class _:\n" + "".join(inspect.getsourcelines(func)[0])
     source = re.sub(r"\(\n\s+", "(", source)
     source = re.sub(r"\n\s+\):", "):", source)
-    loc = {}
     for arg_name in special_params:
         for sep in ",", ")":
             source = source.replace(
@@ -226,13 +261,39 @@ def _formula(func, constants, dimensional_analysis, **kw):
             )
 
     extras = func.__extras if hasattr(func, "__extras") else {}
-    exec(  # pylint:disable=exec-used
-        source, {"const": constants, "np": np, "math": math, **extras}, loc
+    global_vars = {"const": constants, "np": np, "math": math, **extras}
+    vectorize = hasattr(func, "__vectorize")
+    jit_flags = (
+        {
+            k: v
+            for k, v in conf.JIT_FLAGS.items()
+            if k not in ("parallel", "error_model")
+        }
+        if vectorize
+        else {
+            **conf.JIT_FLAGS,
+            **{"parallel": False, "inline": "always", "cache": False, **kw},
+        }
     )
 
+    if jit_cache_dir is None or numba.config.DISABLE_JIT:  # pylint: disable=no-member
+        loc = {}
+        exec(source, global_vars, loc)  # pylint:disable=exec-used
+        function = getattr(loc["_"], func.__name__)
+    else:
+        function = getattr(
+            _cached_source_module(
+                source=source,
+                global_vars=global_vars,
+                jit_flags=jit_flags,
+                jit_cache_dir=jit_cache_dir,
+            )._,
+            func.__name__,
+        )
+        jit_flags["cache"] = True
+
     n_params = len(parameters_keys) - (1 if parameters_keys[0] in special_params else 0)
-    function = getattr(loc["_"], func.__name__)
-    if hasattr(func, "__vectorize"):
+    if vectorize:
         vectorizer = (
             np.vectorize
             if numba.config.DISABLE_JIT  # pylint: disable=no-member
@@ -240,26 +301,73 @@ def _formula(func, constants, dimensional_analysis, **kw):
                 "float64(" + ",".join(["float64"] * n_params) + ")",
                 target="cpu",
                 nopython=True,
-                **{
-                    k: v
-                    for k, v in conf.JIT_FLAGS.items()
-                    if k not in ("parallel", "error_model")
-                },
+                **jit_flags,
             )
         )
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NumbaExperimentalFeatureWarning)
             return vectorizer(function)
-    return numba.njit(
-        getattr(loc["_"], func.__name__),
-        **{
-            **conf.JIT_FLAGS,
-            **{"parallel": False, "inline": "always", "cache": False, **kw},
-        },
-    )
+    return numba.njit(function, **jit_flags)
+
+
+def _cached_source_module(*, source, global_vars, jit_flags, jit_cache_dir):
+    """writes the formula source to a content-addressed file within `jit_cache_dir`
+    (named after a hash of the source, of the values of constants it refers to,
+    of the sources of the helper functions and of the JIT flags) and imports it, so that Numba's
+    on-disk cache (which is keyed by the source file) can be reused across processes;
+    files are never overwritten once created, hence concurrent processes can safely
+    share one cache directory"""
+    hasher = hashlib.sha256()
+    for item in (
+        numba.__version__,
+        source,
+        repr(sorted(jit_flags.items())),
+        *(
+            f"const.{name}={getattr(global_vars['const'], name)!r}"
+            for name in sorted(set(re.findall(r"const\.(\w+)", source)))
+        ),
+        *(
+            f"{key}={_helper_source(value)}"
+            for key, value in sorted(global_vars.items())
+            if key not in ("const", "np", "math")
+        ),
+    ):
+        hasher.update(item.encode())
+    module_name = "_pysdm_formula_" + hasher.hexdigest()[:32]
+
+    path = os.path.join(jit_cache_dir, module_name + ".py")
+    if not os.path.exists(path):
+        os.makedirs(jit_cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=jit_cache_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(source)
+        try:
+            os.link(tmp.name, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp.name)
+
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        module.__dict__.update(global_vars)
+        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+    return sys.modules[module_name]
+
 
+def _helper_source(helper):
+    """returns the source of a helper function (of the Python function underlying
+    a JIT-compiled one), falling back to its qualified name if it is unavailable"""
+    try:
+        return inspect.getsource(getattr(helper, "py_func", helper))
+    except (OSError, TypeError):
+        return f"{helper.__module__}.{helper.__qualname__}"
 
-def _boost(obj, fastmath, constants, dimensional_analysis):
+
+def _boost(obj, fastmath, constants, dimensional_analysis, jit_cache_dir):
     """returns JIT-compiled, `c_inline`-equipped formulae with the constants catalogue attached"""
     formulae = {"__name__": obj.__name__}
     for item in dir(obj):
@@ -272,6 +380,7 @@ def _boost(obj, fastmath, constants, dimensional_analysis):
                 constants=constants,
                 fastmath=fastmath,
                 dimensional_analysis=dimensional_analysis,
+                jit_cache_dir=jit_cache_dir,
             )
             setattr(
                 formula, "c_inline", partial(_c_inline, constants=constants, fun=attr)
@@ -376,8 +485,90 @@ def _choices(module):
     return {name: cls for name, cls in module.__dict__.items() if isinstance(cls, type)}
 
 
+_TABULATION_MAX_NODES = {1: 2**16 + 1, 2: 2**9 + 1}
+
+
+def _tabulate(  # pylint: disable=too-many-locals
+    namespace, function, *, ranges, rtol, fastmath
+):
+    """returns a copy of the boosted-formulae `namespace` with `function` replaced by
+    a bi-/linear interpolation in a table over the given argument `ranges` (number of
+    nodes being doubled until the relative error, estimated at cell centres where it
+    is largest for smooth functions, is within `rtol`), and the achieved error"""
+    analytic = getattr(namespace, function)
+    arg_names = tuple(
+        inspect.signature(getattr(analytic, "py_func", analytic)).parameters.keys()
+    )
+    if len(arg_names) != len(ranges) or len(ranges) not in _TABULATION_MAX_NODES:
+        raise ValueError(
+            f"{namespace.__name__}.{function}({', '.join(arg_names)}): expected"
+            f" one or two arguments, got {len(ranges)} ranges"
+        )
+    evaluate = np.vectorize(analytic, otypes=(float,))
+
+    n_nodes = 17
+    while True:
+        nodes = [np.linspace(lo, hi, n_nodes) for lo, hi in ranges]
+        table = evaluate(*np.meshgrid(*nodes, indexing="ij"))
+        centres = [(axis[:-1] + axis[1:]) / 2 for axis in nodes]
+        exact = evaluate(*np.meshgrid(*centres, indexing="ij"))
+        if len(ranges) == 1:
+            interpolated = (table[:-1] + table[1:]) / 2
+        else:
+            interpolated = (
+                table[:-1, :-1] + table[1:, :-1] + table[:-1, 1:] + table[1:, 1:]
+            ) / 4
+        with np.errstate(divide="ignore", invalid="ignore"):
+            error = float(np.max(np.abs(interpolated - exact) / np.abs(exact)))
+        if error <= rtol or 2 * n_nodes - 1 > _TABULATION_MAX_NODES[len(ranges)]:
+            break
+        n_nodes = 2 * n_nodes - 1
+    if not error <= rtol:
+        warnings.warn(
+            f"tabulated {namespace.__name__}.{function} relative error ({error})"
+            f" exceeds the requested tolerance ({rtol})"
+        )
+
+    global_vars = {"analytic": analytic, "table": table}
+    for dim, (lo, hi) in enumerate(ranges):
+        global_vars[f"lower{dim}"] = float(lo)
+        global_vars[f"step{dim}"] = float(hi - lo) / (n_nodes - 1)
+    global_vars["last"] = n_nodes - 1
+    args = ", ".join(arg_names)
+    source = f"def {function}({args}):\n"
+    for dim, arg in enumerate(arg_names):
+        source += f"    t{dim} = ({arg} - lower{dim}) / step{dim}\n"
+        source += f"    if not 0 <= t{dim} <= last:\n"
+        source += f"        return analytic({args})\n"
+        source += f"    i{dim} = min(int(t{dim}), last - 1)\n"
+        source += f"    w{dim} = t{dim} - i{dim}\n"
+    if len(arg_names) == 1:
+        source += "    return table[i0] + w0 * (table[i0 + 1] - table[i0])\n"
+    else:
+        source += (
+            "    j0 = i0 + 1\n"
+            "    lo = table[i0, i1] + w1 * (table[i0, i1 + 1] - table[i0, i1])\n"
+            "    hi = table[j0, i1] + w1 * (table[j0, i1 + 1] - table[j0, i1])\n"
+            "    return lo + w0 * (hi - lo)\n"
+        )
+    loc = {}
+    exec(source, global_vars, loc)  # pylint:disable=exec-used
+    formula = numba.njit(
+        loc[function],
+        **{
+            **conf.JIT_FLAGS,
+            **{"parallel": False, "inline": "always", "cache": False},
+            "fastmath": fastmath,
+        },
+    )
+    setattr(formula, "c_inline", analytic.c_inline)
+    return SimpleNamespace(**{**vars(namespace), function: formula}), error
+
+
 @lru_cache()
-def _magick(value, module, fastmath, constants, dimensional_analysis):
+def _magick(  # pylint: disable=too-many-arguments
+    value, module, fastmath, constants, dimensional_analysis, jit_cache_dir=None
+):
     """
     boosts (`PySDM.formulae.Formulae._boost`) the selected physics logic
     """
@@ -386,4 +577,5 @@ def _magick(value, module, fastmath, constants, dimensional_analysis):
         fastmath,
         constants,
         dimensional_analysis,
+        jit_cache_dir,
     )
@@ -8,9 +8,10 @@ from typing import Dict
 import numpy as np
 
 from PySDM.attributes.impl.attribute import Attribute
+from PySDM.backends.impl_common.storage_utils import resize
 
 
-class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
+class ParticleAttributes:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     def __init__(
         self,
         *,
@@ -30,14 +31,23 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
 
         self.cell_idx = particulator.Index.identity_index(len(cell_start) - 1)
         self.__cell_start = particulator.Storage.from_ndarray(cell_start)
-        self.__cell_caretaker = particulator.backend.make_cell_caretaker(
+        self.__backend = particulator.backend
+        self.__sorting_scheme = particulator.sorting_scheme
+        self.__cell_caretaker = self.__make_cell_caretaker()
+        self.__parallel_shuffler = None
+        self.__reordering_buffers = {}
+        self.__sorted = False
+        self.__attributes = attributes
+        self.__vacant = None
+        self.__n_vacant = None
+
+    def __make_cell_caretaker(self):
+        return self.__backend.make_cell_caretaker(
             self.__idx.shape,
             self.__idx.dtype,
             len(self.__cell_start),
-            scheme=particulator.sorting_scheme,
+            scheme=self.__sorting_scheme,
         )
-        self.__sorted = False
-        self.__attributes = attributes
 
     @property
     def healthy(self) -> bool:
@@ -64,14 +74,74 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def mark_updated(self, key):
         self.__attributes[key].mark_updated()
 
+    def get_timestamp(self, key) -> int:
+        """returns the update counter of a given attribute (recalculating it first
+        in case of derived attributes)"""
+        attribute = self.__attributes[key]
+        attribute.update()
+        return attribute.timestamp
+
     def sanitize(self):
         if not self.healthy:
             self.__idx.length = self.__valid_n_sd
             self.__idx.remove_zero_n_or_flagged(self["multiplicity"])
+            if self.__n_vacant is not None:
+                self.__n_vacant = self.__backend.push_vacant_slots(
+                    multiplicity=self["multiplicity"],
+                    idx=self.__idx,
+                    start=len(self.__idx),
+                    stop=self.__valid_n_sd,
+                    vacant=self.__vacant,
+                    n_vacant=self.__n_vacant,
+                )
             self.__valid_n_sd = self.__idx.length
             self.healthy = True
             self.__sorted = False
 
+    @property
+    def vacant_slot_count(self):
+        """returns the number of slots available for injection of super-droplets
+        (i.e., ones of zero multiplicity); the slots are kept on a stack which is
+        initialised with a scan of all multiplicities upon first use (and after
+        storage permutations) and then kept up to date by `sanitize()`"""
+        self.sanitize()
+        if self.__n_vacant is None:
+            if self.__vacant is None:
+                self.__vacant = self.__backend.Storage.empty(
+                    self.__idx.shape, self.__idx.dtype
+                )
+            self.__n_vacant = self.__backend.collect_vacant_slots(
+                multiplicity=self["multiplicity"], vacant=self.__vacant
+            )
+        return self.__n_vacant
+
+    def inject(
+        self,
+        *,
+        seeded_particle_index,
+        seeded_particle_multiplicity,
+        seeded_particle_extensive_attributes,
+        number_of_super_particles_to_inject,
+    ):
+        """fills vacant slots with the seeds listed first in `seeded_particle_index`
+        appending them to the index (at a cost independent of the number of slots)"""
+        assert number_of_super_particles_to_inject <= self.vacant_slot_count
+        self.__backend.seeding(
+            idx=self.__idx,
+            vacant=self.__vacant,
+            n_vacant=self.__n_vacant,
+            multiplicity=self["multiplicity"],
+            extensive_attributes=self.__extensive_attribute_storage,
+            seeded_particle_index=seeded_particle_index,
+            seeded_particle_multiplicity=seeded_particle_multiplicity,
+            seeded_particle_extensive_attributes=seeded_particle_extensive_attributes,
+            number_of_super_particles_to_inject=number_of_super_particles_to_inject,
+        )
+        self.__idx.length += number_of_super_particles_to_inject
+        self.__valid_n_sd = self.__idx.length
+        self.__n_vacant -= number_of_super_particles_to_inject
+        self.__sorted = False
+
     def cut_working_length(self, length):
         assert length <= len(self.__idx)
         self.__idx.length = length
@@ -95,15 +165,108 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def __contains__(self, key):
         return key in self.__attributes
 
-    def permutation(self, u01, local):
+    def permutation(self, u01, local, parallel=False):
         """apply Fisher-Yates algorithm to all super-droplets (local=False) or
-        otherwise on a per-cell basis"""
+        otherwise on a per-cell basis; with parallel=True (and local=False),
+        a parallel random-key bucket shuffle is used instead of the serial one"""
         if local:
             self.__idx.shuffle(u01, parts=self.cell_start)
         else:
-            self.__idx.shuffle(u01)
+            if parallel:
+                if self.__parallel_shuffler is None:
+                    self.__parallel_shuffler = self.__backend.make_parallel_shuffler(
+                        self.__idx.shape, self.__idx.dtype
+                    )
+                self.__parallel_shuffler(self.__idx, len(self.__idx), u01)
+            else:
+                self.__idx.shuffle(u01)
             self.__sorted = False
 
+    def reorder_physically(self):
+        """permutes the attribute storages so that super-droplets are laid out
+        in memory in cell order (with the removed ones at the end), and resets
+        the index to identity, so that subsequent sweeps access memory sequentially"""
+        self.sanitize()
+        assert len(self.__idx) == self.__valid_n_sd
+        if not self.__sorted:
+            self.__sort_by_cell_id()
+
+        self.__backend.complete_permutation(
+            self.__idx,
+            len(self.__idx),
+            self.__reordering_buffer("keys", self.__idx.dtype),
+        )
+        self.__permute_storages()
+
+    def compact(self):
+        """moves the super-droplets in use to the front of the attribute storages
+        (retaining their relative order in memory, removed ones placed at the end)
+        and resets the index to identity, so that sweeps over `idx[:length]` touch
+        a contiguous chunk of memory"""
+        self.sanitize()
+        assert len(self.__idx) == self.__valid_n_sd
+        self.__backend.compact_index(
+            self.__idx,
+            len(self.__idx),
+            self.__reordering_buffer("keys", self.__idx.dtype),
+        )
+        self.__permute_storages()
+        self.__sorted = False
+
+    def resize(self, n_sd):
+        """changes the number of super-droplet slots to `n_sd` (not less than the
+        number of super-droplets in use); the super-droplets are first compacted
+        (see `compact()`) and the storages are then truncated or extended with
+        vacant slots, all index-sized buffers being reallocated accordingly"""
+        self.compact()
+        assert len(self.__idx) <= n_sd
+        storage_class = self.__backend.Storage
+        resize(self.__idx, n_sd, storage_class)
+        self.__idx.reset_index()
+
+        resized = set()
+        for key, attribute in self.__attributes.items():
+            if (
+                attribute.data is None
+                or key in self.__extensive_keys
+                or id(attribute.data) in resized
+            ):
+                continue
+            resize(attribute.data, n_sd, storage_class)
+            resized.add(id(attribute.data))
+        if self.__extensive_attribute_storage is not None:
+            resize(self.__extensive_attribute_storage, n_sd, storage_class)
+            for key, row in self.__extensive_keys.items():
+                view = self.__extensive_attribute_storage[row, :]
+                self.__attributes[key].data.data = view.data
+                self.__attributes[key].data.shape = view.shape
+
+        self.__cell_caretaker = self.__make_cell_caretaker()
+        self.__parallel_shuffler = None
+        self.__reordering_buffers = {}
+        self.__vacant = None
+        self.__n_vacant = None
+        self.__sorted = False
+
+    def __reordering_buffer(self, key, dtype):
+        if key not in self.__reordering_buffers:
+            self.__reordering_buffers[key] = self.__backend.Storage.empty(
+                self.__idx.shape, dtype
+            )
+        return self.__reordering_buffers[key]
+
+    def __permute_storages(self):
+        for attribute in self.__attributes.values():
+            if attribute.data is None:
+                continue
+            self.__backend.permute_in_place(
+                attribute.data,
+                self.__idx,
+                self.__reordering_buffer(attribute.data.dtype, attribute.data.dtype),
+            )
+        self.__idx.reset_index()
+        self.__n_vacant = None
+
     def __sort_by_cell_id(self):
         self.__cell_caretaker(
             self["cell id"], self.cell_idx, self.__cell_start, self.__idx
@@ -122,4 +285,5 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def reset_idx(self):
         self.__valid_n_sd = self.__idx.shape[0]
         self.__idx.reset_index()
+        self.__n_vacant = None
         self.healthy = False
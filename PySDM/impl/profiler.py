@@ -0,0 +1,120 @@
+"""
+opt-in profiling of backend-method calls and derived-attribute recalculations
+ (call counts, cumulative and maximal wall time, bytes of storages passed as arguments)
+ using Python's [time.perf_counter()](https://docs.python.org/3/library/time.html#time.perf_counter)
+"""
+
+import functools
+import time
+import types
+
+import numpy as np
+
+from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.storage_utils import StorageBase
+
+ATTRIBUTE_PREFIX = "attribute: "
+
+
+def _nbytes(arg):
+    if isinstance(arg, StorageBase):
+        try:
+            itemsize = np.dtype(arg.dtype).itemsize
+        except TypeError:
+            itemsize = np.dtype(float).itemsize
+        return int(np.prod(arg.shape)) * itemsize
+    if isinstance(arg, np.ndarray):
+        return arg.nbytes
+    return 0
+
+
+class Profiler:
+    """wraps (by shadowing with instance attributes) all public methods (and public
+    cached-property-held JIT-compiled functions, except kernel `*_body` ones) of the
+    `PySDM.backends.impl_common.backend_methods.BackendMethods` mixins of a given
+    backend instance, as well as the `recalculate()` methods of given derived attributes;
+    nothing is wrapped (and hence there is no overhead) unless a profiler is attached.
+    Note: on GPU, the measured times are those of (asynchronous) kernel launches
+    and the reported bytes are sums of sizes of all storages passed as arguments
+    (an upper bound for memory traffic of a single pass)"""
+
+    def __init__(self):
+        self.records = {}
+        self.__wrapped = []
+
+    def _record(self, key):
+        if key not in self.records:
+            self.records[key] = {
+                "calls": 0,
+                "total time": 0.0,
+                "max time": 0.0,
+                "bytes": 0,
+            }
+        return self.records[key]
+
+    def _wrap(self, key, function):
+        record = self._record(key)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            record["calls"] += 1
+            record["total time"] += elapsed
+            record["max time"] = max(record["max time"], elapsed)
+            record["bytes"] += sum(_nbytes(arg) for arg in args) + sum(
+                _nbytes(arg) for arg in kwargs.values()
+            )
+            return result
+
+        return wrapper
+
+    def attach_backend(self, backend):
+        names = set()
+        for cls in type(backend).__mro__:
+            if not issubclass(cls, BackendMethods) or cls is BackendMethods:
+                continue
+            for name, value in vars(cls).items():
+                if name.startswith("_") or name.endswith("_body"):
+                    continue
+                if isinstance(
+                    value, (types.FunctionType, staticmethod, functools.cached_property)
+                ):
+                    names.add(name)
+        for name in sorted(names):
+            self.__shadow(backend, name, self._wrap(name, getattr(backend, name)))
+
+    def attach_attribute(self, attribute):
+        self.__shadow(
+            attribute,
+            "recalculate",
+            self._wrap(ATTRIBUTE_PREFIX + attribute.name, attribute.recalculate),
+        )
+
+    def __shadow(self, owner, name, wrapper):
+        self.__wrapped.append((owner, name, vars(owner).get(name)))
+        setattr(owner, name, wrapper)
+
+    def detach(self):
+        """restores the original (unwrapped) methods"""
+        for owner, name, shadowed in reversed(self.__wrapped):
+            if shadowed is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, shadowed)
+        self.__wrapped = []
+
+    def reset(self):
+        for record in self.records.values():
+            record.update({"calls": 0, "total time": 0.0, "max time": 0.0, "bytes": 0})
+
+    def report(self, skip_uncalled=True):
+        """returns a dictionary of per-method statistics ordered by total time"""
+        return {
+            key: dict(record)
+            for key, record in sorted(
+                self.records.items(), key=lambda item: -item[1]["total time"]
+            )
+            if record["calls"] > 0 or not skip_uncalled
+        }
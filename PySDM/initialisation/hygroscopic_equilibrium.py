@@ -1,50 +1,118 @@
 """
 Koehler-curve equilibrium in unsaturated conditions
+
+the per-particle solvers are compiled once per formulae configuration (and cached);
+for large numbers of particles, wet radii can optionally be interpolated from a table
+of equilibrium radii spanning the (kappa, r_dry, T, RH) ranges of the input, with each
+interpolated value being verified to bracket the root within `table_rtol` (and solved
+for exactly otherwise)
 """
 
+from functools import lru_cache
+
 import numba
 import numpy as np
 
 from ..backends.impl_numba.conf import JIT_FLAGS
-from ..backends.impl_numba.toms748 import toms748_solve
+from ..backends.impl_numba.toms748 import (
+    BATCH_SIZE,
+    toms748_batch_workspace,
+    toms748_solve_batch,
+)
 from ..backends.impl_numba.warnings import warn
 
 default_rtol = 1e-5
 default_max_iters = 64
+default_table_rtol = 1e-3
+default_table_shape = (8, 64, 4, 16)
 
-# pylint: disable=too-many-locals,too-many-arguments
+# pylint: disable=too-many-locals,too-many-arguments,too-many-statements
 
 
-def _solve_equilibrium_radii(
-    *,
-    radii_in: np.ndarray,
-    get_bounds,
-    get_args,
-    minfun,
-    environment,
-    kappa,
-    f_org: np.ndarray,
-    cell_id: np.ndarray,
-    rtol: float,
-    max_iters: int,
-    skip_fa_lt_zero: bool,
-    RH_range: tuple = (0, 1),
-):
-    T = environment["T"].to_ndarray()
-    RH = environment["RH"].to_ndarray()
-    formulae = environment.particulator.formulae
-    within_tolerance = formulae.trivia.within_tolerance
+@lru_cache()
+def _make_solver(formulae, wet: bool):
+    """returns a JIT-compiled solver for wet (if `wet`) or dry equilibrium radii,
+    `formulae` being the flattened (hashable) representation of
+    `PySDM.formulae.Formulae`"""
     jit_flags = {**JIT_FLAGS, **{"fastmath": formulae.fastmath}}
+    const = formulae.constants
+    sigma = formulae.surface_tension__sigma
+    phys_volume = formulae.trivia__volume
+    RH_eq = formulae.hygroscopicity__RH_eq
+    r_cr = formulae.hygroscopicity__r_cr
+    within_tolerance = formulae.trivia__within_tolerance
 
-    if cell_id is None:
-        cell_id = np.zeros_like(radii_in, dtype=int)
-    if f_org is None:
-        f_org = np.zeros_like(radii_in, dtype=float)
+    if wet:
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def get_args(T_i, RH_i, kappa, r_dry, f_org):
+            return T_i, RH_i, kappa, r_dry**3, f_org
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def get_bounds(r_dry, T_i, kappa):
+            a = r_dry
+            b = r_cr(kappa, r_dry**3, T_i, const.sgm_w)
+            return a, b
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def minfun(r_wet, temperature, relative_humidity, kappa, r_dry_3, f_org):
+            sgm = sigma(
+                temperature, phys_volume(radius=r_wet), const.PI_4_3 * r_dry_3, f_org
+            )
+            return relative_humidity - RH_eq(r_wet, temperature, kappa, r_dry_3, sgm)
+
+    else:
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def get_args(T_i, RH_i, kappa, r_wet, f_org):
+            return T_i, RH_i, kappa, r_wet, f_org
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def get_bounds(r_wet, _, __):
+            return 0.0, r_wet
+
+        @numba.njit(**{**jit_flags, "parallel": False})
+        def minfun(r_dry, temperature, relative_humidity, kappa, r_wet, f_org):
+            r_dry_3 = r_dry**3
+            sgm = sigma(
+                temperature, phys_volume(radius=r_wet), const.PI_4_3 * r_dry_3, f_org
+            )
+            return relative_humidity - RH_eq(r_wet, temperature, kappa, r_dry_3, sgm)
+
+    skip_fa_lt_zero = wet
+
+    @numba.njit(**{**jit_flags, "parallel": False})
+    def minfun_batch(radius, i, temperature, relative_humidity, kappa, arg, f_org):
+        return minfun(
+            radius, temperature[i], relative_humidity[i], kappa[i], arg[i], f_org[i]
+        )
 
     @numba.njit(**jit_flags)
-    def impl(radii_in, iters, T, RH, cell_id, kappa, f_org):
+    def impl(
+        radii_in,
+        iters,
+        T,
+        RH,
+        cell_id,
+        kappa,
+        f_org,
+        rtol,
+        max_iters,
+        RH_range,
+        guess,
+        guess_rtol,
+    ):
+        """with `guess_rtol > 0`, `guess[i]` is returned if the root is bracketed
+        within `guess[i] * (1 -/+ guess_rtol)` (with `iters[i]` set to zero);
+        the remaining problems are solved in batches (see `toms748_solve_batch`)"""
+        n = len(radii_in)
         radii_out = np.empty_like(radii_in)
-        for i in numba.prange(len(radii_in)):  # pylint: disable=not-an-iterable
+        T_i = np.empty(n)
+        RH_i = np.empty(n)
+        arg = np.empty(n)
+        brackets = np.empty((4, n))
+        to_solve = np.zeros(n, dtype=np.bool_)
+        for i in numba.prange(n):  # pylint: disable=not-an-iterable
             cid = cell_id[i]
             a, b = get_bounds(radii_in[i], T[cid], kappa[i])
 
@@ -53,8 +121,11 @@ def _solve_equilibrium_radii(
                 iters[i] = 0
                 continue
 
-            RH_i = np.maximum(RH_range[0], np.minimum(RH_range[1], RH[cid]))
-            args = get_args(T[cid], RH_i, kappa[i], radii_in[i], f_org[i])
+            RH_i[i] = np.maximum(RH_range[0], np.minimum(RH_range[1], RH[cid]))
+            T_i[i], RH_i[i], _, arg[i], _ = get_args(
+                T[cid], RH_i[i], kappa[i], radii_in[i], f_org[i]
+            )
+            args = (T_i[i], RH_i[i], kappa[i], arg[i], f_org[i])
             fa, fb = minfun(a, *args), minfun(b, *args)
 
             if skip_fa_lt_zero and fa < 0:
@@ -62,17 +133,42 @@ def _solve_equilibrium_radii(
                 iters[i] = 0
                 continue
 
-            radii_out[i], iters[i] = toms748_solve(
-                minfun,
-                args,
-                a,
-                b,
-                fa,
-                fb,
-                rtol=rtol,
-                max_iter=max_iters,
-                within_tolerance=within_tolerance,
+            if guess_rtol > 0:
+                lo = max(a, guess[i] * (1 - guess_rtol))
+                hi = min(b, guess[i] * (1 + guess_rtol))
+                if lo < hi and minfun(lo, *args) * minfun(hi, *args) <= 0:
+                    radii_out[i] = guess[i]
+                    iters[i] = 0
+                    continue
+
+            brackets[0, i] = a
+            brackets[1, i] = b
+            brackets[2, i] = fa
+            brackets[3, i] = fb
+            to_solve[i] = True
+
+        problems = np.flatnonzero(to_solve)
+        max_iter = np.full(n, max_iters)
+        workspace = toms748_batch_workspace(n)
+        n_batches = (len(problems) + BATCH_SIZE - 1) // BATCH_SIZE
+        for batch in numba.prange(n_batches):  # pylint: disable=not-an-iterable
+            toms748_solve_batch(
+                minfun_batch,
+                (T_i, RH_i, kappa, arg, f_org),
+                problems[batch * BATCH_SIZE : (batch + 1) * BATCH_SIZE],
+                brackets[0],
+                brackets[1],
+                brackets[2],
+                brackets[3],
+                rtol,
+                max_iter,
+                within_tolerance,
+                radii_out,
+                iters,
+                workspace,
             )
+
+        for i in problems:
             if iters[i] == -1:
                 warn(
                     msg="failed to find equilibrium particle size",
@@ -83,9 +179,9 @@ def _solve_equilibrium_radii(
                         "r",
                         radii_in[i],
                         "T",
-                        T[cid],
+                        T_i[i],
                         "RH",
-                        RH_i,
+                        RH_i[i],
                         "f_org",
                         f_org[i],
                         "kappa",
@@ -94,12 +190,125 @@ def _solve_equilibrium_radii(
                 )
         return radii_out
 
+    return impl
+
+
+@numba.njit(**{**JIT_FLAGS, "cache": False})
+def _interpolate_multilinear(table, shape, lower, step, points):
+    """multilinear interpolation in the (C-ordered, flattened) `table` defined
+    on a regular grid of `shape` nodes starting at `lower` and spaced by `step`;
+    dimensions with a single node are treated as constant"""
+    n_dims = len(shape)
+    result = np.empty(points.shape[1])
+    for i in numba.prange(points.shape[1]):  # pylint: disable=not-an-iterable
+        base = np.empty(n_dims, dtype=np.int64)
+        weight = np.empty(n_dims)
+        for dim in range(n_dims):
+            base[dim] = 0
+            weight[dim] = 0
+            if shape[dim] > 1:
+                x = (points[dim, i] - lower[dim]) / step[dim]
+                base[dim] = min(max(np.int64(np.floor(x)), 0), shape[dim] - 2)
+                weight[dim] = x - base[dim]
+        result[i] = 0
+        for corner in range(2**n_dims):
+            corner_weight = 1.0
+            flat_index = 0
+            for dim in range(n_dims):
+                upper = (corner >> dim) & 1
+                if upper and shape[dim] == 1:
+                    corner_weight = 0
+                    break
+                corner_weight *= weight[dim] if upper else 1 - weight[dim]
+                flat_index = flat_index * shape[dim] + base[dim] + upper
+            if corner_weight != 0:
+                result[i] += corner_weight * table[flat_index]
+    return result
+
+
+def _solve_equilibrium_radii(
+    *,
+    radii_in: np.ndarray,
+    wet: bool,
+    environment,
+    kappa,
+    f_org: np.ndarray,
+    cell_id: np.ndarray,
+    rtol: float,
+    max_iters: int,
+    RH_range: tuple = (0, 1),
+    guess: np.ndarray = None,
+    guess_rtol: float = 0,
+    T: np.ndarray = None,
+    RH: np.ndarray = None,
+):
+    T = environment["T"].to_ndarray() if T is None else T
+    RH = environment["RH"].to_ndarray() if RH is None else RH
+    solver = _make_solver(environment.particulator.formulae.flatten, wet)
+
+    if cell_id is None:
+        cell_id = np.zeros_like(radii_in, dtype=int)
+    if f_org is None:
+        f_org = np.zeros_like(radii_in, dtype=float)
+    if guess is None:
+        guess = np.empty(0)
+
     iters = np.empty_like(radii_in, dtype=int)
-    radii_out = impl(radii_in, iters, T, RH, cell_id, kappa, f_org)
+    radii_out = solver(
+        radii_in,
+        iters,
+        T,
+        RH,
+        cell_id,
+        kappa,
+        f_org,
+        rtol,
+        max_iters,
+        (float(RH_range[0]), float(RH_range[1])),
+        guess,
+        float(guess_rtol),
+    )
     assert (iters != max_iters).all() and (iters != -1).all()
     return radii_out
 
 
+def _tabulated_wet_radii(
+    *, r_dry, environment, kappa, cell_id, rtol, max_iters, table_shape
+):
+    """interpolates wet radii (in logarithm) from a table of equilibrium wet radii
+    computed on a regular grid spanning the (kappa, ln(r_dry), T, RH) ranges of
+    the input (at zero organic fraction)"""
+    T = environment["T"].to_ndarray()
+    RH = np.clip(environment["RH"].to_ndarray(), 0, 1)
+    if cell_id is None:
+        cell_id = np.zeros_like(r_dry, dtype=int)
+    points = np.asarray([kappa, np.log(r_dry), T[cell_id], RH[cell_id]])
+
+    lower = points.min(axis=1)
+    upper = points.max(axis=1)
+    shape = np.where(upper > lower, np.asarray(table_shape, dtype=np.int64), 1)
+    step = np.where(shape > 1, (upper - lower) / np.maximum(shape - 1, 1), 1)
+    nodes = np.meshgrid(
+        *(lower[dim] + step[dim] * np.arange(shape[dim]) for dim in range(len(shape))),
+        indexing="ij",
+    )
+    table = np.log(
+        _solve_equilibrium_radii(
+            radii_in=np.exp(nodes[1].ravel()),
+            wet=True,
+            environment=environment,
+            kappa=nodes[0].ravel(),
+            f_org=None,
+            cell_id=np.arange(nodes[0].size),
+            rtol=rtol,
+            max_iters=max_iters,
+            T=nodes[2].ravel(),
+            RH=nodes[3].ravel(),
+        )
+    )
+    return np.exp(_interpolate_multilinear(table, shape, lower, step, points))
+
+
 def equilibrate_dry_radii(
     *,
     r_wet: np.ndarray,
@@ -110,41 +319,15 @@ def equilibrate_dry_radii(
     rtol=default_rtol,
     max_iters=default_max_iters,
 ):
-    formulae = environment.particulator.formulae
-    sigma = formulae.surface_tension.sigma
-    phys_volume = formulae.trivia.volume
-    const = environment.particulator.formulae.constants
-    RH_eq = formulae.hygroscopicity.RH_eq
-    jit_flags = {**JIT_FLAGS, **{"fastmath": formulae.fastmath}}
-
-    @numba.njit(**{**jit_flags, "parallel": False})
-    def get_args(T_i, RH_i, kappa, r_wet, f_org):
-        return T_i, RH_i, kappa, r_wet, f_org
-
-    @numba.njit(**{**jit_flags, "parallel": False})
-    def get_bounds(r_wet, _, __):
-        return 0.0, r_wet
-
-    @numba.njit(**{**jit_flags, "parallel": False})
-    def minfun_dry(r_dry, temperature, relative_humidity, kappa, r_wet, f_org):
-        r_dry_3 = r_dry**3
-        sgm = sigma(
-            temperature, phys_volume(radius=r_wet), const.PI_4_3 * r_dry_3, f_org
-        )
-        return relative_humidity - RH_eq(r_wet, temperature, kappa, r_dry_3, sgm)
-
     return _solve_equilibrium_radii(
         radii_in=r_wet,
-        get_args=get_args,
-        get_bounds=get_bounds,
-        minfun=minfun_dry,
+        wet=False,
         environment=environment,
         kappa=kappa,
         f_org=f_org,
         cell_id=cell_id,
         rtol=rtol,
         max_iters=max_iters,
-        skip_fa_lt_zero=False,
     )
 
 
@@ -157,42 +340,37 @@ def equilibrate_wet_radii(
     cell_id: np.ndarray = None,
     rtol=default_rtol,
     max_iters=default_max_iters,
+    tabulated: bool = False,
+    table_rtol: float = default_table_rtol,
+    table_shape: tuple = default_table_shape,
 ):
-    formulae = environment.particulator.formulae
-    sigma = formulae.surface_tension.sigma
-    phys_volume = formulae.trivia.volume
-    const = environment.particulator.formulae.constants
-    RH_eq = formulae.hygroscopicity.RH_eq
-    r_cr = formulae.hygroscopicity.r_cr
-    jit_flags = {**JIT_FLAGS, **{"fastmath": formulae.fastmath}}
-
-    @numba.njit(**{**jit_flags, "parallel": False})
-    def get_args(T_i, RH_i, kappa, r_dry, f_org):
-        return T_i, RH_i, kappa, r_dry**3, f_org
-
-    @numba.njit(**{**jit_flags, "parallel": False})
-    def get_bounds(r_dry, T_i, kappa):
-        a = r_dry
-        b = r_cr(kappa, r_dry**3, T_i, const.sgm_w)
-        return a, b
-
-    @numba.njit(**{**jit_flags, "parallel": False})
-    def minfun_wet(r_wet, temperature, relative_humidity, kappa, r_dry_3, f_org):
-        sgm = sigma(
-            temperature, phys_volume(radius=r_wet), const.PI_4_3 * r_dry_3, f_org
+    """if `tabulated` is set, wet radii are interpolated from a table of
+    `table_shape` (kappa, r_dry, T, RH) nodes and accepted if within `table_rtol`
+    of the equilibrium radius (others, e.g. those with non-zero `f_org` affecting
+    the surface tension, are solved for with `rtol`)"""
+    kappa = kappa_times_dry_volume / environment.particulator.formulae.trivia.volume(
+        radius=r_dry
+    )
+    guess = None
+    if tabulated:
+        guess = _tabulated_wet_radii(
+            r_dry=r_dry,
+            environment=environment,
+            kappa=kappa,
+            cell_id=cell_id,
+            rtol=rtol,
+            max_iters=max_iters,
+            table_shape=table_shape,
         )
-        return relative_humidity - RH_eq(r_wet, temperature, kappa, r_dry_3, sgm)
-
     return _solve_equilibrium_radii(
         radii_in=r_dry,
-        get_args=get_args,
-        get_bounds=get_bounds,
-        minfun=minfun_wet,
+        wet=True,
         environment=environment,
-        kappa=kappa_times_dry_volume / phys_volume(radius=r_dry),
+        kappa=kappa,
         f_org=f_org,
         cell_id=cell_id,
         rtol=rtol,
         max_iters=max_iters,
-        skip_fa_lt_zero=True,
+        guess=guess,
+        guess_rtol=table_rtol if tabulated else 0,
     )
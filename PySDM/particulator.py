@@ -30,11 +30,17 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         self.dynamics = {}
         self.products = {}
         self.observers = []
+        self.capacity_observers = []
 
         self.n_steps = 0
 
         self.sorting_scheme = "default"
         self.condensation_solver = None
+        self.moments_planner = None
+        self.fused_derivation = None
+        self.physical_reordering_period = 0
+        self.compaction_period = 0
+        self.growable_storage = False
 
         self.Index = make_Index(backend)  # pylint: disable=invalid-name
         self.PairIndicator = make_PairIndicator(backend)  # pylint: disable=invalid-name
@@ -46,6 +52,7 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         )
 
         self.timers = {}
+        self.profiler = None
         self.null = self.Storage.empty(0, dtype=float)
 
     def run(self, steps):
@@ -54,6 +61,20 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 with self.timers[key]:
                     dynamic()
             self.n_steps += 1
+            if (
+                self.physical_reordering_period
+                and self.n_steps % self.physical_reordering_period == 0
+            ):
+                self.attributes.reorder_physically()
+            elif self.compaction_period and self.n_steps % self.compaction_period == 0:
+                if (
+                    self.growable_storage
+                    and 4 * self.attributes.super_droplet_count < self.n_sd
+                    and self.n_sd // 2 >= 2
+                ):
+                    self.reserve(self.n_sd // 2)
+                else:
+                    self.attributes.compact()
             self._notify_observers()
 
     def _notify_observers(self):
@@ -73,6 +94,15 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
     def n_sd(self) -> int:
         return self.__n_sd
 
+    def reserve(self, n_sd: int):
+        """changes the number of super-droplet slots (retaining the super-droplets
+        in use, see `PySDM.impl.particle_attributes.ParticleAttributes.resize`) and
+        lets the `capacity_observers` reallocate their particle-sized buffers"""
+        self.attributes.resize(n_sd)
+        self.__n_sd = n_sd
+        for observer in self.capacity_observers:
+            observer.reallocate()
+
     @property
     def dt(self) -> float:
         if self.environment is not None:
@@ -110,7 +140,22 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             RH=self.environment.get_predicted("RH"),
         )
 
-    def condensation(self, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order):
+    def condensation(
+        self,
+        *,
+        rtol_x,
+        rtol_thd,
+        counters,
+        trial_masses,
+        equilibrium_cache,
+        root_finding_workspace,
+        RH_max,
+        success,
+        cell_order,
+        dynamic_schedule,
+        intra_cell_parallel,
+        thread_busy_time,
+    ):
         """Updates droplet volumes by simulating condensation driven by prior changes
           in environment thermodynamic state, updates the environment state.
         In the case of parcel environment, condensation is driven solely by changes in
@@ -145,7 +190,13 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             v_cr=self.attributes["critical volume"],
             timestep=self.dt,
             counters=counters,
+            trial_masses=trial_masses,
+            equilibrium_cache=equilibrium_cache,
+            root_finding_workspace=root_finding_workspace,
             cell_order=cell_order,
+            dynamic_schedule=dynamic_schedule,
+            intra_cell_parallel=intra_cell_parallel,
+            thread_busy_time=thread_busy_time,
             RH_max=RH_max,
             success=success,
             cell_id=self.attributes["cell id"],
@@ -213,6 +264,55 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         for key in self.attributes.get_extensive_attribute_keys():
             self.attributes.mark_updated(key)
 
+    def fused_collision_coalescence(
+        self,
+        *,
+        kernel_args,
+        rand,
+        adaptive,
+        n_substeps,
+        dt_left,
+        dt_range,
+        dt_todo,
+        stats_n_substep,
+        stats_dt_min,
+        collision_rate,
+        collision_rate_deficit,
+        coalescence_rate,
+    ):
+        # pylint: disable=too-many-locals
+        idx = self.attributes._ParticleAttributes__idx
+        healthy = self.attributes._ParticleAttributes__healthy_memory
+        self.backend.fused_collision_coalescence(
+            kernel=kernel_args["kernel"],
+            kernel_params=kernel_args["params"],
+            kernel_x=kernel_args.get("x"),
+            kernel_v=kernel_args.get("v"),
+            multiplicity=self.attributes["multiplicity"],
+            idx=idx,
+            attributes=self.attributes.get_extensive_attribute_storage(),
+            healthy=healthy,
+            cell_id=self.attributes["cell id"],
+            cell_start=self.attributes.cell_start,
+            rand=rand,
+            dv=self.mesh.dv,
+            dt=self.dt,
+            adaptive=adaptive,
+            n_substeps=n_substeps,
+            dt_left=dt_left,
+            dt_range=dt_range,
+            dt_todo=dt_todo,
+            stats_n_substep=stats_n_substep,
+            stats_dt_min=stats_dt_min,
+            collision_rate=collision_rate,
+            collision_rate_deficit=collision_rate_deficit,
+            coalescence_rate=coalescence_rate,
+        )
+        self.attributes.sanitize()
+        self.attributes.mark_updated("multiplicity")
+        for key in self.attributes.get_extensive_attribute_keys():
+            self.attributes.mark_updated(key)
+
     def oxidation(
         self,
         *,
@@ -255,11 +355,13 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         timestep,
         environment_mixing_ratios,
         do_chemistry_flag,
+        cell_order,
+        dynamic_schedule,
     ):
         self.backend.dissolution(
             n_cell=self.mesh.n_cell,
-            n_threads=1,
-            cell_order=np.arange(self.mesh.n_cell),
+            cell_order=cell_order,
+            dynamic_schedule=dynamic_schedule,
             cell_start_arg=self.attributes.cell_start,
             idx=self.attributes._ParticleAttributes__idx,
             do_chemistry_flag=do_chemistry_flag,
@@ -427,6 +529,83 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         )
         self.attributes.sanitize()
 
+    def displacement_step(
+        self,
+        *,
+        displacement,
+        courant,
+        n_substeps,
+        sedimentation,
+        precipitation_counting_level_index,
+    ) -> float:
+        """advects (and with `sedimentation` sediments) particles, removing the ones
+        leaving the domain, in a single sweep; returns the precipitated water mass"""
+        rainfall_mass = self.backend.displacement_step(
+            courant=courant,
+            n_substeps=n_substeps,
+            grid=self.mesh.grid,
+            displacement=displacement,
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            domain_top_level_index=self.mesh.grid[-1],
+            relative_fall_velocity=(
+                self.attributes["relative fall velocity"] if sedimentation else None
+            ),
+            dt_over_dz=self.dt / n_substeps / self.mesh.dz if sedimentation else 0,
+            water_mass=self.attributes["water mass"],
+            multiplicity=self.attributes["multiplicity"],
+            precipitation_counting_level_index=precipitation_counting_level_index,
+        )
+        self.attributes.sanitize()
+        self.recalculate_cell_id()
+        return rainfall_mass
+
+    def displacement_with_per_cell_substeps(
+        self,
+        *,
+        displacement,
+        courant,
+        n_substeps,
+        n_substeps_max,
+        cell_order,
+        dynamic_schedule,
+        sedimentation,
+        precipitation_counting_level_index,
+    ) -> float:
+        """advects (and with `sedimentation` sediments) particles over the whole
+        timestep, each particle taking the number of substeps (`n_substeps`, per cell)
+        of the cell it is currently in, removing the ones leaving the domain;
+        returns the precipitated water mass"""
+        rainfall_mass = self.backend.displacement_with_per_cell_substeps(
+            courant=courant,
+            n_substeps=n_substeps,
+            n_substeps_max=n_substeps_max,
+            grid=self.mesh.grid,
+            strides=self.mesh.strides,
+            displacement=displacement,
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            idx=self.attributes._ParticleAttributes__idx,
+            cell_start=self.attributes.cell_start,
+            cell_order=cell_order,
+            dynamic_schedule=dynamic_schedule,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            domain_top_level_index=self.mesh.grid[-1],
+            relative_fall_velocity=(
+                self.attributes["relative fall velocity"] if sedimentation else None
+            ),
+            dt_over_dz=self.dt / self.mesh.dz if sedimentation else 0,
+            water_mass=self.attributes["water mass"],
+            multiplicity=self.attributes["multiplicity"],
+            precipitation_counting_level_index=precipitation_counting_level_index,
+        )
+        self.attributes.sanitize()
+        self.recalculate_cell_id()
+        return rainfall_mass
+
     def calculate_displacement(
         self, *, displacement, courant, cell_origin, position_in_cell, n_substeps
     ):
@@ -453,7 +632,15 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         seeded_particle_extensive_attributes,
         number_of_super_particles_to_inject,
     ):
-        n_null = self.n_sd - self.attributes.super_droplet_count
+        n_null = self.attributes.vacant_slot_count
+        if self.growable_storage and number_of_super_particles_to_inject > n_null:
+            self.reserve(
+                max(
+                    2 * self.n_sd,
+                    self.n_sd + number_of_super_particles_to_inject - n_null,
+                )
+            )
+            n_null = self.attributes.vacant_slot_count
         if n_null == 0:
             raise ValueError(
                 "No available seeds to inject. Please provide particles with nan filled attributes."
@@ -470,23 +657,20 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 Instead increase multiplicity of injected particles."
             )
 
-        self.backend.seeding(
-            idx=self.attributes._ParticleAttributes__idx,
-            multiplicity=self.attributes["multiplicity"],
-            extensive_attributes=self.attributes.get_extensive_attribute_storage(),
+        self.attributes.inject(
             seeded_particle_index=seeded_particle_index,
             seeded_particle_multiplicity=seeded_particle_multiplicity,
             seeded_particle_extensive_attributes=seeded_particle_extensive_attributes,
             number_of_super_particles_to_inject=number_of_super_particles_to_inject,
         )
-        self.attributes.reset_idx()
-        self.attributes.sanitize()
 
         self.attributes.mark_updated("multiplicity")
         for key in self.attributes.get_extensive_attribute_keys():
             self.attributes.mark_updated(key)
 
-    def deposition(self, adaptive: bool):
+    def deposition(
+        self, *, adaptive: bool, n_substeps, cell_order, dynamic_schedule: bool
+    ):
         self.backend.deposition(
             adaptive=adaptive,
             multiplicity=self.attributes["multiplicity"],
@@ -496,7 +680,11 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             current_dry_potential_temperature=self.environment["thd"],
             cell_volume=self.environment.mesh.dv,
             time_step=self.dt,
-            cell_id=self.attributes["cell id"],
+            cell_start_arg=self.attributes.cell_start,
+            idx=self.attributes._ParticleAttributes__idx,
+            n_substeps=n_substeps,
+            cell_order=cell_order,
+            dynamic_schedule=dynamic_schedule,
             predicted_vapour_mixing_ratio=self.environment.get_predicted(
                 "water_vapour_mixing_ratio"
             ),
@@ -6,3 +6,4 @@ from .activable_fraction import ActivableFraction
 from .condensation_timestep import CondensationTimestepMax, CondensationTimestepMin
 from .event_rates import ActivatingRate, DeactivatingRate, RipeningRate
 from .peak_saturation import PeakSaturation
+from .trial_solves import CondensationTrialSolves
@@ -0,0 +1,38 @@
+"""
+mean (over timesteps) number of adaptivity trial solves per cell in the
+ `PySDM.dynamics.condensation.Condensation` dynamic, not including trials reused
+ as the first substep (fetching a value resets the counter)
+"""
+
+import numpy as np
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class CondensationTrialSolves(Product):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit)
+        self.condensation = None
+        self.timestep_count = 0
+        self.trial_solve_count = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.particulator.observers.append(self)
+        self.condensation = self.particulator.dynamics["Condensation"]
+        self.trial_solve_count = np.zeros_like(self.buffer)
+
+    def notify(self):
+        self.timestep_count += 1
+        self._download_to_buffer(self.condensation.counters["n_trial_solves"])
+        self.trial_solve_count[:] += self.buffer[:]
+
+    def _impl(self, **kwargs):
+        if self.timestep_count == 0:
+            self.buffer[:] = np.nan
+        else:
+            self.buffer[:] = self.trial_solve_count / self.timestep_count
+        self.trial_solve_count[:] = 0
+        self.timestep_count = 0
+        return self.buffer
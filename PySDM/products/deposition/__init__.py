@@ -0,0 +1,6 @@
+"""
+products pertinent to the
+ `PySDM.dynamics.vapour_deposition_on_ice.VapourDepositionOnIce` dynamic
+"""
+
+from .deposition_substeps import DepositionSubstepsMax, DepositionSubstepsMean
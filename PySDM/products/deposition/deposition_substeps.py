@@ -0,0 +1,22 @@
+"""
+maximum and mean (over timesteps) number of vapour deposition substeps in each cell
+ (fetching a value resets the counter)
+"""
+
+from PySDM.products.impl import SubstepsProduct, register_product
+
+
+@register_product()
+class DepositionSubstepsMax(SubstepsProduct):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(
+            name=name, unit=unit, dynamic="VapourDepositionOnIce", statistic="max"
+        )
+
+
+@register_product()
+class DepositionSubstepsMean(SubstepsProduct):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(
+            name=name, unit=unit, dynamic="VapourDepositionOnIce", statistic="mean"
+        )
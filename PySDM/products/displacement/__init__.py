@@ -3,6 +3,7 @@ products pertinent to the `PySDM.dynamics.displacement.Displacement` dynamic
 """
 
 from .averaged_terminal_velocity import AveragedTerminalVelocity
+from .displacement_substeps import DisplacementSubstepsMax, DisplacementSubstepsMean
 from .flow_velocity_component import FlowVelocityComponent
 from .max_courant_number import MaxCourantNumber
 from .surface_precipitation import SurfacePrecipitation
@@ -0,0 +1,19 @@
+"""
+maximum and mean (over timesteps) number of displacement substeps in each cell
+ (with `per_cell_substeps` set in `PySDM.dynamics.displacement.Displacement`, otherwise
+ the domain-wide number; fetching a value resets the counter)
+"""
+
+from PySDM.products.impl import SubstepsProduct, register_product
+
+
+@register_product()
+class DisplacementSubstepsMax(SubstepsProduct):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit, dynamic="Displacement", statistic="max")
+
+
+@register_product()
+class DisplacementSubstepsMean(SubstepsProduct):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit, dynamic="Displacement", statistic="mean")
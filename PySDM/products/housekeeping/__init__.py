@@ -3,6 +3,7 @@ Housekeeping products: time, super-particle count, wall-time timers...
 """
 
 from .dynamic_wall_time import DynamicWallTime
+from .profiled_wall_time import ProfiledWallTime
 from .super_droplet_count_per_gridbox import SuperDropletCountPerGridbox
 from .time import Time
 from .timers import CPUTime, WallTime
@@ -0,0 +1,28 @@
+"""
+wall-time spent in a given backend method or derived-attribute recalculation
+ as recorded by `PySDM.impl.profiler.Profiler` (fetching a value resets the counter)
+"""
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class ProfiledWallTime(Product):
+    def __init__(self, method, name=None, unit="s"):
+        super().__init__(name=name, unit=unit)
+        self.method = method
+        self.last_total_time = 0
+
+    def register(self, builder):
+        super().register(builder)
+        self.shape = ()
+
+    def _impl(self, **kwargs):
+        assert (
+            self.particulator.profiler is not None
+        ), "profiling is not enabled (see the `profiling` argument of Builder.build())"
+        record = self.particulator.profiler.records.get(self.method)
+        total_time = 0 if record is None else record["total time"]
+        result = max(0, total_time - self.last_total_time)
+        self.last_total_time = total_time
+        return result
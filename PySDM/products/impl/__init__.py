@@ -4,6 +4,7 @@ from PySDM.products.impl.moist_environment_product import MoistEnvironmentProduc
 from PySDM.products.impl.moment_product import MomentProduct
 from PySDM.products.impl.product import Product
 from PySDM.products.impl.rate_product import RateProduct
+from PySDM.products.impl.substeps_product import SubstepsProduct
 from PySDM.products.impl.spectrum_moment_product import SpectrumMomentProduct
 from PySDM.products.impl.concentration_product import ConcentrationProduct
 from PySDM.products.impl.activation_filtered_product import ActivationFilteredProduct
@@ -33,6 +33,17 @@ class MomentProduct(Product, ABC):
         weighting_rank=0,
         skip_division_by_m0=False,
     ):
+        if self.particulator.moments_planner is not None:
+            self.buffer.ravel()[:] = self.particulator.moments_planner.moment(
+                attr=attr,
+                rank=rank,
+                filter_attr=filter_attr,
+                filter_range=filter_range,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+                skip_division_by_m0=skip_division_by_m0,
+            )
+            return
         self.particulator.moments(
             moment_0=self.moment_0,
             moments=self.moments,
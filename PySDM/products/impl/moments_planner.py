@@ -0,0 +1,143 @@
+"""
+product-evaluation planner deduplicating statistical-moment requests of
+ `PySDM.products.impl.moment_product.MomentProduct` and
+ `PySDM.products.impl.spectrum_moment_product.SpectrumMomentProduct` instances
+ so that products requesting the same moments within an output step share
+ the results of a single backend call
+"""
+
+import numpy as np
+
+
+class MomentsPlanner:
+    """groups requests by filter attribute, filter range and weighting; within a group,
+    all ranks of a given attribute (together with the zeroth moment) are obtained in
+    a single backend pass, and the (host-side) results are shared among all products
+    until the particle state changes (next timestep, or any involved attribute update);
+    the set of ranks per group is learnt on the fly, hence from the second output step
+    on each group is evaluated only once per step; note that this is deduplication
+    only: a group still costs one backend pass per distinct attribute (the backend
+    moment kernels accumulate a single attribute), and binned spectra are shared
+    only between requests identical in attribute, rank, bins, filter and weighting
+    (one backend pass each)"""
+
+    def __init__(self, particulator):
+        self.particulator = particulator
+        self.groups = {}
+        self.spectra = {}
+
+    def _signature(self, attributes):
+        return (
+            self.particulator.n_steps,
+            self.particulator.attributes.super_droplet_count,
+            *(
+                self.particulator.attributes.get_timestamp(key)
+                for key in ("multiplicity", "cell id", *sorted(set(attributes)))
+            ),
+        )
+
+    def moment(
+        self,
+        *,
+        attr,
+        rank,
+        filter_attr,
+        filter_range,
+        weighting_attribute,
+        weighting_rank,
+        skip_division_by_m0,
+    ):
+        """returns a host copy of the requested moment (or of the zeroth moment if
+        `rank == 0`) computed as in `PySDM.particulator.Particulator.moments`"""
+        key = (filter_attr, tuple(filter_range), weighting_attribute, weighting_rank)
+        if key not in self.groups:
+            self.groups[key] = {"specs": {}, "signature": None, "results": None}
+        group = self.groups[key]
+
+        if rank != 0 and rank not in group["specs"].setdefault(attr, []):
+            group["specs"][attr].append(rank)
+            group["signature"] = None
+
+        signature = self._signature(
+            (filter_attr, weighting_attribute, *group["specs"].keys())
+        )
+        if group["signature"] != signature:
+            group["results"] = self._evaluate_group(key, group["specs"])
+            group["signature"] = signature
+
+        moment_0, moments = group["results"]
+        if rank == 0:
+            return moment_0.copy()
+        result = moments[attr][group["specs"][attr].index(rank)].copy()
+        if not skip_division_by_m0:
+            np.divide(result, moment_0, out=result, where=moment_0 != 0)
+            result[moment_0 == 0] = 0
+        return result
+
+    def _evaluate_group(self, key, specs):
+        filter_attr, filter_range, weighting_attribute, weighting_rank = key
+        n_cell = self.particulator.mesh.n_cell
+        moment_0 = self.particulator.Storage.empty(n_cell, dtype=float)
+
+        results = {}
+        for attr, ranks in (specs or {filter_attr: [0]}).items():
+            moments = self.particulator.Storage.empty((len(ranks), n_cell), dtype=float)
+            self.particulator.moments(
+                moment_0=moment_0,
+                moments=moments,
+                specs={attr: tuple(ranks)},
+                attr_name=filter_attr,
+                attr_range=filter_range,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+                skip_division_by_m0=True,
+            )
+            results[attr] = moments.to_ndarray().reshape((len(ranks), n_cell))
+        return moment_0.to_ndarray(), results
+
+    def spectrum_moments(
+        self,
+        *,
+        attr,
+        rank,
+        attr_bins,
+        filter_attr,
+        weighting_attribute,
+        weighting_rank,
+    ):
+        """returns host copies of the zeroth and `rank`-th binned moments computed
+        as in `PySDM.particulator.Particulator.spectrum_moments`"""
+        bins = attr_bins.to_ndarray()
+        key = (
+            attr,
+            rank,
+            tuple(bins),
+            filter_attr,
+            weighting_attribute,
+            weighting_rank,
+        )
+        if key not in self.spectra:
+            self.spectra[key] = {"signature": None, "results": None}
+        spectrum = self.spectra[key]
+
+        signature = self._signature((attr, filter_attr, weighting_attribute))
+        if spectrum["signature"] != signature:
+            shape = (len(bins) - 1, self.particulator.mesh.n_cell)
+            moment_0 = self.particulator.Storage.empty(shape, dtype=float)
+            moments = self.particulator.Storage.empty(shape, dtype=float)
+            self.particulator.spectrum_moments(
+                moment_0=moment_0,
+                moments=moments,
+                attr=attr,
+                rank=rank,
+                attr_bins=attr_bins,
+                attr_name=filter_attr,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+            )
+            spectrum["results"] = (
+                moment_0.to_ndarray().reshape(shape),
+                moments.to_ndarray().reshape(shape),
+            )
+            spectrum["signature"] = signature
+        return spectrum["results"]
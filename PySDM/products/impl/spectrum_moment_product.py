@@ -15,6 +15,7 @@ class SpectrumMomentProduct(ABC, Product):
         self.attr_unit = attr_unit
         self.moment_0 = None
         self.moments = None
+        self.planned_moments = None
 
     def register(self, builder):
         super().register(builder)
@@ -35,6 +36,16 @@ class SpectrumMomentProduct(ABC, Product):
         weighting_attribute="volume",
         weighting_rank=0,
     ):
+        if self.particulator.moments_planner is not None:
+            self.planned_moments = self.particulator.moments_planner.spectrum_moments(
+                attr=attr,
+                rank=rank,
+                attr_bins=self.attr_bins_edges,
+                filter_attr=filter_attr,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+            )
+            return
         self.particulator.spectrum_moments(
             moment_0=self.moment_0,
             moments=self.moments,
@@ -47,6 +58,11 @@ class SpectrumMomentProduct(ABC, Product):
         )
 
     def _download_spectrum_moment_to_buffer(self, rank, bin_number):
+        if self.planned_moments is not None:
+            self.buffer.ravel()[:] = self.planned_moments[0 if rank == 0 else 1][
+                bin_number
+            ]
+            return
         if rank == 0:  # TODO #217
             self._download_to_buffer(self.moment_0[bin_number, :])
         else:
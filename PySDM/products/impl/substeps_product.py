@@ -0,0 +1,42 @@
+"""
+common code for products representing maximum or mean (over timesteps) per-cell
+ substep counts of a dynamic (fetching a value resets the counter)
+"""
+
+import numpy as np
+
+from PySDM.products.impl.product import Product
+
+
+class SubstepsProduct(Product):
+    def __init__(self, *, name, unit, dynamic, statistic):
+        super().__init__(name=name, unit=unit)
+        if statistic not in ("max", "mean"):
+            raise ValueError(statistic)
+        self.dynamic = dynamic
+        self.statistic = statistic
+        self.value = None
+        self.count = 0
+
+    def register(self, builder):
+        super().register(builder)
+        self.particulator.observers.append(self)
+        self.dynamic = self.particulator.dynamics[self.dynamic]
+        self.value = np.zeros_like(self.buffer)
+
+    def notify(self):
+        self._download_to_buffer(self.dynamic.n_substeps)
+        if self.statistic == "max":
+            self.value[:] = np.maximum(self.buffer, self.value)
+        else:
+            self.value[:] += self.buffer
+        self.count += 1
+
+    def _impl(self, **kwargs):
+        if self.statistic == "max":
+            self.buffer[:] = self.value[:]
+        else:
+            self.buffer[:] = self.value / self.count if self.count > 0 else np.nan
+        self.value[:] = 0
+        self.count = 0
+        return self.buffer
@@ -1,8 +1,9 @@
 """
-parcel displacement, for use with `PySDM.environments.parcel.Parcel` environment only
+parcel displacement, for use with `PySDM.environments.parcel.Parcel`
+ and `PySDM.environments.multi_parcel.MultiParcel` environments only
 """
 
-from PySDM.environments import Parcel
+from PySDM.environments import MultiParcel, Parcel
 from PySDM.products.impl import Product, register_product
 
 
@@ -14,7 +15,7 @@ class ParcelDisplacement(Product):
 
     def register(self, builder):
         super().register(builder)
-        assert isinstance(builder.particulator.environment, Parcel)
+        assert isinstance(builder.particulator.environment, (Parcel, MultiParcel))
         self.environment = builder.particulator.environment
 
     def _impl(self, **kwargs):
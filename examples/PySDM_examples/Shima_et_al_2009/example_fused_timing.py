@@ -0,0 +1,65 @@
+import os
+
+from matplotlib import pyplot as plt
+from PySDM_examples.Shima_et_al_2009.settings import Settings
+
+from PySDM.backends import Numba
+from PySDM.builder import Builder
+from PySDM.dynamics import Coalescence
+from PySDM.environments import Box
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.products import WallTime
+
+
+def run(settings, backend, *, fused, adaptive):
+    env = Box(dv=settings.dv, dt=settings.dt)
+    builder = Builder(n_sd=settings.n_sd, backend=backend, environment=env)
+    attributes = {}
+    sampling = ConstantMultiplicity(settings.spectrum)
+    attributes["volume"], attributes["multiplicity"] = sampling.sample(settings.n_sd)
+    builder.add_dynamic(
+        Coalescence(collision_kernel=settings.kernel, adaptive=adaptive, fused=fused)
+    )
+    particles = builder.build(attributes, products=(WallTime(),))
+
+    last_wall_time = None
+    for step in settings.output_steps:
+        particles.run(step - particles.n_steps)
+        last_wall_time = particles.products["wall time"].get()
+
+    return last_wall_time
+
+
+def main(plot: bool):
+    settings = Settings()
+    settings.steps = [0, 100] if "CI" not in os.environ else [0, 2]
+    backend = Numba()
+
+    times = {}
+    nsds = [2**n for n in range(12, 19, 3)]
+    for adaptive in (False, True):
+        for fused in (False, True):
+            key = f"{'fused' if fused else 'composed'} ({'adaptive' if adaptive else 'fixed'} dt)"
+            settings.n_sd = nsds[0]
+            run(settings, backend, fused=fused, adaptive=adaptive)  # JIT warm-up
+            times[key] = []
+            for sd in nsds:
+                settings.n_sd = sd
+                times[key].append(
+                    run(settings, backend, fused=fused, adaptive=adaptive)
+                )
+
+    for key, t in times.items():
+        plt.plot(nsds, t, label=key, linestyle="--", marker="o")
+    plt.ylabel("wall time [s]")
+    plt.xlabel("number of particles")
+    plt.grid()
+    plt.legend()
+    plt.loglog(base=2)
+    if plot:
+        plt.show()
+    return nsds, times
+
+
+if __name__ == "__main__":
+    main(plot="CI" not in os.environ)
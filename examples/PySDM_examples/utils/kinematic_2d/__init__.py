@@ -16,4 +16,4 @@ and dry-air potential temperature.
 from .gui_settings import GUISettings
 from .mpdata_2d import MPDATA_2D
 from .simulation import Simulation
-from .storage import Storage
+from .storage import MemmapStorage, Storage
@@ -5,7 +5,7 @@ from pathlib import Path
 import numpy as np
 
 
-class Storage:
+class Storage:  # pylint: disable=too-many-instance-attributes
     class Exception(BaseException):
         pass
 
@@ -19,11 +19,15 @@ class Storage:
         self.dtype = dtype
         self.grid = None
         self._data_range = None
+        self._step_index = None
+        self._arrays = None
+        self._saved = None
 
     def __del__(self):
         self.cleanup()
 
     def cleanup(self):
+        self._arrays = None
         if self.temp_dir is not None:
             self.temp_dir.cleanup()
 
@@ -33,10 +37,15 @@ class Storage:
         self.dir_path = self.temp_dir.name
 
     def init(self, settings):
-        self.grid = settings.grid
-        self._data_range = {}
         if self.temp_dir is not None and any(os.scandir(self.temp_dir.name)):
             self.setup_temporary_directory()
+        self.grid = settings.grid
+        self._data_range = {}
+        self._arrays = {}
+        self._saved = {}
+        self._step_index = {
+            int(step): i for i, step in enumerate(settings.output_steps)
+        }
 
     def _filepath(self, name: str, step: int = None):
         if step is None:
@@ -46,20 +55,33 @@ class Storage:
         path = os.path.join(self.dir_path, filename)
         return path
 
+    def _write(self, data, step: int, name: str):
+        """writes `data` into the slot of the given output step in a memory-mapped
+        `.npy` file holding all output steps of a product (created on first write)"""
+        if name not in self._arrays:
+            self._arrays[name] = np.lib.format.open_memmap(
+                self._filepath(name),
+                mode="w+",
+                dtype=self.dtype,
+                shape=(len(self._step_index),) + np.shape(data),
+            )
+            self._saved[name] = np.zeros(len(self._step_index), dtype=bool)
+        index = self._step_index[step]
+        self._arrays[name][index] = data
+        self._saved[name][index] = True
+
     def save(self, data: (float, np.ndarray), step: int, name: str):
+        """scalar products (e.g., time series) are written in place into a file
+        preallocated for all `settings.output_steps` (gridded ones: file per step)"""
         if isinstance(data, (int, float)):
-            path = self._filepath(name)
-            np.save(
-                path,
-                np.concatenate(
-                    (() if step == 0 else np.load(path), (self.dtype(data),))
-                ),
-            )
+            self._write(data, step, name)
         elif data.shape[0:2] == self.grid:
             np.save(self._filepath(name, step), data.astype(self.dtype))
         else:
             raise NotImplementedError()
+        self._update_data_range(data, name)
 
+    def _update_data_range(self, data, name):
         if name not in self._data_range:
             self._data_range[name] = (np.inf, -np.inf)
         just_nans = np.isnan(data).all()
@@ -77,9 +99,44 @@ class Storage:
     def data_range(self, name):
         return self._data_range[name]
 
+    def _saved_series(self, name: str) -> np.ndarray:
+        if self._arrays[name].ndim != 1:
+            raise Storage.Exception()
+        return self._arrays[name][: np.count_nonzero(self._saved[name])]
+
     def load(self, name: str, step: int = None) -> np.ndarray:
+        if step is None and self._arrays is not None and name in self._arrays:
+            return np.array(self._saved_series(name))
         try:
             data = np.load(self._filepath(name, step))
         except FileNotFoundError as err:
             raise Storage.Exception() from err
         return data
+
+
+class MemmapStorage(Storage):
+    """stores all products (not only scalar ones, see `Storage.save`) in memory-mapped
+    `.npy` files (one per product) preallocated for all `settings.output_steps` upon
+    first save, so that each output step costs a single in-place write; `load()`
+    returns views of the mapped arrays (scalar products: values saved so far,
+    gridded products: the given step)"""
+
+    def save(self, data: (float, np.ndarray), step: int, name: str):
+        if not isinstance(data, (int, float)) and data.shape[0:2] != self.grid:
+            raise NotImplementedError()
+        self._write(data, step, name)
+        self._update_data_range(data, name)
+
+    def load(self, name: str, step: int = None) -> np.ndarray:
+        if name not in self._arrays:
+            raise Storage.Exception()
+        if step is None:
+            return self._saved_series(name)
+        index = self._step_index.get(step)
+        if index is None or not self._saved[name][index]:
+            raise Storage.Exception()
+        return self._arrays[name][index]
+
+    def flush(self):
+        for array in self._arrays.values():
+            array.flush()
@@ -63,6 +63,7 @@ optional_dependencies = {
         ),  # matplotlib triggers deprecation warnings in 11.3.0
         "pytest",
         "pytest-timeout",
+        "netCDF4",
         "PySDM-examples",
         "open-atmos-jupyter-utils>=v1.2.0",
     ]
@@ -0,0 +1,88 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+from collections import namedtuple
+
+import numpy as np
+import pytest
+from PySDM_examples.utils.kinematic_2d import MemmapStorage, Storage
+
+GRID = (3, 4)
+OUTPUT_STEPS = np.arange(0, 10, 3)
+
+
+@pytest.fixture(name="settings")
+def settings_fixture():
+    return namedtuple("Settings", ("grid", "output_steps"))(
+        grid=GRID, output_steps=OUTPUT_STEPS
+    )
+
+
+def _save_all(storage, settings):
+    storage.init(settings)
+    for i, step in enumerate(settings.output_steps):
+        storage.save(float(i), step, "scalar")
+        storage.save(np.full(GRID, float(i)), step, "field")
+        storage.save(np.full(GRID + (2,), -float(i)), step, "spectrum")
+
+
+def test_memmap_storage_matches_storage(settings, tmp_path):
+    # arrange
+    reference = Storage(path=tmp_path / "reference")
+    sut = MemmapStorage(path=tmp_path / "sut")
+
+    # act
+    for storage in (reference, sut):
+        _save_all(storage, settings)
+
+    # assert
+    np.testing.assert_array_equal(sut.load("scalar"), reference.load("scalar"))
+    for step in settings.output_steps:
+        for name in ("field", "spectrum"):
+            np.testing.assert_array_equal(
+                sut.load(name, step), reference.load(name, step)
+            )
+    for name in ("scalar", "field", "spectrum"):
+        assert sut.data_range(name) == reference.data_range(name)
+
+
+def test_memmap_storage_loads_views(settings, tmp_path):
+    # arrange
+    sut = MemmapStorage(path=tmp_path)
+    _save_all(sut, settings)
+
+    # act
+    field = sut.load("field", settings.output_steps[-1])
+
+    # assert
+    assert isinstance(field, np.memmap)
+    assert not field.flags.owndata
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_memmap_storage_raises_for_unsaved_step(settings, tmp_path):
+    # arrange
+    sut = MemmapStorage(path=tmp_path)
+    sut.init(settings)
+    sut.save(np.zeros(GRID), settings.output_steps[0], "field")
+
+    # act & assert
+    with pytest.raises(Storage.Exception):
+        sut.load("field", settings.output_steps[1])
+    with pytest.raises(Storage.Exception):
+        sut.load("other field", settings.output_steps[0])
+
+
+def test_storage_writes_scalar_series_in_place(settings, tmp_path):
+    # arrange
+    sut = Storage(path=tmp_path)
+    sut.init(settings)
+
+    # act
+    for i, step in enumerate(settings.output_steps[:2]):
+        sut.save(float(i), step, "scalar")
+
+    # assert
+    np.testing.assert_array_equal(sut.load("scalar"), (0, 1))
+    assert [path.name for path in tmp_path.iterdir()] == ["scalar.npy"]
+    assert np.load(tmp_path / "scalar.npy", mmap_mode="r").shape == (
+        len(settings.output_steps),
+    )
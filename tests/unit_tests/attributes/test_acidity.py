@@ -55,6 +55,7 @@ class TestAcidity:
             # output
             do_chemistry_flag=np.empty(1),
             pH=result,
+            last_pH_change=np.zeros(1),
             # params
             H_min=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
             H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
@@ -148,6 +149,7 @@ class TestAcidity:
             # output
             do_chemistry_flag=np.empty(1),
             pH=actual_pH,
+            last_pH_change=np.zeros(1),
             # params
             H_min=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
             H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
@@ -156,3 +158,58 @@ class TestAcidity:
         )
 
         np.testing.assert_allclose(actual_pH[0], expected_pH, rtol=1e-5)
+
+    @staticmethod
+    def test_equilibrate_pH_warm_start_matches_cold_start():
+        # Arrange
+        eqs = {
+            key: np.full(1, const.at(FORMULAE.constants.ROOM_TEMP))
+            for key, const in EQUILIBRIUM_CONST.items()
+        }
+
+        def equilibrate(pH, last_pH_change, S_IV):
+            ChemistryMethods.equilibrate_H_body(
+                within_tolerance=FORMULAE.trivia.within_tolerance,
+                pH2H=FORMULAE.trivia.pH2H,
+                H2pH=FORMULAE.trivia.H2pH,
+                conc=_conc(
+                    N_mIII=np.full(1, 5e-3 * 1e3),
+                    N_V=np.zeros(1),
+                    C_IV=np.full(1, 0.01e-3 * 1e3),
+                    S_IV=np.full(1, S_IV),
+                    S_VI=np.zeros(1),
+                ),
+                K=_K(
+                    HNO3=eqs["K_HNO3"],
+                    HCO3=eqs["K_HCO3"],
+                    HSO3=eqs["K_HSO3"],
+                    HSO4=eqs["K_HSO4"],
+                    CO2=eqs["K_CO2"],
+                    NH3=eqs["K_NH3"],
+                    SO2=eqs["K_SO2"],
+                ),
+                cell_id=np.zeros(1, dtype=int),
+                # output
+                do_chemistry_flag=np.empty(1),
+                pH=pH,
+                last_pH_change=last_pH_change,
+                # params
+                H_min=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
+                H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
+                ionic_strength_threshold=aqueous_chemistry.DEFAULTS.ionic_strength_threshold,
+                rtol=aqueous_chemistry.DEFAULTS.pH_rtol,
+            )
+
+        pH = np.full(1, FORMULAE.constants.pH_w)
+        last_pH_change = np.zeros(1)
+        equilibrate(pH, last_pH_change, S_IV=0.005e-3 * 1e3)
+        warm_pH = pH.copy()
+        cold_pH = pH.copy()
+
+        # Act
+        equilibrate(warm_pH, last_pH_change, S_IV=0.006e-3 * 1e3)
+        equilibrate(cold_pH, np.zeros(1), S_IV=0.006e-3 * 1e3)
+
+        # Assert
+        assert np.isfinite(last_pH_change).all() and (last_pH_change > 0).all()
+        np.testing.assert_allclose(warm_pH, cold_pH, rtol=1e-5)
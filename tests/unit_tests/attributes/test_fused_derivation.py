@@ -0,0 +1,125 @@
+"""checks for single-sweep evaluation of element-wise derived attributes"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU, GPU
+from PySDM.environments import Box
+from PySDM.impl.profiler import ATTRIBUTE_PREFIX
+from PySDM.physics import si
+
+N_SD = 64
+ATTRIBUTES = (
+    "volume",
+    "radius",
+    "square root of radius",
+    "area",
+    "terminal velocity",
+    "Reynolds number",
+)
+
+
+def _make_particulator(
+    *, fused, terminal_velocity="GunnKinzer1949", backend=CPU, profiling=False
+):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend(
+            Formulae(
+                ventilation="Froessling1938",
+                terminal_velocity=terminal_velocity,
+                fastmath=False,
+            )
+        ),
+        environment=Box(dt=None, dv=None),
+    )
+    for attribute in ATTRIBUTES:
+        builder.request_attribute(attribute)
+    particulator = builder.build(
+        attributes={
+            "water mass": np.logspace(-3, 2, N_SD) * si.ug,
+            "multiplicity": np.ones(N_SD),
+        },
+        fused_derived_attributes=fused,
+        profiling=profiling,
+    )
+    particulator.environment["air dynamic viscosity"] = 2e-5 * si.Pa * si.s
+    particulator.environment["air density"] = 1 * si.kg / si.m**3
+    return particulator
+
+
+@pytest.mark.parametrize(
+    "terminal_velocity", ("GunnKinzer1949", "RogersYau", "PowerSeries")
+)
+def test_fused_matches_separate(terminal_velocity):
+    # arrange
+    reference = _make_particulator(fused=False, terminal_velocity=terminal_velocity)
+    sut = _make_particulator(fused=True, terminal_velocity=terminal_velocity)
+
+    for particulator in (reference, sut):
+        # act
+        particulator.attributes["Reynolds number"].to_ndarray()
+        particulator.attributes["water mass"].data[:] *= 2
+        particulator.attributes.mark_updated("signed water mass")
+
+    # assert
+    for attribute in ATTRIBUTES:
+        np.testing.assert_array_equal(
+            sut.attributes[attribute].to_ndarray(),
+            reference.attributes[attribute].to_ndarray(),
+        )
+
+
+def test_single_sweep_and_no_recalculation_if_unchanged():
+    # arrange
+    sut = _make_particulator(fused=True, profiling=True)
+
+    for attribute in ATTRIBUTES:
+        sut.attributes[attribute].to_ndarray()
+    timestamps = {key: sut.attributes.get_timestamp(key) for key in ATTRIBUTES}
+    sut.profiler.reset()
+
+    # act
+    sut.attributes.mark_updated("signed water mass")
+    # "Reynolds number" depends on "relative fall velocity" (a separate instance
+    #  of the terminal velocity attribute), hence "terminal velocity" is requested first
+    sut.attributes["terminal velocity"].to_ndarray()
+    n_sweeps_for_terminal_velocity = sut.profiler.report()["fused_elementwise"]["calls"]
+    sut.attributes["Reynolds number"].to_ndarray()
+    n_sweeps_for_chain = sut.profiler.report()["fused_elementwise"]["calls"]
+    for key in ("volume", "radius", "terminal velocity", "Reynolds number"):
+        sut.attributes[key].to_ndarray()
+    n_sweeps_if_unchanged = (
+        sut.profiler.report()["fused_elementwise"]["calls"] - n_sweeps_for_chain
+    )
+
+    # assert
+    assert n_sweeps_for_terminal_velocity == 1
+    assert n_sweeps_for_chain == 2
+    assert n_sweeps_if_unchanged == 0
+    for key in ("volume", "radius", "terminal velocity", "Reynolds number"):
+        assert sut.attributes.get_timestamp(key) == timestamps[key] + 1
+    report = sut.profiler.report()
+    assert not any(ATTRIBUTE_PREFIX + key in report for key in ATTRIBUTES)
+
+
+def test_gunn_kinzer_range_check():
+    # arrange
+    sut = _make_particulator(fused=True)
+    sut.attributes["water mass"].data[0] = 1 * si.g
+    sut.attributes.mark_updated("signed water mass")
+
+    # act & assert
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            sut.attributes["terminal velocity"].to_ndarray()
+
+
+def test_gpu_not_supported():
+    # arrange
+    sut = _make_particulator(fused=True, backend=GPU)
+
+    # act & assert
+    with pytest.raises(NotImplementedError):
+        sut.attributes["radius"].to_ndarray()
@@ -79,6 +79,37 @@ class TestCollisionMethods:
         # Assert
         assert actual == expected
 
+    @staticmethod
+    @pytest.mark.parametrize("n_cell", (1, 5, 44, 1000))
+    def test_adaptive_sdm_schedule_matches_sort_by_key(backend_instance, n_cell):
+        # Arrange
+        backend = backend_instance
+        index = make_Index(backend)
+        rng = np.random.default_rng(seed=44)
+        dt_left = np.full(n_cell, 10.0)
+        active_cells = backend.Storage.from_ndarray(np.arange(n_cell)[::-1].copy())
+        removed_cells = backend.Storage.empty(n_cell, dtype=int)
+        sut = index.identity_index(n_cell)
+        reference = index.identity_index(n_cell)
+        n_active = n_cell
+
+        while dt_left.any():
+            # Act
+            n_active = backend.adaptive_sdm_schedule(
+                cell_idx=sut,
+                dt_left=backend.Storage.from_ndarray(dt_left),
+                active_cells=active_cells,
+                removed_cells=removed_cells,
+                n_active=n_active,
+            )
+            reference.sort_by_key(backend.Storage.from_ndarray(dt_left))
+
+            # Assert
+            np.testing.assert_array_equal(sut.to_ndarray(), reference.to_ndarray())
+
+            dt_left -= rng.choice((0, 1, 2.5), size=n_cell)
+            dt_left[dt_left < 0] = 0
+
     @staticmethod
     @pytest.mark.parametrize(
         "gamma, idx, n, cell_id, dt_left, dt, dt_max, "
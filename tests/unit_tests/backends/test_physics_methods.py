@@ -3,6 +3,9 @@ import numpy as np
 import pytest
 
 from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.backends.impl_common.index import make_Index
+from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.physics import si
 
 
@@ -102,3 +105,23 @@ class TestPhysicsMethods:
             ).all()
         else:
             raise NotImplementedError()
+
+    @staticmethod
+    def test_mass_to_volume_skips_removed_particles():
+        # Arrange
+        backend = CPU(Formulae(), double_precision=True)
+        idx = make_Index(backend).from_ndarray(np.asarray([3, 1, 0, 2]))
+        idx.length = 2
+        mass_in = make_IndexedStorage(backend).from_ndarray(
+            idx, np.asarray([1.0, 2.0, 3.0, 4.0])
+        )
+        volume_out = make_IndexedStorage(backend).from_ndarray(idx, np.full(4, -1.0))
+
+        # Act
+        backend.volume_of_water_mass(volume=volume_out, mass=mass_in)
+
+        # Assert
+        rho_w = backend.formulae.constants.rho_w
+        np.testing.assert_array_equal(
+            volume_out.to_ndarray(raw=True), (-1, 2 / rho_w, -1, 4 / rho_w)
+        )
@@ -156,3 +156,76 @@ class TestSeeding:
                     seeded_particle_index
                 ],
             )
+
+    @staticmethod
+    def test_slots_of_removed_super_particles_are_reused(n_sd=4):
+        # arrange
+        builder = Builder(n_sd, CPU(), Box(dt=np.nan, dv=np.nan))
+        particulator = builder.build(
+            attributes={
+                "multiplicity": np.full(n_sd, np.nan),
+                "water mass": np.zeros(n_sd),
+            },
+        )
+        seeded_particle_index = particulator.Index.identity_index(n_sd)
+        seeding_args = {
+            "seeded_particle_index": seeded_particle_index,
+            "seeded_particle_multiplicity": particulator.IndexedStorage.from_ndarray(
+                seeded_particle_index, np.arange(1, n_sd + 1)
+            ),
+            "seeded_particle_extensive_attributes": particulator.IndexedStorage.from_ndarray(
+                seeded_particle_index, np.ones((1, n_sd))
+            ),
+        }
+        particulator.seeding(**seeding_args, number_of_super_particles_to_inject=2)
+        multiplicity = particulator.attributes["multiplicity"]
+        multiplicity.data[multiplicity.idx.to_ndarray()[0]] = 0
+        particulator.attributes.healthy = False
+
+        # act
+        vacant_slot_count = particulator.attributes.vacant_slot_count
+        particulator.seeding(**seeding_args, number_of_super_particles_to_inject=3)
+
+        # assert
+        assert vacant_slot_count == n_sd - 1
+        assert particulator.attributes.vacant_slot_count == 0
+        assert particulator.attributes.super_droplet_count == n_sd
+        np.testing.assert_array_equal(
+            particulator.attributes["multiplicity"].to_ndarray(), (2, 1, 2, 3)
+        )
+
+    @staticmethod
+    def test_seeding_beyond_vacant_slots_grows_storage(n_sd=2):
+        # arrange
+        builder = Builder(n_sd, CPU(), Box(dt=np.nan, dv=np.nan))
+        particulator = builder.build(
+            attributes={
+                "multiplicity": np.asarray([7, np.nan]),
+                "water mass": np.asarray([1.0, 0.0]),
+            },
+            growable_storage=True,
+        )
+        seeded_particle_index = particulator.Index.identity_index(3)
+
+        # act
+        particulator.seeding(
+            seeded_particle_index=seeded_particle_index,
+            seeded_particle_multiplicity=particulator.IndexedStorage.from_ndarray(
+                seeded_particle_index, np.arange(1, 4)
+            ),
+            seeded_particle_extensive_attributes=particulator.IndexedStorage.from_ndarray(
+                seeded_particle_index, np.full((1, 3), 2.0)
+            ),
+            number_of_super_particles_to_inject=3,
+        )
+
+        # assert
+        assert particulator.n_sd == 4
+        assert particulator.attributes.super_droplet_count == 4
+        assert particulator.attributes.vacant_slot_count == 0
+        np.testing.assert_array_equal(
+            particulator.attributes["multiplicity"].to_ndarray(), (7, 1, 2, 3)
+        )
+        np.testing.assert_array_equal(
+            particulator.attributes["signed water mass"].to_ndarray(), (1, 2, 2, 2)
+        )
@@ -6,7 +6,11 @@ import numpy as np
 import pytest
 from scipy.optimize import toms748
 
-from PySDM.backends.impl_numba.toms748 import toms748_solve
+from PySDM.backends.impl_numba.toms748 import (
+    toms748_batch_workspace,
+    toms748_solve,
+    toms748_solve_batch,
+)
 from PySDM.formulae import Formulae
 
 # relevant
@@ -46,3 +50,141 @@ def test_toms748(fun):
     expected = toms748(fun, a, b)
 
     np.testing.assert_almost_equal(actual, expected)
+
+
+@numba.njit()
+def f3(x, shift):
+    return np.exp(x) - np.cos(x) - shift
+
+
+@numba.njit()
+def f3_batch(x, i, shifts):
+    return f3(x, shifts[i])
+
+
+def _solve_scalar(
+    sut, shifts, a, b, rtol, max_iter, wt
+):  # pylint: disable=too-many-arguments
+    x = np.empty_like(shifts)
+    iters = np.empty(len(shifts), dtype=np.int64)
+    for i, shift in enumerate(shifts):
+        x[i], iters[i] = sut(
+            f3,
+            (shift,),
+            ax=a,
+            bx=b,
+            fax=f3(a, shift),
+            fbx=f3(b, shift),
+            max_iter=max_iter,
+            rtol=rtol,
+            within_tolerance=wt,
+        )
+    return x, iters
+
+
+def _solve_batch(
+    sut, shifts, a, b, rtol, max_iter, wt
+):  # pylint: disable=too-many-arguments
+    n = len(shifts)
+    x = np.full(n, np.nan)
+    iters = np.full(n, -2, dtype=np.int64)
+    sut(
+        f3_batch,
+        (shifts,),
+        np.arange(n),
+        np.full(n, a),
+        np.full(n, b),
+        np.asarray([f3(a, shift) for shift in shifts]),
+        np.asarray([f3(b, shift) for shift in shifts]),
+        rtol,
+        np.full(n, max_iter),
+        wt,
+        x,
+        iters,
+        toms748_batch_workspace(n),
+    )
+    return x, iters
+
+
+@pytest.mark.parametrize("rtol", (1e-3, 1e-9, 1e-15))
+@pytest.mark.parametrize("max_iter", (2, 5, 32))
+def test_toms748_batch_matches_scalar(rtol, max_iter):
+    # arrange
+    jit = "NUMBA_DISABLE_JIT" in os.environ
+    shifts = np.linspace(-0.5, 1.5, 101)
+    shifts[0] = 10  # root outside of the bracket
+    wt = Formulae().trivia.within_tolerance
+    kwargs = {"a": -0.75, "b": 0.75, "rtol": rtol, "max_iter": max_iter, "wt": wt}
+
+    # act
+    expected = _solve_scalar(
+        toms748_solve if jit else toms748_solve.py_func, shifts, **kwargs
+    )
+    actual = _solve_batch(
+        toms748_solve_batch if jit else toms748_solve_batch.py_func, shifts, **kwargs
+    )
+
+    # assert
+    np.testing.assert_array_equal(actual[0], expected[0])
+    np.testing.assert_array_equal(actual[1], expected[1])
+    assert actual[1][0] == -1
+
+
+@numba.njit()
+def _scalar_path(
+    shifts, a, b, rtol, max_iter, wt
+):  # pylint: disable=too-many-arguments
+    x = np.empty_like(shifts)
+    for i, shift in enumerate(shifts):
+        x[i], _ = toms748_solve(
+            f3, (shift,), a, b, f3(a, shift), f3(b, shift), rtol, max_iter, wt
+        )
+    return x
+
+
+@numba.njit()
+def _batch_path(
+    shifts, a, b, rtol, max_iter, wt, workspace
+):  # pylint: disable=too-many-arguments
+    n = len(shifts)
+    x = np.empty(n)
+    iters = np.empty(n, dtype=np.int64)
+    toms748_solve_batch(
+        f3_batch,
+        (shifts,),
+        np.arange(n),
+        np.full(n, a),
+        np.full(n, b),
+        np.exp(a) - np.cos(a) - shifts,
+        np.exp(b) - np.cos(b) - shifts,
+        rtol,
+        np.full(n, max_iter),
+        wt,
+        x,
+        iters,
+        workspace,
+    )
+    return x
+
+
+def test_toms748_batch_reuses_workspace(n_problems=10_000):
+    """large set of problems solved twice (from JIT-compiled loops) using the same
+    workspace, and compared against the scalar solver"""
+    # arrange
+    args = (
+        np.linspace(-0.5, 1.5, n_problems),
+        -0.75,
+        0.75,
+        1e-12,
+        32,
+        Formulae().trivia.within_tolerance,
+    )
+    workspace = toms748_batch_workspace(n_problems)
+
+    # act
+    expected = _scalar_path(*args)
+    actual = [_batch_path(*args, workspace) for _ in range(2)]
+
+    # assert
+    for result in actual:
+        np.testing.assert_array_equal(result, expected)
@@ -3,13 +3,14 @@ import numpy as np
 import pytest
 
 from PySDM.backends import ThrustRTC
+from PySDM.backends.impl_common.index import make_Index
 from PySDM.initialisation.sampling.spectral_sampling import Linear
 from PySDM.initialisation.spectra.lognormal import Lognormal
 
 from ...dummy_particulator import DummyParticulator
 
 
-@pytest.mark.parametrize("croupier", ["local", "global"])
+@pytest.mark.parametrize("croupier", ["local", "global", "global_parallel"])
 def test_final_state(croupier, backend_class):
     if backend_class is ThrustRTC:
         pytest.skip("TODO #330")
@@ -41,7 +42,11 @@ def test_final_state(croupier, backend_class):
 
     # Act
     u01 = backend_class.Storage.from_ndarray(np.random.random(n_sd))
-    particulator.attributes.permutation(u01, local=particulator.croupier == "local")
+    particulator.attributes.permutation(
+        u01,
+        local=particulator.croupier == "local",
+        parallel=particulator.croupier == "global_parallel",
+    )
     _ = particulator.attributes.cell_start
 
     # Assert
@@ -51,3 +56,25 @@ def test_final_state(croupier, backend_class):
         ]
     )
     assert (diff >= 0).all()
+
+
+@pytest.mark.parametrize("n_sd", (1, 10, 1000, 44444))
+@pytest.mark.parametrize("length_fraction", (1, 0.5))
+def test_parallel_shuffler(backend_instance, n_sd, length_fraction):
+    # arrange
+    length = int(n_sd * length_fraction)
+    idx = make_Index(backend_instance).identity_index(n_sd)
+    idx.length = backend_instance.Storage.INT(length)
+    u01 = backend_instance.Storage.from_ndarray(
+        np.random.default_rng(seed=44).uniform(size=n_sd)
+    )
+    sut = backend_instance.make_parallel_shuffler(idx.shape, idx.dtype)
+
+    # act
+    sut(idx, length, u01)
+
+    # assert
+    permutation = idx.to_ndarray()[:length]
+    np.testing.assert_array_equal(np.sort(permutation), np.arange(length))
+    if length > 100:
+        assert (permutation != np.arange(length)).any()
@@ -0,0 +1,144 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU, GPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions import Collision
+from PySDM.dynamics.collisions.breakup_efficiencies import ConstEb
+from PySDM.dynamics.collisions.breakup_fragmentations import AlwaysN
+from PySDM.dynamics.collisions.coalescence_efficiencies import ConstEc
+from PySDM.dynamics.collisions.collision_kernels import (
+    ConstantK,
+    Geometric,
+    Golovin,
+    Hydrodynamic,
+    Linear,
+)
+from PySDM.environments import Box
+from PySDM.impl.mesh import Mesh
+from PySDM.physics import si
+
+N_SD = 255
+
+KERNELS = {
+    "Golovin": lambda: Golovin(b=1.5e3 / si.s),
+    "ConstantK": lambda: ConstantK(a=1e-3 * si.cm**3 / si.s),
+    "Geometric": lambda: Geometric(collection_efficiency=0.8),
+    "Hydrodynamic": Hydrodynamic,
+}
+
+
+def _make_particulator(  # note: fastmath disabled to allow bitwise comparison
+    *, kernel, fused, adaptive, substeps, n_cell
+):
+    rng = np.random.default_rng(seed=44)
+    env = Box(dt=10 * si.s, dv=1 * si.m**3)
+    if n_cell > 1:
+        env.mesh = Mesh(grid=(n_cell,), size=(n_cell * si.m,))
+    builder = Builder(
+        n_sd=N_SD, backend=CPU(Formulae(seed=44, fastmath=False)), environment=env
+    )
+    builder.add_dynamic(
+        Coalescence(
+            collision_kernel=KERNELS[kernel](),
+            adaptive=adaptive,
+            substeps=substeps,
+            fused=fused,
+        )
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": rng.integers(1e4, 1e6, size=N_SD).astype(float),
+            "volume": (4 / 3 * np.pi)
+            * rng.uniform(5 * si.um, 50 * si.um, size=N_SD) ** 3,
+            "cell id": rng.permutation(np.arange(N_SD) % n_cell),
+        }
+    )
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize(
+    "adaptive, substeps, n_cell",
+    (
+        (True, 1, 1),
+        (False, 1, 1),
+        (False, 3, 1),
+        # note: multi-cell comparison only with equal super-droplet counts in all cells
+        #       as the composed path picks normalisation factors using pair indices
+        (False, 1, 5),
+    ),
+)
+def test_fused_matches_composed(kernel, adaptive, substeps, n_cell):
+    # arrange
+    particulators = {
+        fused: _make_particulator(
+            kernel=kernel,
+            fused=fused,
+            adaptive=adaptive,
+            substeps=substeps,
+            n_cell=n_cell,
+        )
+        for fused in (False, True)
+    }
+
+    # act
+    for particulator in particulators.values():
+        particulator.run(3)
+
+    # assert
+    reference, sut = particulators[False], particulators[True]
+    assert (reference.dynamics["Collision"].coalescence_rate.to_ndarray() > 0).all()
+    for attribute in ("multiplicity", "water mass", "cell id"):
+        np.testing.assert_array_equal(
+            sut.attributes[attribute].to_ndarray(),
+            reference.attributes[attribute].to_ndarray(),
+        )
+    for counter in (
+        "collision_rate",
+        "collision_rate_deficit",
+        "coalescence_rate",
+        "stats_n_substep",
+        "dt_left",
+    ):
+        np.testing.assert_array_equal(
+            getattr(sut.dynamics["Collision"], counter).to_ndarray(),
+            getattr(reference.dynamics["Collision"], counter).to_ndarray(),
+        )
+
+
+def test_unsupported_kernel():
+    # arrange
+    builder = Builder(n_sd=N_SD, backend=CPU(), environment=Box(dt=1, dv=1))
+    builder.add_dynamic(Coalescence(collision_kernel=Linear(a=1, b=1), fused=True))
+
+    # act & assert
+    with pytest.raises(NotImplementedError):
+        builder.build(
+            attributes={"multiplicity": np.ones(N_SD), "volume": np.ones(N_SD)}
+        )
+
+
+def test_breakup_not_supported():
+    with pytest.raises(AssertionError):
+        Collision(
+            collision_kernel=Golovin(b=1),
+            coalescence_efficiency=ConstEc(Ec=0.5),
+            breakup_efficiency=ConstEb(Eb=0.5),
+            fragmentation_function=AlwaysN(n=2),
+            fused=True,
+        )
+
+
+def test_gpu_not_supported():
+    # arrange
+    builder = Builder(n_sd=N_SD, backend=GPU(), environment=Box(dt=1, dv=1))
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1), fused=True))
+    particulator = builder.build(
+        attributes={"multiplicity": np.ones(N_SD), "volume": np.ones(N_SD)}
+    )
+
+    # act & assert
+    with pytest.raises(NotImplementedError):
+        particulator.run(1)
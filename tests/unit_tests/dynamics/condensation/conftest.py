@@ -0,0 +1,123 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.environments.impl import register_environment
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.sampling import spectral_sampling
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+
+N_CELL = 7
+N_SD_PER_CELL = 16
+
+
+@register_environment()
+class _MultiCellEnv:
+    def __init__(self, *, dt, water_vapour_mixing_ratio):
+        self.mesh = Mesh(grid=(N_CELL,), size=(N_CELL * si.m,))
+        self.dt = dt
+        self.dv = self.mesh.dv
+        self.particulator = None
+        self.initial = {
+            "rhod": np.full(N_CELL, 1 * si.kg / si.m**3),
+            "thd": np.full(N_CELL, 290 * si.K),
+            "water_vapour_mixing_ratio": water_vapour_mixing_ratio,
+            "air density": np.full(N_CELL, 1 * si.kg / si.m**3),
+            "air dynamic viscosity": np.full(N_CELL, 1.8e-5 * si.Pa * si.s),
+        }
+        self.env = {}
+        self.pred = {}
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+        storage = self.particulator.backend.Storage
+        for key, value in self.initial.items():
+            self.env[key] = storage.from_ndarray(value)
+        for key in ("rhod", "thd", "water_vapour_mixing_ratio"):
+            self.pred[key] = storage.from_ndarray(self.initial[key])
+        for key in ("T", "p", "RH"):
+            self.pred[key] = storage.empty(N_CELL, dtype=float)
+            self.env[key] = self.pred[key]
+
+    def get_predicted(self, key):
+        return self.pred[key]
+
+    def __getitem__(self, key):
+        return self.env[key]
+
+
+def _make_multi_cell_particulator(**condensation_kwargs):
+    n_sd = N_CELL * N_SD_PER_CELL
+    builder = Builder(
+        n_sd=n_sd,
+        backend=CPU(),
+        environment=_MultiCellEnv(
+            dt=1 * si.s,
+            water_vapour_mixing_ratio=np.linspace(8, 16, N_CELL) * si.g / si.kg,
+        ),
+    )
+    builder.add_dynamic(Condensation(**condensation_kwargs))
+    dry_volume = np.logspace(-22, -18, n_sd) * si.m**3
+    particulator = builder.build(
+        attributes={
+            "multiplicity": np.full(n_sd, 1e6),
+            "volume": dry_volume * 10,
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "cell id": np.repeat(np.arange(N_CELL), N_SD_PER_CELL)[::-1].copy(),
+        }
+    )
+    particulator.update_TpRH()
+    return particulator
+
+
+@pytest.fixture(name="make_multi_cell_particulator")
+def make_multi_cell_particulator_fixture():
+    """factory of particulators with `N_CELL` cells of `N_SD_PER_CELL` super-droplets
+    each, differing in humidity, and `Condensation` constructed with given kwargs"""
+    return _make_multi_cell_particulator
+
+
+def _make_parcel_particulator(
+    *,
+    n_sd=64,
+    w=1 * si.m / si.s,
+    initial_water_vapour_mixing_ratio=22 * si.g / si.kg,
+    products=(),
+    **condensation_kwargs,
+):
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        initial_water_vapour_mixing_ratio=initial_water_vapour_mixing_ratio,
+        T0=300 * si.K,
+        w=w,
+    )
+    builder = Builder(backend=CPU(), n_sd=n_sd, environment=env)
+    env = builder.particulator.environment
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation(**condensation_kwargs))
+    r_dry, specific_concentration = spectral_sampling.Logarithmic(
+        Lognormal(norm_factor=1e4 / si.mg, m_mode=50 * si.nm, s_geom=1.5)
+    ).sample(n_sd)
+    return builder.build(
+        attributes=env.init_attributes(
+            n_in_dv=specific_concentration * env.mass_of_dry_air,
+            kappa=0.5,
+            r_dry=r_dry,
+        ),
+        products=products,
+    )
+
+
+@pytest.fixture(name="make_parcel_particulator")
+def make_parcel_particulator_fixture():
+    """factory of parcel-model particulators with a lognormal aerosol spectrum and
+    `Condensation` constructed with given kwargs"""
+    return _make_parcel_particulator
@@ -0,0 +1,34 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("intra_cell_parallel", (False, True))
+def test_batched_root_finding_matches_scalar_solution(
+    make_multi_cell_particulator, intra_cell_parallel
+):
+    # arrange
+    particulators = {
+        key: make_multi_cell_particulator(
+            batched_root_finding=key, intra_cell_parallel=intra_cell_parallel
+        )
+        for key in (False, True)
+    }
+
+    # act
+    for particulator in particulators.values():
+        particulator.dynamics["Condensation"]()
+
+    # assert
+    workspace = particulators[True].dynamics["Condensation"].root_finding_workspace
+    assert workspace[0].shape[1] == particulators[True].n_sd
+    np.testing.assert_allclose(
+        particulators[True].attributes["signed water mass"].to_ndarray(),
+        particulators[False].attributes["signed water mass"].to_ndarray(),
+        rtol=1e-10,
+    )
+    for key in ("n_substeps", "n_activating"):
+        np.testing.assert_array_equal(
+            particulators[True].dynamics["Condensation"].counters[key].to_ndarray(),
+            particulators[False].dynamics["Condensation"].counters[key].to_ndarray(),
+        )
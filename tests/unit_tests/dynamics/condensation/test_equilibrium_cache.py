@@ -0,0 +1,82 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends.impl_numba.methods.condensation_methods import (
+    _CACHE_VALID,
+    EQUILIBRIUM_CACHE_ROWS,
+)
+from PySDM.physics import si
+
+N_SD = 64
+
+
+@pytest.mark.parametrize("w", (0.1 * si.mm / si.s, 0.5 * si.m / si.s))
+def test_caching_equilibrium_does_not_affect_results(
+    make_parcel_particulator, w, n_steps=10
+):
+    # arrange
+    particulators = {
+        key: make_parcel_particulator(
+            n_sd=N_SD,
+            w=w,
+            initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+            cache_equilibrium=key,
+        )
+        for key in (False, True)
+    }
+
+    # act
+    for particulator in particulators.values():
+        particulator.run(steps=n_steps)
+
+    # assert
+    np.testing.assert_allclose(
+        particulators[True].attributes["signed water mass"].to_ndarray(),
+        particulators[False].attributes["signed water mass"].to_ndarray(),
+        rtol=1e-8,
+    )
+    np.testing.assert_allclose(
+        particulators[True].environment["RH"].to_ndarray(),
+        particulators[False].environment["RH"].to_ndarray(),
+        rtol=1e-10,
+    )
+    assert particulators[False].dynamics["Condensation"].equilibrium_cache.shape == (
+        EQUILIBRIUM_CACHE_ROWS,
+        0,
+    )
+    cache = particulators[True].dynamics["Condensation"].equilibrium_cache.to_ndarray()
+    assert (cache[_CACHE_VALID] == 1).all()
+    assert np.isfinite(cache).all()
+
+
+def test_caching_equilibrium_skips_quiescent_droplets(
+    make_parcel_particulator, n_steps=20
+):
+    # arrange
+    particulators = {
+        key: make_parcel_particulator(
+            n_sd=N_SD,
+            w=0.1 * si.mm / si.s,
+            initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+            cache_equilibrium=key,
+        )
+        for key in (False, True)
+    }
+
+    # act
+    n_equilibrium_skips = {}
+    for key, particulator in particulators.items():
+        n_equilibrium_skips[key] = 0
+        for _ in range(n_steps):
+            particulator.run(steps=1)
+            n_equilibrium_skips[key] += (
+                particulator.dynamics["Condensation"]
+                .counters["n_equilibrium_skips"]
+                .to_ndarray()
+                .sum()
+            )
+
+    # assert
+    assert n_equilibrium_skips[False] == 0
+    assert n_equilibrium_skips[True] > 0
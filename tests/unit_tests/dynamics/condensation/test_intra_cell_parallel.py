@@ -0,0 +1,60 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+
+N_SD = 256
+
+
+def test_intra_cell_parallel_matches_serial_solution(
+    make_parcel_particulator, n_steps=20
+):
+    # arrange
+    particulators = {
+        key: make_parcel_particulator(n_sd=N_SD, intra_cell_parallel=key)
+        for key in (False, True)
+    }
+
+    # act
+    for particulator in particulators.values():
+        particulator.run(steps=n_steps)
+
+    # assert
+    np.testing.assert_allclose(
+        particulators[True].attributes["signed water mass"].to_ndarray(),
+        particulators[False].attributes["signed water mass"].to_ndarray(),
+        rtol=1e-6,
+    )
+    for key in ("n_activating", "n_substeps"):
+        np.testing.assert_array_equal(
+            particulators[True].dynamics["Condensation"].counters[key].to_ndarray(),
+            particulators[False].dynamics["Condensation"].counters[key].to_ndarray(),
+        )
+    np.testing.assert_allclose(
+        particulators[True].environment["RH"].to_ndarray(),
+        particulators[False].environment["RH"].to_ndarray(),
+        rtol=1e-8,
+    )
+
+
+def test_intra_cell_parallel_multi_cell(make_multi_cell_particulator):
+    # arrange
+    particulators = {
+        key: make_multi_cell_particulator(intra_cell_parallel=key)
+        for key in (False, True)
+    }
+
+    # act
+    for particulator in particulators.values():
+        particulator.dynamics["Condensation"]()
+
+    # assert
+    assert particulators[True].mesh.n_cell > 1
+    np.testing.assert_allclose(
+        particulators[True].attributes["signed water mass"].to_ndarray(),
+        particulators[False].attributes["signed water mass"].to_ndarray(),
+        rtol=1e-6,
+    )
+    n_substeps = {
+        key: particulator.dynamics["Condensation"].counters["n_substeps"].to_ndarray()
+        for key, particulator in particulators.items()
+    }
+    np.testing.assert_array_equal(n_substeps[True], n_substeps[False])
@@ -0,0 +1,52 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("schedule", ("static", "dynamic"))
+def test_schedule_does_not_affect_results(make_multi_cell_particulator, schedule):
+    # arrange
+    reference = make_multi_cell_particulator(schedule="static")
+    sut = make_multi_cell_particulator(schedule=schedule)
+
+    # act
+    for particulator in (reference, sut):
+        particulator.dynamics["Condensation"]()
+
+    # assert
+    np.testing.assert_array_equal(
+        sut.attributes["signed water mass"].to_ndarray(),
+        reference.attributes["signed water mass"].to_ndarray(),
+    )
+    counters = sut.dynamics["Condensation"].counters
+    np.testing.assert_array_equal(
+        counters["n_substeps"].to_ndarray(),
+        reference.dynamics["Condensation"].counters["n_substeps"].to_ndarray(),
+    )
+    assert (counters["n_substeps"].to_ndarray() > 0).all()
+
+
+@pytest.mark.parametrize("schedule", ("static", "dynamic"))
+def test_thread_busy_time(make_multi_cell_particulator, schedule):
+    # arrange
+    sut = make_multi_cell_particulator(schedule=schedule, time_threads=True)
+
+    # act
+    sut.dynamics["Condensation"]()
+
+    # assert
+    busy_time = sut.dynamics["Condensation"].thread_busy_time.to_ndarray()
+    assert busy_time.shape == (sut.mesh.n_cell,)
+    assert np.isfinite(busy_time[0])
+    assert (busy_time[np.isfinite(busy_time)] >= 0).all()
+
+
+def test_thread_busy_time_not_recorded_by_default(make_multi_cell_particulator):
+    # arrange
+    sut = make_multi_cell_particulator()
+
+    # act
+    sut.dynamics["Condensation"]()
+
+    # assert
+    assert sut.dynamics["Condensation"].thread_busy_time is None
@@ -0,0 +1,36 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+
+from PySDM.products import CondensationTrialSolves
+
+
+def test_reusing_trial_solves_does_not_affect_results(
+    make_parcel_particulator, n_steps=20
+):
+    # arrange
+    particulators = {
+        key: make_parcel_particulator(
+            products=(CondensationTrialSolves(),), reuse_trial_solves=key
+        )
+        for key in (False, True)
+    }
+
+    # act
+    trial_solves = {}
+    for key, particulator in particulators.items():
+        particulator.run(steps=n_steps)
+        trial_solves[key] = particulator.products["condensation trial solves"].get()
+
+    # assert
+    np.testing.assert_array_equal(
+        particulators[True].attributes["signed water mass"].to_ndarray(),
+        particulators[False].attributes["signed water mass"].to_ndarray(),
+    )
+    for key in ("n_substeps", "n_activating"):
+        np.testing.assert_array_equal(
+            particulators[True].dynamics["Condensation"].counters[key].to_ndarray(),
+            particulators[False].dynamics["Condensation"].counters[key].to_ndarray(),
+        )
+    assert (trial_solves[False] >= 2).all()
+    assert (trial_solves[True] >= 1).all()
+    assert (trial_solves[True] < trial_solves[False]).all()
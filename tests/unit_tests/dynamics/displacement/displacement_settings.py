@@ -8,6 +8,14 @@ from ...dummy_environment import DummyEnvironment
 from ...dummy_particulator import DummyParticulator
 
 
+class FallVelocity:  # pylint: disable=too-few-public-methods
+    def __init__(self, backend, values):
+        self.values = backend.Storage.from_ndarray(values)
+
+    def get(self):
+        return self.values
+
+
 class DisplacementSettings:  # pylint: disable=too-few-public-methods
     def __init__(self, n_sd=1, grid=None, positions=None, courant_field_data=None):
         self.n = np.ones(n_sd, dtype=np.int64)
@@ -21,7 +29,7 @@ class DisplacementSettings:  # pylint: disable=too-few-public-methods
         self.sedimentation = False
         self.dt = None
 
-    def get_displacement(self, backend, scheme, adaptive=True):
+    def get_displacement(self, backend, scheme, adaptive=True, **kwargs):
         formulae = Formulae(particle_advection=scheme)
         particulator = DummyParticulator(backend, n_sd=len(self.n), formulae=formulae)
         particulator.environment = DummyEnvironment(
@@ -39,7 +47,9 @@ class DisplacementSettings:  # pylint: disable=too-few-public-methods
             "position in cell": position_in_cell,
         }
         particulator.build(attributes)
-        sut = Displacement(enable_sedimentation=self.sedimentation, adaptive=adaptive)
+        sut = Displacement(
+            enable_sedimentation=self.sedimentation, adaptive=adaptive, **kwargs
+        )
         sut.register(particulator)
         sut.upload_courant_field(self.courant_field_data)
 
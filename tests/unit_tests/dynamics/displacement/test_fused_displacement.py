@@ -0,0 +1,62 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,no-member
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+
+from .displacement_settings import DisplacementSettings, FallVelocity
+
+
+class TestFusedDisplacement:  # pylint: disable=too-few-public-methods
+    @staticmethod
+    @pytest.mark.parametrize("sedimentation", (False, True))
+    def test_fused_step_matches_composed_one(  # pylint: disable=too-many-locals
+        sedimentation, n_sd=64, grid=(4, 4)
+    ):
+        # Arrange
+        rng = np.random.default_rng(seed=44)
+        positions = rng.uniform(0, grid[0], size=(2, n_sd))
+        courant_field = (
+            rng.uniform(-0.3, 0.3, size=(grid[0] + 1, grid[1])),
+            rng.uniform(-0.3, 0.3, size=(grid[0], grid[1] + 1)),
+        )
+        fall_velocity = rng.uniform(0, 0.3, size=n_sd)
+
+        results = {}
+        for fused in (False, True):
+            settings = DisplacementSettings(
+                n_sd=n_sd,
+                grid=grid,
+                positions=positions.tolist(),
+                courant_field_data=courant_field,
+            )
+            settings.dt = 1
+            settings.sedimentation = sedimentation
+            sut, particulator = settings.get_displacement(
+                CPU, scheme="ImplicitInSpace", adaptive=False, fused=fused
+            )
+            if sedimentation:
+                particulator.attributes._ParticleAttributes__attributes[
+                    "relative fall velocity"
+                ] = FallVelocity(particulator.backend, fall_velocity)
+
+            # Act
+            sut()
+
+            idx = particulator.attributes._ParticleAttributes__idx.to_ndarray()
+            survivors = np.sort(idx[: particulator.attributes.super_droplet_count])
+            results[fused] = {
+                "survivors": survivors,
+                "precipitation": sut.precipitation_mass_in_last_step,
+                **{
+                    key: particulator.attributes[key].to_ndarray(raw=True)[
+                        ..., survivors
+                    ]
+                    for key in ("cell origin", "position in cell", "cell id")
+                },
+            }
+
+        # Assert
+        assert 0 < len(results[True]["survivors"]) < n_sd or not sedimentation
+        for key, value in results[False].items():
+            np.testing.assert_allclose(results[True][key], value)
@@ -0,0 +1,139 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,no-member
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Displacement
+from PySDM.environments import Kinematic2D
+from PySDM.products import DisplacementSubstepsMax, DisplacementSubstepsMean
+
+from .displacement_settings import DisplacementSettings, FallVelocity
+
+GRID = (4, 4)
+
+
+def sheared_courant_field(shear):
+    courant_x = np.full((GRID[0] + 1, GRID[1]), 0.1)
+    courant_y = np.zeros((GRID[0], GRID[1] + 1))
+    courant_x[2, 1] += shear
+    return courant_x, courant_y
+
+
+class TestPerCellSubsteps:
+    @staticmethod
+    def test_substeps_are_increased_only_in_sheared_cells():
+        # arrange
+        settings = DisplacementSettings(n_sd=1, grid=GRID, positions=[[0.5], [0.5]])
+        settings.courant_field_data = sheared_courant_field(shear=0.2)
+
+        # act
+        sut, _ = settings.get_displacement(
+            CPU, scheme="ImplicitInSpace", per_cell_substeps=True
+        )
+
+        # assert
+        n_substeps = sut.n_substeps.to_ndarray().reshape(GRID)
+        sheared = np.zeros(GRID, dtype=bool)
+        sheared[1:3, 1] = True
+        assert (n_substeps[~sheared] == 1).all()
+        assert (n_substeps[sheared] > 1).all()
+        assert n_substeps.max() == sut._n_substeps  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_per_cell_substeps_require_adaptivity():
+        with pytest.raises(ValueError):
+            Displacement(adaptive=False, per_cell_substeps=True)
+
+    @staticmethod
+    @pytest.mark.parametrize("schedule", ("static", "dynamic"))
+    @pytest.mark.parametrize("sedimentation", (False, True))
+    def test_uniform_substeps_match_fused_step(  # pylint: disable=too-many-locals
+        schedule, sedimentation, n_sd=64
+    ):
+        # arrange
+        rng = np.random.default_rng(seed=44)
+        positions = rng.uniform(0, GRID[0], size=(2, n_sd))
+        courant_field = (
+            np.linspace(-0.2, 0.2, GRID[0] + 1)[:, None] * np.ones((1, GRID[1])),
+            np.full((GRID[0], GRID[1] + 1), 0.1),
+        )
+        fall_velocity = rng.uniform(0, 0.3, size=n_sd)
+
+        results = {}
+        for per_cell_substeps in (False, True):
+            settings = DisplacementSettings(
+                n_sd=n_sd,
+                grid=GRID,
+                positions=positions.tolist(),
+                courant_field_data=courant_field,
+            )
+            settings.dt = 1
+            settings.sedimentation = sedimentation
+            sut, particulator = settings.get_displacement(
+                CPU,
+                scheme="ImplicitInSpace",
+                fused=True,
+                per_cell_substeps=per_cell_substeps,
+                schedule=schedule,
+            )
+            if sedimentation:
+                particulator.attributes._ParticleAttributes__attributes[
+                    "relative fall velocity"
+                ] = FallVelocity(particulator.backend, fall_velocity)
+
+            # act
+            sut()
+
+            idx = particulator.attributes._ParticleAttributes__idx.to_ndarray()
+            survivors = np.sort(idx[: particulator.attributes.super_droplet_count])
+            results[per_cell_substeps] = {
+                "survivors": survivors,
+                "precipitation": sut.precipitation_mass_in_last_step,
+                **{
+                    key: particulator.attributes[key].to_ndarray(raw=True)[
+                        ..., survivors
+                    ]
+                    for key in ("cell origin", "position in cell", "cell id")
+                },
+            }
+
+        # assert
+        assert (sut.n_substeps.to_ndarray() > 1).all()
+        for key, value in results[False].items():
+            np.testing.assert_allclose(results[True][key], value)
+
+    @staticmethod
+    def test_substeps_products():
+        # arrange
+        n_sd = 1
+        env = Kinematic2D(dt=1, grid=GRID, size=(100, 100), rhod_of=lambda x: x * 0 + 1)
+        builder = Builder(n_sd=n_sd, backend=CPU(), environment=env)
+        builder.add_dynamic(Displacement(per_cell_substeps=True))
+        particulator = builder.build(
+            attributes={
+                "multiplicity": np.ones(n_sd),
+                "volume": np.ones(n_sd),
+                "cell id": np.zeros(n_sd, dtype=int),
+            },
+            products=(DisplacementSubstepsMax(), DisplacementSubstepsMean()),
+        )
+        displacement = particulator.dynamics["Displacement"]
+        products = [
+            particulator.products[name]
+            for name in ("displacement substeps max", "displacement substeps mean")
+        ]
+
+        # act
+        n_substeps = []
+        for shear in (0, 0.2):
+            displacement.upload_courant_field(sheared_courant_field(shear))
+            n_substeps.append(displacement.n_substeps.to_ndarray().reshape(GRID))
+            for product in products:
+                product.notify()
+        values = [product.get().copy() for product in products]
+
+        # assert
+        np.testing.assert_array_equal(values[0], np.maximum(*n_substeps))
+        np.testing.assert_allclose(values[1], (n_substeps[0] + n_substeps[1]) / 2)
+        assert (values[0] > 1).any()
@@ -252,3 +252,5 @@ class TestSeeding:
             assert sorted(dynamic.particulator.indices[0]) == sorted(
                 dynamic.particulator.indices[1]
             )
+            for indices in dynamic.particulator.indices:
+                assert sorted(indices) == list(range(reservoir_length))
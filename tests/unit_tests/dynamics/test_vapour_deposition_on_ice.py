@@ -15,8 +15,13 @@ from PySDM import Formulae
 from PySDM.environments import Box
 from PySDM.environments.impl import register_environment
 from PySDM.environments.impl.moist import Moist
+from PySDM.impl.mesh import Mesh
 from PySDM.dynamics import VapourDepositionOnIce, AmbientThermodynamics
-from PySDM.products import IceWaterContent
+from PySDM.products import (
+    DepositionSubstepsMax,
+    DepositionSubstepsMean,
+    IceWaterContent,
+)
 
 
 @register_environment()
@@ -43,6 +48,22 @@ class MoistBox(Box, Moist):
         return self[key]
 
 
+@register_environment()
+class MoistColumn(MoistBox):
+    """multi-cell variant of `MoistBox` (with cells of unit volume)"""
+
+    def __init__(self, dt: float, n_cell: int, mixed_phase: bool = False):
+        super().__init__(dt=dt, dv=1 * si.m**3, mixed_phase=mixed_phase)
+        self.mesh = Mesh(grid=(n_cell,), size=(n_cell * si.m,))
+
+    def __setitem__(self, key, value):
+        if key not in self._ambient_air:
+            self._ambient_air[key] = self.particulator.backend.Storage.from_ndarray(
+                np.full(self.mesh.n_cell, np.nan)
+            )
+        self._ambient_air[key][:] = np.asarray(value, dtype=float)
+
+
 DIFFUSION_COORDINATES = ("WaterMass", "WaterMassLogarithm")
 DIFFUSION_ICE_CAPACITIES = ("Spherical", "Columnar")
 COMMON = {
@@ -347,6 +368,102 @@ class TestVapourDepositionOnIce:
         # assert
         np.testing.assert_almost_equal(m0, m1)
 
+    @staticmethod
+    @pytest.mark.parametrize("schedule", ("static", "dynamic"))
+    def test_multi_cell_matches_single_cell_runs(schedule, n_steps=3):
+        # arrange
+        dt = 10 * si.s
+        cells = (
+            {"RH_ice": 1.1, "signed_water_masses": [-si.ng, -si.ug]},
+            {"RH_ice": 0.9, "signed_water_masses": [-si.ng, si.ng]},
+            {"RH_ice": 1.0, "signed_water_masses": [-si.ug, -si.ng]},
+            {"RH_ice": 1.3, "signed_water_masses": [-si.ng, -si.ng / 10]},
+        )
+        single_cell_particulators = [
+            make_particulator(
+                adaptive=True,
+                dt=dt,
+                diffusion_coordinate="WaterMass",
+                diffusion_ice_capacity="Columnar",
+                temperature=250 * si.K,
+                pressure=800 * si.hPa,
+                **cell,
+            )
+            for cell in cells
+        ]
+
+        n_sd_per_cell = len(cells[0]["signed_water_masses"])
+        builder = Builder(
+            n_sd=len(cells) * n_sd_per_cell,
+            environment=MoistColumn(dt=dt, n_cell=len(cells)),
+            backend=backend("WaterMass", "Columnar"),
+        )
+        builder.add_dynamic(AmbientThermodynamics())
+        builder.add_dynamic(VapourDepositionOnIce(adaptive=True, schedule=schedule))
+        particulator = builder.build(
+            attributes={
+                "multiplicity": np.full(
+                    shape=(builder.particulator.n_sd,), fill_value=int(1e8)
+                ),
+                "signed water mass": np.concatenate(
+                    [cell["signed_water_masses"] for cell in cells]
+                ),
+                "cell id": np.repeat(np.arange(len(cells)), n_sd_per_cell),
+            },
+            products=(DepositionSubstepsMax(), DepositionSubstepsMean()),
+        )
+        for key in (
+            "T",
+            "p",
+            "RH",
+            "a_w_ice",
+            "Schmidt number",
+            "water_vapour_mixing_ratio",
+            "rhod",
+            "thd",
+        ):
+            particulator.environment[key] = [
+                single.environment[key][0] for single in single_cell_particulators
+            ]
+
+        # act
+        particulator.run(steps=n_steps)
+        for single in single_cell_particulators:
+            single.run(steps=n_steps)
+
+        # assert
+        np.testing.assert_allclose(
+            particulator.attributes["signed water mass"].to_ndarray(),
+            np.concatenate(
+                [
+                    single.attributes["signed water mass"].to_ndarray()
+                    for single in single_cell_particulators
+                ]
+            ),
+            rtol=1e-12,
+        )
+        np.testing.assert_allclose(
+            particulator.environment["water_vapour_mixing_ratio"].to_ndarray(),
+            [
+                single.environment["water_vapour_mixing_ratio"][0]
+                for single in single_cell_particulators
+            ],
+            rtol=1e-12,
+        )
+        n_substeps = particulator.dynamics["VapourDepositionOnIce"].n_substeps
+        np.testing.assert_array_equal(
+            n_substeps.to_ndarray(),
+            [
+                single.dynamics["VapourDepositionOnIce"].n_substeps[0]
+                for single in single_cell_particulators
+            ],
+        )
+        assert (n_substeps.to_ndarray() >= 1).all()
+        substeps_max = particulator.products["deposition substeps max"].get()
+        substeps_mean = particulator.products["deposition substeps mean"].get()
+        assert (substeps_max >= substeps_mean).all()
+        assert (substeps_mean >= 1).all()
+
 
 # TODO #1524: test is updraft matters
 # TODO #1524: test if order of condensation/deposition matters
@@ -0,0 +1,82 @@
+"""checks that parcels batched as cells of `MultiParcel` evolve as separate `Parcel` runs"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import MultiParcel, Parcel
+from PySDM.physics import si
+from PySDM.products import AmbientRelativeHumidity, ParcelDisplacement
+
+N_SD_PER_PARCEL = 8
+PARCELS = {
+    "mass_of_dry_air": np.array([1, 2, 0.5]) * si.kg,
+    "p0": np.array([1000, 950, 900]) * si.hPa,
+    "T0": np.array([300, 290, 285]) * si.K,
+    "initial_water_vapour_mixing_ratio": np.array([20, 12, 10]) * si.g / si.kg,
+    "w": np.array([1, 0.5, 2]) * si.m / si.s,
+}
+R_DRY = np.logspace(-8, -7, N_SD_PER_PARCEL) * si.m
+N_IN_DV = np.full(N_SD_PER_PARCEL, 1e8)
+KAPPA = 0.5
+DT = 1 * si.s
+N_STEPS = 10
+
+
+def _make_particulator(env, n_sd):
+    builder = Builder(n_sd=n_sd, backend=CPU(), environment=env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    return builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            n_in_dv=N_IN_DV, kappa=KAPPA, r_dry=R_DRY
+        ),
+        products=(AmbientRelativeHumidity(name="RH"), ParcelDisplacement(name="z")),
+    )
+
+
+@pytest.mark.parametrize("w_callable", (False, True))
+def test_multi_parcel_matches_separate_parcels(w_callable):
+    # arrange
+    n_parcel = len(PARCELS["p0"])
+    w = PARCELS["w"]
+    sut = _make_particulator(
+        MultiParcel(
+            dt=DT,
+            n_parcel=n_parcel,
+            **{**PARCELS, "w": (lambda _: w) if w_callable else w},
+        ),
+        n_sd=n_parcel * N_SD_PER_PARCEL,
+    )
+    references = [
+        _make_particulator(
+            Parcel(dt=DT, **{key: value[i] for key, value in PARCELS.items()}),
+            n_sd=N_SD_PER_PARCEL,
+        )
+        for i in range(n_parcel)
+    ]
+
+    # act
+    sut.run(N_STEPS)
+    for reference in references:
+        reference.run(N_STEPS)
+
+    # assert
+    for key in ("RH", "z"):
+        np.testing.assert_allclose(
+            sut.products[key].get(),
+            [reference.products[key].get()[0] for reference in references],
+            rtol=1e-8,
+        )
+    np.testing.assert_allclose(
+        sut.attributes["water mass"].to_ndarray(),
+        np.concatenate(
+            [
+                reference.attributes["water mass"].to_ndarray()
+                for reference in references
+            ]
+        ),
+        rtol=1e-4,  # round-off-level differences get amplified within solver tolerance
+    )
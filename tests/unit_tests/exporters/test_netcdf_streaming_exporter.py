@@ -0,0 +1,97 @@
+"""checks for the streaming netCDF exporter"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.exporters import NetCDFStreamingExporter
+from PySDM.physics import si
+from PySDM.products import (
+    ParticleSizeSpectrumPerVolume,
+    Time,
+    TotalParticleConcentration,
+)
+
+netCDF4 = pytest.importorskip("netCDF4")
+
+N_SD = 64
+N_STEPS = 12
+OUTPUT_INTERVAL = 3
+
+
+def _make_particulator():
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(Formulae(seed=44)),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1e4 / si.s)))
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(N_SD, 1e6),
+            "volume": np.logspace(-18, -13, N_SD) * si.m**3,
+        },
+        products=(
+            Time(),
+            TotalParticleConcentration(name="n"),
+            ParticleSizeSpectrumPerVolume(
+                radius_bins_edges=np.logspace(-6, -3, 8) * si.m, name="spectrum"
+            ),
+        ),
+    )
+
+
+@pytest.mark.parametrize("background", (True, False))
+def test_streamed_values_match_products(tmp_path, background):
+    # arrange
+    reference = _make_particulator()
+    sut = _make_particulator()
+    filename = tmp_path / "output.nc"
+
+    expected = {key: [] for key in reference.products}
+    for step in range(N_STEPS + 1):
+        if step % OUTPUT_INTERVAL == 0:
+            for key, product in reference.products.items():
+                expected[key].append(np.array(product.get(), copy=True).squeeze())
+        reference.run(1)
+
+    # act
+    with NetCDFStreamingExporter(
+        sut,
+        filename=filename,
+        output_interval=OUTPUT_INTERVAL,
+        chunk_length=2,
+        max_queue_length=1,
+        background=background,
+    ) as exporter:
+        sut.run(N_STEPS)
+
+    # assert
+    with netCDF4.Dataset(filename) as ncdf:
+        assert ncdf.dimensions["T"].isunlimited()
+        np.testing.assert_array_equal(
+            ncdf["T"][:], np.arange(0, N_STEPS + 1, OUTPUT_INTERVAL) * si.s
+        )
+        for key, values in expected.items():
+            np.testing.assert_array_equal(ncdf[key][:], np.asarray(values))
+        assert ncdf["spectrum"].dimensions == ("T", "spectrum_bin_left_edges")
+        assert ncdf["spectrum"].filters()["zlib"]
+        assert ncdf["n"].chunking() == [2]
+    assert exporter not in sut.observers
+
+
+def test_writer_error_is_raised(tmp_path):
+    # arrange
+    sut = _make_particulator()
+    exporter = NetCDFStreamingExporter(
+        sut, filename=tmp_path / "nonexistent" / "output.nc"
+    )
+
+    # act & assert
+    with pytest.raises(OSError):
+        sut.run(1)
+        exporter.close()
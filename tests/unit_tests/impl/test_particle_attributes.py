@@ -280,3 +280,138 @@ class TestParticleAttributes:
         np.testing.assert_array_equal(
             sut._ParticleAttributes__idx.to_ndarray(), expected
         )
+
+    @staticmethod
+    def test_reorder_physically(backend_class):
+        # Arrange
+        grid = (2, 3)
+        n_sd = 16
+        rng = np.random.default_rng(seed=44)
+        particulator = DummyParticulator(backend_class, n_sd=n_sd, grid=grid)
+        cell_id, cell_origin, position_in_cell = particulator.mesh.cellular_attributes(
+            rng.uniform(0, 1, size=(2, n_sd)) * np.array(grid)[:, None]
+        )
+        multiplicity = rng.integers(1, 100, size=n_sd)
+        multiplicity[[3, 11]] = 0
+        particulator.request_attribute("water mass")
+        particulator.build(
+            attributes={
+                "multiplicity": multiplicity,
+                "signed water mass": rng.uniform(0, 1, size=n_sd),
+                "cell id": cell_id,
+                "cell origin": cell_origin,
+                "position in cell": position_in_cell,
+            },
+            int_caster=np.int64,
+        )
+        sut = particulator.attributes
+        keys = (
+            "multiplicity",
+            "signed water mass",
+            "water mass",
+            "cell id",
+            "cell origin",
+            "position in cell",
+        )
+        _ = sut.cell_start
+        expected = {key: sut[key].to_ndarray() for key in keys}
+        expected_cell_start = sut.cell_start.to_ndarray()
+
+        # Act
+        sut.reorder_physically()
+
+        # Assert
+        np.testing.assert_array_equal(
+            sut._ParticleAttributes__idx.to_ndarray(), np.arange(n_sd)
+        )
+        for key in keys:
+            np.testing.assert_array_equal(sut[key].to_ndarray(), expected[key])
+        np.testing.assert_array_equal(sut.cell_start.to_ndarray(), expected_cell_start)
+        if backend_class is not ThrustRTC:  # TODO #330
+            raw_cell_id = sut["cell id"].to_ndarray(raw=True)
+            assert (np.diff(raw_cell_id[: sut.super_droplet_count]) >= 0).all()
+        np.testing.assert_array_equal(
+            sut["multiplicity"].to_ndarray(raw=True)[sut.super_droplet_count :], 0
+        )
+
+    @staticmethod
+    def test_compact(backend_class):
+        # Arrange
+        n_sd = 16
+        rng = np.random.default_rng(seed=44)
+        particulator = DummyParticulator(backend_class, n_sd=n_sd)
+        multiplicity = rng.integers(1, 100, size=n_sd)
+        multiplicity[[0, 3, 11]] = 0
+        signed_water_mass = rng.uniform(0, 1, size=n_sd)
+        particulator.request_attribute("water mass")
+        particulator.build(
+            attributes={
+                "multiplicity": multiplicity,
+                "signed water mass": signed_water_mass,
+            },
+            int_caster=np.int64,
+        )
+        sut = particulator.attributes
+        sut.permutation(
+            particulator.Storage.from_ndarray(rng.uniform(0, 1, size=n_sd)),
+            local=False,
+        )
+        n_live = (multiplicity != 0).sum()
+
+        # Act
+        sut.compact()
+
+        # Assert
+        assert sut.super_droplet_count == n_live
+        np.testing.assert_array_equal(
+            sut._ParticleAttributes__idx.to_ndarray(), np.arange(n_sd)
+        )
+        for key, values in {
+            "multiplicity": multiplicity,
+            "signed water mass": signed_water_mass,
+            "water mass": signed_water_mass,
+        }.items():
+            np.testing.assert_array_equal(
+                sut[key].to_ndarray(), values[multiplicity != 0]
+            )
+        np.testing.assert_array_equal(
+            sut["multiplicity"].to_ndarray(raw=True)[n_live:], 0
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize("n_slots", (13, 24))
+    def test_resize(backend_class, n_slots):
+        # Arrange
+        n_sd = 16
+        rng = np.random.default_rng(seed=44)
+        particulator = DummyParticulator(backend_class, n_sd=n_sd)
+        multiplicity = rng.integers(1, 100, size=n_sd)
+        multiplicity[[0, 3, 11]] = 0
+        signed_water_mass = rng.uniform(0, 1, size=n_sd)
+        particulator.build(
+            attributes={
+                "multiplicity": multiplicity,
+                "signed water mass": signed_water_mass,
+            },
+            int_caster=np.int64,
+        )
+        sut = particulator.attributes
+        sut.permutation(
+            particulator.Storage.from_ndarray(rng.uniform(0, 1, size=n_sd)),
+            local=False,
+        )
+
+        # Act
+        sut.resize(n_slots)
+
+        # Assert
+        assert sut.super_droplet_count == (multiplicity != 0).sum()
+        assert sut.vacant_slot_count == n_slots - sut.super_droplet_count
+        for key, values in {
+            "multiplicity": multiplicity,
+            "signed water mass": signed_water_mass,
+        }.items():
+            assert sut[key].to_ndarray(raw=True).shape == (n_slots,)
+            np.testing.assert_array_equal(
+                sut[key].to_ndarray(), values[multiplicity != 0]
+            )
@@ -0,0 +1,88 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.impl.profiler import ATTRIBUTE_PREFIX
+from PySDM.physics import si
+from PySDM.products import ProfiledWallTime
+
+N_SD = 32
+
+
+def _make_particulator(backend_class, profiling):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend_class(),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1e4 / si.s)))
+    builder.request_attribute("radius")
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(N_SD, 1e6),
+            "volume": np.logspace(-18, -13, N_SD) * si.m**3,
+        },
+        products=(
+            ProfiledWallTime(method="collision_coalescence", name="coalescence time"),
+        ),
+        profiling=profiling,
+    )
+
+
+class TestProfiler:
+    @staticmethod
+    def test_disabled_by_default(backend_class):
+        # arrange
+        sut = _make_particulator(backend_class, profiling=False)
+
+        # act
+        sut.run(1)
+
+        # assert
+        assert sut.profiler is None
+        assert "collision_coalescence" not in vars(sut.backend)
+        with pytest.raises(AssertionError):
+            sut.products["coalescence time"].get()
+
+    @staticmethod
+    def test_report(backend_class):
+        # arrange
+        n_steps = 3
+        sut = _make_particulator(backend_class, profiling=True)
+
+        # act
+        sut.run(n_steps)
+        _ = sut.attributes["radius"]
+        report = sut.profiler.report()
+
+        # assert
+        assert report["collision_coalescence"]["calls"] == n_steps
+        assert report["collision_coalescence"]["bytes"] > 0
+        for record in report.values():
+            assert record["calls"] > 0
+            assert 0 <= record["max time"] <= record["total time"]
+        assert report[ATTRIBUTE_PREFIX + "radius"]["calls"] > 0
+        assert list(report) == sorted(
+            report, key=lambda key: -report[key]["total time"]
+        )
+        assert sut.products["coalescence time"].get() == pytest.approx(
+            report["collision_coalescence"]["total time"]
+        )
+        assert sut.products["coalescence time"].get() == 0
+
+    @staticmethod
+    def test_detach(backend_class):
+        # arrange
+        sut = _make_particulator(backend_class, profiling=True)
+
+        # act
+        sut.profiler.detach()
+        sut.run(1)
+
+        # assert
+        assert not sut.profiler.report()
+        assert "collision_coalescence" not in vars(sut.backend)
@@ -8,6 +8,7 @@ from PySDM.backends import CPU
 from PySDM.initialisation.hygroscopic_equilibrium import (
     equilibrate_wet_radii,
     equilibrate_dry_radii,
+    _make_solver,
 )
 from PySDM.physics import constants_defaults as const
 from PySDM.physics import si
@@ -167,3 +168,55 @@ class TestHygroscopicEquilibrium:
                     environment=builder.particulator.environment,
                 ),
             )
+
+    @staticmethod
+    def test_solver_compiled_once_per_formulae_configuration():
+        # arrange
+        formulae = (
+            Formulae(),
+            Formulae(),
+            Formulae(
+                surface_tension="CompressedFilmOvadnevaite",
+                constants={"sgm_org": 40 * si.mN / si.m, "delta_min": 0.1 * si.nm},
+            ),
+        )
+
+        # act
+        solvers = [_make_solver(f.flatten, wet=True) for f in formulae]
+
+        # assert
+        assert solvers[0] is solvers[1]
+        assert solvers[2] is not solvers[0]
+        assert solvers[2] is _make_solver(formulae[2].flatten, wet=True)
+        assert solvers[0] is not _make_solver(formulae[0].flatten, wet=False)
+
+    @staticmethod
+    @pytest.mark.parametrize("relative_humidity", (0.5, 0.95, 0.999))
+    def test_tabulated_equilibrate_wet_radii(relative_humidity, n_sd=1000):
+        # arrange
+        rng = np.random.default_rng(seed=44)
+        builder = Builder(
+            environment=Box(dv=np.nan, dt=np.nan), backend=CPU(), n_sd=n_sd
+        )
+        builder.particulator.environment["T"] = 280 * si.K
+        builder.particulator.environment["RH"] = relative_humidity
+        r_dry = np.exp(rng.uniform(np.log(10 * si.nm), np.log(1 * si.um), n_sd))
+        kappa_times_dry_volume = rng.uniform(
+            0.1, 1.2, n_sd
+        ) * builder.particulator.formulae.trivia.volume(r_dry)
+        table_rtol = 1e-3
+
+        # act
+        r_wet = {
+            tabulated: equilibrate_wet_radii(
+                r_dry=r_dry,
+                environment=builder.particulator.environment,
+                kappa_times_dry_volume=kappa_times_dry_volume,
+                tabulated=tabulated,
+                table_rtol=table_rtol,
+            )
+            for tabulated in (False, True)
+        }
+
+        # assert
+        np.testing.assert_allclose(r_wet[True], r_wet[False], rtol=2 * table_rtol)
@@ -29,6 +29,7 @@ from PySDM.products import (
     ParticleSizeSpectrumPerMassOfDryAir,
     ParticleSizeSpectrumPerVolume,
     ParticleVolumeVersusRadiusLogarithmSpectrum,
+    ProfiledWallTime,
     RadiusBinnedNumberAveragedTerminalVelocity,
     RadiusStandardDeviation,
     TotalDryMassMixingRatio,
@@ -44,6 +45,7 @@ _ARGUMENTS = {
     GaseousMoleFraction: {"key": "O3"},
     FreezableSpecificConcentration: {"temperature_bins_edges": (0, 300)},
     DynamicWallTime: {"dynamic": "Condensation"},
+    ProfiledWallTime: {"method": "sort_by_key"},
     ParticleSizeSpectrumPerVolume: {"radius_bins_edges": (0, np.inf)},
     ParticleVolumeVersusRadiusLogarithmSpectrum: {"radius_bins_edges": (0, np.inf)},
     RadiusBinnedNumberAveragedTerminalVelocity: {"radius_bin_edges": (0, np.inf)},
@@ -0,0 +1,123 @@
+"""tests of the product-evaluation planner sharing moment computations among products"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import (
+    CloudWaterContent,
+    EffectiveRadius,
+    MeanRadius,
+    ParticleConcentration,
+    ParticleSizeSpectrumPerVolume,
+    TotalParticleConcentration,
+    WaterMixingRatio,
+)
+
+N_SD = 64
+
+
+def _make_particulator(backend, shared_product_moments):
+    rng = np.random.default_rng(seed=44)
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend,
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    return builder.build(
+        attributes={
+            "water mass": builder.formulae.particle_shape_and_density.radius_to_mass(
+                rng.uniform(0.1 * si.um, 20 * si.um, size=N_SD)
+            ),
+            "multiplicity": rng.integers(1, 1000, size=N_SD),
+        },
+        products=(
+            CloudWaterContent(),
+            EffectiveRadius(radius_range=(1 * si.um, np.inf)),
+            MeanRadius(),
+            ParticleConcentration(radius_range=(1 * si.um, np.inf)),
+            ParticleSizeSpectrumPerVolume(
+                radius_bins_edges=np.logspace(-7, -4.5, 10), name="spectrum"
+            ),
+            ParticleSizeSpectrumPerVolume(
+                radius_bins_edges=np.logspace(-7, -4.5, 10), name="spectrum copy"
+            ),
+            TotalParticleConcentration(),
+            WaterMixingRatio(),
+        ),
+        shared_product_moments=shared_product_moments,
+    )
+
+
+class TestMomentsPlanner:
+    @staticmethod
+    def test_same_results_as_without_planner(backend_instance):
+        # arrange
+        reference = _make_particulator(backend_instance, shared_product_moments=False)
+        sut = _make_particulator(backend_instance, shared_product_moments=True)
+        for particulator in (reference, sut):
+            particulator.environment["rhod"] = 1 * si.kg / si.m**3
+
+        # act
+        for _ in range(2):
+            expected = {k: p.get().copy() for k, p in reference.products.items()}
+            actual = {k: p.get().copy() for k, p in sut.products.items()}
+
+            # assert
+            for key, value in expected.items():
+                np.testing.assert_array_equal(actual[key], value)
+
+    @staticmethod
+    def test_number_of_passes():
+        # arrange
+        sut = _make_particulator(CPU(), shared_product_moments=True)
+        sut.environment["rhod"] = 1 * si.kg / si.m**3
+        calls = {"moments": 0, "spectrum_moments": 0}
+
+        for method in calls:
+
+            def counting_wrapper(*, _method=method, _impl=getattr(sut, method), **kw):
+                calls[_method] += 1
+                _impl(**kw)
+
+            setattr(sut, method, counting_wrapper)
+
+        for product in sut.products.values():
+            product.get()
+        for method in calls:
+            calls[method] = 0
+
+        # act
+        sut.n_steps += 1
+        for product in sut.products.values():
+            product.get()
+
+        # assert
+        assert calls == {"moments": 6, "spectrum_moments": 1}
+
+    @staticmethod
+    @pytest.mark.parametrize("skip_division_by_m0", (True, False))
+    def test_recomputed_after_attribute_update(skip_division_by_m0):
+        # arrange
+        sut = _make_particulator(CPU(), shared_product_moments=True)
+        kwargs = {
+            "attr": "water mass",
+            "rank": 1,
+            "filter_attr": "signed water mass",
+            "filter_range": (-np.inf, np.inf),
+            "weighting_attribute": "water mass",
+            "weighting_rank": 0,
+            "skip_division_by_m0": skip_division_by_m0,
+        }
+        before = sut.moments_planner.moment(**kwargs)
+
+        # act
+        sut.attributes["signed water mass"].data[:] *= 2
+        sut.attributes.mark_updated("signed water mass")
+        after = sut.moments_planner.moment(**kwargs)
+
+        # assert
+        np.testing.assert_allclose(after, 2 * before)
@@ -4,7 +4,7 @@ from collections import namedtuple
 import numpy as np
 import pytest
 
-from PySDM import formulae, Formulae
+from PySDM import formulae, Formulae, physics
 from PySDM.physics import si
 
 DUMMY_CONSTANTS = namedtuple(typename="constants", field_names=("PI", "ZERO"))(
@@ -183,3 +183,124 @@ class TestFormulae:
 
         # assert
         assert sut.seed == seed
+
+    @staticmethod
+    def test_jit_cache_dir(tmp_path):
+        # arrange
+        temperature = 300 * si.K
+        sut = Formulae(jit_cache_dir=str(tmp_path))
+        expected = Formulae().saturation_vapour_pressure.pvs_water(temperature)
+
+        # act
+        actual = sut.saturation_vapour_pressure.pvs_water(temperature)
+        recompiled = formulae._formula(  # pylint: disable=protected-access
+            physics.saturation_vapour_pressure.FlatauWalkoCotton.pvs_water,
+            constants=sut.constants,
+            dimensional_analysis=False,
+            jit_cache_dir=str(tmp_path),
+            fastmath=sut.fastmath,
+        )
+
+        # assert
+        assert actual == expected
+        assert any(path.suffix == ".py" for path in tmp_path.iterdir())
+        assert recompiled(temperature) == expected
+        assert sum(recompiled.stats.cache_hits.values()) == 1
+
+    @staticmethod
+    def test_jit_cache_dir_distinguishes_helpers_by_source(tmp_path):
+        # arrange
+        def helper():
+            return 1
+
+        original = helper
+
+        def helper():  # pylint: disable=function-redefined
+            return 2
+
+        # act
+        modules = [
+            formulae._cached_source_module(  # pylint: disable=protected-access
+                source="class _:\n    pass\n",
+                global_vars={"const": DUMMY_CONSTANTS, "helper": function},
+                jit_flags={},
+                jit_cache_dir=str(tmp_path),
+            )
+            for function in (original, helper)
+        ]
+
+        # assert
+        assert original.__qualname__ == helper.__qualname__
+        assert modules[0] is not modules[1]
+
+    @staticmethod
+    def test_tabulated_single_argument_formula():
+        # arrange
+        rtol = 1e-7
+        temperatures = np.linspace(250, 300, 1234) * si.K
+        name = "saturation_vapour_pressure__pvs_water"
+        analytic = Formulae(saturation_vapour_pressure="FlatauWalkoCotton")
+        sut = Formulae(
+            saturation_vapour_pressure="FlatauWalkoCotton",
+            tabulated={name: ((240 * si.K, 310 * si.K),)},
+            tabulation_rtol=rtol,
+        )
+
+        # act
+        actual = np.asarray(
+            [sut.saturation_vapour_pressure.pvs_water(T) for T in temperatures]
+        )
+        outside = sut.flatten.saturation_vapour_pressure__pvs_water(320 * si.K)
+
+        # assert
+        expected = np.asarray(
+            [analytic.saturation_vapour_pressure.pvs_water(T) for T in temperatures]
+        )
+        assert 0 < sut.tabulation_errors[name] <= rtol
+        np.testing.assert_allclose(actual, expected, rtol=rtol)
+        assert outside == analytic.saturation_vapour_pressure.pvs_water(320 * si.K)
+        assert not analytic.tabulation_errors
+
+    @staticmethod
+    def test_tabulated_two_argument_formula():
+        # arrange
+        rtol = 1e-5
+        name = "diffusion_thermics__D"
+        analytic = Formulae(diffusion_thermics="TracyWelchPorter")
+        sut = Formulae(
+            diffusion_thermics="TracyWelchPorter",
+            tabulated={name: ((230 * si.K, 310 * si.K), (500 * si.hPa, 1050 * si.hPa))},
+            tabulation_rtol=rtol,
+        )
+
+        # act
+        actual = sut.diffusion_thermics.D(T=273.16 * si.K, p=876.5 * si.hPa)
+
+        # assert
+        assert sut.tabulation_errors[name] <= rtol
+        np.testing.assert_allclose(
+            actual,
+            analytic.diffusion_thermics.D(T=273.16 * si.K, p=876.5 * si.hPa),
+            rtol=rtol,
+        )
+
+    @staticmethod
+    def test_tabulated_formula_does_not_affect_other_instances():
+        # arrange
+        name = "saturation_vapour_pressure__pvs_water"
+        default = Formulae().saturation_vapour_pressure
+
+        # act
+        sut = Formulae(tabulated={name: ((250 * si.K, 300 * si.K),)})
+
+        # assert
+        assert sut.saturation_vapour_pressure.pvs_water is not default.pvs_water
+        assert Formulae().saturation_vapour_pressure.pvs_water is default.pvs_water
+        assert sut.saturation_vapour_pressure.__name__ == default.__name__
+
+    @staticmethod
+    def test_tabulated_formula_ranges_must_match_arguments():
+        with pytest.raises(ValueError):
+            Formulae(
+                tabulated={"saturation_vapour_pressure__pvs_water": ((1, 2), (3, 4))}
+            )
@@ -65,47 +65,30 @@ class TestParticulator:
         class ParticleAttributes:
             def __init__(self):
                 self.updated = []
-                self.super_droplet_count = -1
-                self.__idx = storage  # pylint: disable=unused-private-member
-                self.idx_reset = False
-                self.sane = False
-
-            def get_extensive_attribute_storage(self):
-                return storage
+                self.vacant_slot_count = 1
+                self.injected = False
 
             def get_extensive_attribute_keys(self):
                 return abc
 
-            def __getitem__(self, item):
-                return storage
-
             def mark_updated(self, attr):
                 self.updated += [attr]
 
-            def reset_idx(self):
-                self.idx_reset = True
-
-            def sanitize(self):
-                self.sane = True
+            def inject(
+                self,
+                *,
+                seeded_particle_index,  # pylint: disable=unused-argument
+                seeded_particle_multiplicity,  # pylint: disable=unused-argument
+                seeded_particle_extensive_attributes,  # pylint: disable=unused-argument
+                number_of_super_particles_to_inject,  # pylint: disable=unused-argument
+            ):
+                self.injected = True
 
         class DP(DummyParticulator):
             pass
 
         particulator = DP(backend_class, 44)
         particulator.attributes = ParticleAttributes()
-        # fmt: off
-        particulator.backend.seeding = (
-            lambda
-                idx,
-                multiplicity,
-                extensive_attributes,
-                seeded_particle_index,
-                seeded_particle_multiplicity,
-                seeded_particle_extensive_attributes,
-                number_of_super_particles_to_inject:
-            None
-        )
-        # fmt: on
 
         # act
         particulator.seeding(
@@ -117,8 +100,7 @@ class TestParticulator:
 
         # assert
         assert particulator.attributes.updated == ["multiplicity"] + abc
-        assert particulator.attributes.idx_reset
-        assert particulator.attributes.sane
+        assert particulator.attributes.injected
 
     @staticmethod
     def test_seeding_fails_if_no_null_super_droplets_availale(backend_class):
@@ -129,8 +111,8 @@ class TestParticulator:
         storage = backend_class().Storage.empty(1, dtype=int)
 
         particulator.attributes = namedtuple(
-            typename="_", field_names=("super_droplet_count",)
-        )(super_droplet_count=a_number)
+            typename="_", field_names=("vacant_slot_count",)
+        )(vacant_slot_count=0)
 
         # act
         with pytest.raises(ValueError, match="No available seeds to inject"):